@@ -0,0 +1,627 @@
+import contextlib
+import json
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Iterator, Union
+import pandas as pd
+# github imports
+from github.MainClass import Github
+# github2pandas imports
+from github2pandas.connection import Connection, ConnectionHook, Request, Response
+from github2pandas.rate_limit import RateLimitScheduler
+
+class EndpointMetrics():
+    """
+    Metrics of the requests of one endpoint.
+
+    Attributes
+    ----------
+    LATENCY_BUCKETS : tuple
+        Upper bounds in seconds of the latency histogram buckets. The last bucket has no upper bound.
+    requests : int
+        Number of requests.
+    errors : int
+        Number of responses with an error status.
+    cache_hits : int
+        Number of requests answered with 304 Not Modified, e.g. by the http cache.
+    rate_limit_requests : int
+        Number of requests which count against a rate limit.
+    bytes : int
+        Number of received body bytes. Cache hits receive no body.
+    latency : float
+        Total latency of all requests in seconds.
+    max_latency : float
+        Maximum latency of a request in seconds.
+    histogram : list
+        Number of requests per latency bucket.
+
+    Methods
+    -------
+    __init__(self)
+        Initializes empty metrics.
+    add_request(self, latency, status, size, cache_hit, rate_limited)
+        Adds one request.
+    to_dict(self)
+        Returns the metrics as dictionary.
+
+    """
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self) -> None:
+        """
+        __init__(self)
+
+        Initializes empty metrics.
+
+        """
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.rate_limit_requests = 0
+        self.bytes = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+        self.histogram = [0] * (len(EndpointMetrics.LATENCY_BUCKETS) + 1)
+
+    def add_request(self, latency: float, status: int, size: int, cache_hit: bool, rate_limited: bool) -> None:
+        """
+        add_request(self, latency, status, size, cache_hit, rate_limited)
+
+        Adds one request.
+
+        Parameters
+        ----------
+        latency : float
+            Seconds between sending the request and receiving the response.
+        status : int
+            HTTP status code.
+        size : int
+            Number of received body bytes.
+        cache_hit : bool
+            Was the request answered with 304 Not Modified?
+        rate_limited : bool
+            Does the request count against a rate limit?
+
+        """
+        self.requests += 1
+        if status >= 400:
+            self.errors += 1
+        if cache_hit:
+            self.cache_hits += 1
+        if rate_limited:
+            self.rate_limit_requests += 1
+        self.bytes += size
+        self.latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        bucket = 0
+        while bucket < len(EndpointMetrics.LATENCY_BUCKETS) and latency > EndpointMetrics.LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+
+    def to_dict(self) -> dict:
+        """
+        to_dict(self)
+
+        Returns the metrics as dictionary. The histogram buckets are named by their upper bound.
+
+        Returns
+        -------
+        dict
+            Dictionary with the metrics.
+
+        """
+        bucket_names = [f"<={bound}s" for bound in EndpointMetrics.LATENCY_BUCKETS] + [f">{EndpointMetrics.LATENCY_BUCKETS[-1]}s"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "rate_limit_requests": self.rate_limit_requests,
+            "bytes": self.bytes,
+            "latency": self.latency,
+            "mean_latency": self.latency / self.requests if self.requests > 0 else 0.0,
+            "max_latency": self.max_latency,
+            "histogram": dict(zip(bucket_names, self.histogram))
+        }
+
+class MetricsSummary():
+    """
+    Summary of the requests of one extraction module, e.g. of one generate_*_pandas_tables call.
+
+    Attributes
+    ----------
+    module : str
+        Name of the extraction module, e.g. Issues.
+    endpoints : dict
+        Dictionary with the endpoint as key and EndpointMetrics as value.
+    duration : float
+        Seconds of the measured calls.
+    sleep_time : float
+        Seconds which the rate limit scheduler slept during the measured calls.
+
+    Methods
+    -------
+    __init__(self, module)
+        Initializes an empty summary.
+    get_requests(self)
+        Returns the number of requests of all endpoints.
+    get_bytes(self)
+        Returns the number of received bytes of all endpoints.
+    to_dict(self)
+        Returns the summary as dictionary.
+    to_json(self, file=None)
+        Returns the summary as JSON and writes it to a file.
+
+    """
+
+    def __init__(self, module: str) -> None:
+        """
+        __init__(self, module)
+
+        Initializes an empty summary.
+
+        Parameters
+        ----------
+        module : str
+            Name of the extraction module.
+
+        """
+        self.module = module
+        self.endpoints = {}
+        self.duration = 0.0
+        self.sleep_time = 0.0
+
+    def get_requests(self) -> int:
+        """
+        get_requests(self)
+
+        Returns the number of requests of all endpoints.
+
+        Returns
+        -------
+        int
+            Number of requests.
+
+        """
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    def get_bytes(self) -> int:
+        """
+        get_bytes(self)
+
+        Returns the number of received bytes of all endpoints.
+
+        Returns
+        -------
+        int
+            Number of received bytes.
+
+        """
+        return sum(metrics.bytes for metrics in self.endpoints.values())
+
+    def to_dict(self) -> dict:
+        """
+        to_dict(self)
+
+        Returns the summary as dictionary.
+
+        Returns
+        -------
+        dict
+            Dictionary with the totals and the metrics per endpoint.
+
+        """
+        return {
+            "module": self.module,
+            "requests": self.get_requests(),
+            "bytes": self.get_bytes(),
+            "duration": self.duration,
+            "sleep_time": self.sleep_time,
+            "endpoints": {endpoint: metrics.to_dict() for endpoint, metrics in sorted(self.endpoints.items())}
+        }
+
+    def to_json(self, file: Path = None) -> str:
+        """
+        to_json(self, file=None)
+
+        Returns the summary as JSON and writes it to a file.
+
+        Parameters
+        ----------
+        file : Path, default=None
+            Path of the JSON file. The summary is not written if None.
+
+        Returns
+        -------
+        str
+            Summary as JSON.
+
+        """
+        return ApiMetrics.dump_json(self.to_dict(), file)
+
+class ApiMetrics(ConnectionHook):
+    """
+    Connection hook which records the requests of a Github object per extraction module and endpoint.
+
+    Requests are attributed to the innermost module which is measured by measure and to "other" outside
+    of a measurement. Endpoints are the request paths with placeholders for owners, repositories, numbers
+    and commit shas, e.g. "GET /repos/{owner}/{repo}/issues/{number}/events". The latency is measured
+    from the end of the rate limit scheduling until the response, so waiting for the rate limit is
+    recorded as sleep time of the module instead.
+
+    With profile_fields every request is also attributed to the extractor function of github2pandas and the field
+    which triggered it. Requests which complete a partial PyGithub object are attributed to the lazy attribute,
+    e.g. NamedUser.name in Core.extract_user_data, all other requests to their endpoint.
+
+    Attributes
+    ----------
+    OTHER_MODULE : str
+        Module of the requests outside of a measurement.
+    rate_limit_scheduler : RateLimitScheduler
+        Scheduler of the connection, the source of the sleep times.
+    modules : dict
+        Dictionary with the module as key and the summary of all its measurements as value.
+    profile_fields : bool
+        Are the requests attributed to extractor fields? The call stack is inspected for every request.
+    fields : dict
+        Dictionary with the extractor and the field as key and EndpointMetrics as value.
+
+    Methods
+    -------
+    install(github_connection)
+        Returns the metrics hook of a Github object and installs one if necessary.
+    __init__(self, rate_limit_scheduler=None)
+        Initializes the metrics hook.
+    get_endpoint(verb, url)
+        Returns the endpoint of a request.
+    get_field(endpoint)
+        Returns the extractor and the field which triggered the current request.
+    before_request(self, request)
+        Records the send time of a request.
+    observe_response(self, request, response)
+        Records the response of a request.
+    measure(self, module)
+        Context manager which records the requests of a module in a new summary.
+    to_dict(self)
+        Returns the summaries of all modules as dictionary.
+    to_json(self, file=None)
+        Returns the summaries of all modules as JSON and writes them to a file.
+    get_field_report(self)
+        Returns the profiled fields sorted by their number of requests.
+    reset(self)
+        Removes all recorded requests.
+    dump_json(data, file=None)
+        Returns data as JSON and writes it to a file.
+
+    """
+    OTHER_MODULE = "other"
+    __install_lock = threading.Lock()
+    __NUMBER = re.compile(r"^\d+$")
+    __SHA = re.compile(r"^[0-9a-f]{40}$")
+    __PLACEHOLDERS = {"repos": ["{owner}", "{repo}"], "users": ["{user}"], "orgs": ["{org}"]}
+    # modules and Core methods which only send requests on behalf of an extractor
+    __TRANSPORT_MODULES = ["github2pandas.api_metrics", "github2pandas.cassette", "github2pandas.connection",
+        "github2pandas.http_cache", "github2pandas.progress", "github2pandas.rate_limit"]
+    __TRANSPORT_FUNCTIONS = ["save_api_call", "save_graphql_call", "get_save_total_count", "get_save_api_data", "get_save_page",
+        "get_save_pages", "get_concurrent_pages", "get_save_items", "progress_bar"]
+
+    @staticmethod
+    def install(github_connection: Github) -> "ApiMetrics":
+        """
+        install(github_connection)
+
+        Returns the metrics hook of a Github object and installs one if necessary.
+        All objects using the same Github object share the metrics.
+
+        Parameters
+        ----------
+        github_connection : Github
+            Github object from pygithub.
+
+        Returns
+        -------
+        ApiMetrics
+            Metrics of the Github object.
+
+        """
+        connection = Connection.install(github_connection)
+        with ApiMetrics.__install_lock:
+            api_metrics = connection.get_hook(ApiMetrics)
+            if api_metrics is None:
+                api_metrics = connection.add_hook(ApiMetrics())
+            if api_metrics.rate_limit_scheduler is None:
+                api_metrics.rate_limit_scheduler = connection.get_hook(RateLimitScheduler)
+        return api_metrics
+
+    def __init__(self, rate_limit_scheduler: RateLimitScheduler = None) -> None:
+        """
+        __init__(self, rate_limit_scheduler=None)
+
+        Initializes the metrics hook.
+
+        Parameters
+        ----------
+        rate_limit_scheduler : RateLimitScheduler, default=None
+            Scheduler of the connection. No sleep time is recorded if None.
+
+        """
+        self.rate_limit_scheduler = rate_limit_scheduler
+        self.modules = {}
+        self.profile_fields = False
+        self.fields = {}
+        self.__lock = threading.Lock()
+        self.__active_summaries = []
+
+    @staticmethod
+    def get_endpoint(verb: str, url: str) -> str:
+        """
+        get_endpoint(verb, url)
+
+        Returns the endpoint of a request. The query, owners, repositories, users, organizations, numbers and commit shas are replaced.
+
+        Parameters
+        ----------
+        verb : str
+            HTTP method.
+        url : str
+            Url or path and query of the request.
+
+        Returns
+        -------
+        str
+            Endpoint, e.g. "GET /repos/{owner}/{repo}/issues/{number}".
+
+        """
+        parts = [part for part in urllib.parse.urlparse(url).path.split("/") if part]
+        for index, part in enumerate(parts):
+            if ApiMetrics.__NUMBER.match(part):
+                parts[index] = "{number}"
+            elif ApiMetrics.__SHA.match(part):
+                parts[index] = "{sha}"
+        for name, placeholders in ApiMetrics.__PLACEHOLDERS.items():
+            if name in parts:
+                index = parts.index(name) + 1
+                parts[index:index + len(placeholders)] = placeholders[:len(parts) - index]
+                break
+        return f"{verb} /{'/'.join(parts)}"
+
+    @staticmethod
+    def get_field(endpoint: str) -> tuple:
+        """
+        get_field(endpoint)
+
+        Returns the extractor and the field which triggered the current request by inspecting the call stack.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint of the request, the field of requests which do not complete an object.
+
+        Returns
+        -------
+        tuple
+            Extractor, e.g. "core.extract_user_data" or "other" outside of github2pandas, and field, e.g. "NamedUser.name".
+
+        """
+        field = None
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            module = frame.f_globals.get("__name__", "")
+            if code.co_name == "_completeIfNeeded" and field is None:
+                # property -> _completeIfNotSet -> _completeIfNeeded
+                caller = frame.f_back
+                if caller is not None and caller.f_code.co_name == "_completeIfNotSet":
+                    caller = caller.f_back
+                github_object = frame.f_locals.get("self")
+                if caller is not None:
+                    field = f"{type(github_object).__name__}.{caller.f_code.co_name}"
+            elif module.startswith("github2pandas.") and module not in ApiMetrics.__TRANSPORT_MODULES and code.co_name not in ApiMetrics.__TRANSPORT_FUNCTIONS:
+                return f"{module.split('.')[-1]}.{code.co_name}", field or endpoint
+            frame = frame.f_back
+        return ApiMetrics.OTHER_MODULE, field or endpoint
+
+    def before_request(self, request: Request) -> Union[Response, None]:
+        """
+        before_request(self, request)
+
+        Records the send time of a request.
+
+        Parameters
+        ----------
+        request : Request
+            Request to send.
+
+        Returns
+        -------
+        None
+            The request is always sent.
+
+        """
+        request.send_time = time.perf_counter()
+        return None
+
+    def observe_response(self, request: Request, response: Response) -> None:
+        """
+        observe_response(self, request, response)
+
+        Records the response of a request for its module and all active summaries. Responses which are
+        sent again, e.g. after a rate limit, are recorded as separate requests.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        """
+        latency = time.perf_counter() - getattr(request, "send_time", time.perf_counter())
+        endpoint = ApiMetrics.get_endpoint(request.verb, request.url)
+        # responses are observed before the http cache replaces 304 responses by cached responses
+        cache_hit = response.status == 304
+        size = 0
+        if not cache_hit:
+            body = response.read()
+            size = len(body.encode("utf-8")) if isinstance(body, str) else len(body or b"")
+        rate_limited = not cache_hit and RateLimitScheduler.get_resource(request.url) != "rate_limit"
+        field = ApiMetrics.get_field(endpoint) if self.profile_fields else None
+        with self.__lock:
+            if self.__active_summaries:
+                module = self.__active_summaries[-1].module
+            else:
+                module = ApiMetrics.OTHER_MODULE
+            summaries = [self.modules.setdefault(module, MetricsSummary(module))] + self.__active_summaries
+            for summary in summaries:
+                summary.endpoints.setdefault(endpoint, EndpointMetrics()).add_request(latency, response.status, size, cache_hit, rate_limited)
+            if field is not None:
+                self.fields.setdefault(field, EndpointMetrics()).add_request(latency, response.status, size, cache_hit, rate_limited)
+
+    @contextlib.contextmanager
+    def measure(self, module: str) -> Iterator[MetricsSummary]:
+        """
+        measure(self, module)
+
+        Context manager which records the requests of a module in a new summary. The summary is added to the
+        summary of the module in modules afterwards. Measurements may be nested.
+
+        Parameters
+        ----------
+        module : str
+            Name of the extraction module.
+
+        Yields
+        ------
+        MetricsSummary
+            Summary of the requests during the measurement.
+
+        """
+        summary = MetricsSummary(module)
+        start_time = time.perf_counter()
+        start_sleep_time = self.__get_sleep_time()
+        with self.__lock:
+            self.__active_summaries.append(summary)
+        try:
+            yield summary
+        finally:
+            summary.duration = time.perf_counter() - start_time
+            summary.sleep_time = self.__get_sleep_time() - start_sleep_time
+            with self.__lock:
+                self.__active_summaries.remove(summary)
+                module_summary = self.modules.setdefault(module, MetricsSummary(module))
+                module_summary.duration += summary.duration
+                module_summary.sleep_time += summary.sleep_time
+
+    def to_dict(self) -> dict:
+        """
+        to_dict(self)
+
+        Returns the summaries of all modules as dictionary.
+
+        Returns
+        -------
+        dict
+            Dictionary with the module as key and the summary as dictionary as value.
+
+        """
+        with self.__lock:
+            return {module: summary.to_dict() for module, summary in sorted(self.modules.items())}
+
+    def to_json(self, file: Path = None) -> str:
+        """
+        to_json(self, file=None)
+
+        Returns the summaries of all modules as JSON and writes them to a file.
+
+        Parameters
+        ----------
+        file : Path, default=None
+            Path of the JSON file. The summaries are not written if None.
+
+        Returns
+        -------
+        str
+            Summaries as JSON.
+
+        """
+        return ApiMetrics.dump_json(self.to_dict(), file)
+
+    def get_field_report(self) -> pd.DataFrame:
+        """
+        get_field_report(self)
+
+        Returns the profiled fields sorted by their number of requests, the costliest fields first.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with the columns extractor, field, requests, rate_limit_requests, bytes and latency.
+
+        """
+        with self.__lock:
+            rows = [{
+                "extractor": extractor,
+                "field": field,
+                "requests": metrics.requests,
+                "rate_limit_requests": metrics.rate_limit_requests,
+                "bytes": metrics.bytes,
+                "latency": metrics.latency
+            } for (extractor, field), metrics in self.fields.items()]
+        report_df = pd.DataFrame(rows, columns=["extractor", "field", "requests", "rate_limit_requests", "bytes", "latency"])
+        return report_df.sort_values(["requests", "latency"], ascending=False, kind="stable", ignore_index=True)
+
+    def reset(self) -> None:
+        """
+        reset(self)
+
+        Removes all recorded requests and profiled fields. Active measurements are continued.
+
+        """
+        with self.__lock:
+            self.modules = {}
+            self.fields = {}
+
+    @staticmethod
+    def dump_json(data: dict, file: Path = None) -> str:
+        """
+        dump_json(data, file=None)
+
+        Returns data as JSON and writes it to a file.
+
+        Parameters
+        ----------
+        data : dict
+            Data to dump.
+        file : Path, default=None
+            Path of the JSON file. The data is not written if None.
+
+        Returns
+        -------
+        str
+            Data as JSON.
+
+        """
+        text = json.dumps(data, indent=4)
+        if file is not None:
+            with open(file, "w") as f:
+                f.write(text)
+        return text
+
+    def __get_sleep_time(self) -> float:
+        """
+        __get_sleep_time(self)
+
+        Returns the total sleep time of the rate limit scheduler.
+
+        Returns
+        -------
+        float
+            Seconds slept by the scheduler or 0 without scheduler.
+
+        """
+        if self.rate_limit_scheduler is None:
+            return 0.0
+        return self.rate_limit_scheduler.sleep_time
@@ -0,0 +1,543 @@
+import gzip
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Union
+# github imports
+from github.MainClass import Github
+# github2pandas imports
+from github2pandas.connection import Connection, ConnectionHook, Request, Response
+
+class Cassette():
+    """
+    Class that holds recorded requests and responses of the GitHub api.
+
+    A cassette is stored as json file with the origin of the recorded api and a list of interactions.
+    Every interaction contains verb, url, status, headers and body of one request. Archives of an
+    ArchiveRecorder are loaded as cassettes, too.
+
+    Attributes
+    ----------
+    origin : str
+        Protocol, host and port of the recorded api, e.g. https://api.github.com.
+    interactions : list
+        List of dictionaries with verb, url, status, headers and body.
+    metadata : dict
+        Additional information about the recording, e.g. the page size.
+
+    Methods
+    -------
+    __init__(self, origin="https://api.github.com", interactions=None, metadata=None)
+        Initializes the cassette.
+    load(cassette_file)
+        Loads a cassette from a json file or an archive.
+    save(self, cassette_file)
+        Saves the cassette to a json file.
+    get_key(verb, url)
+        Returns the key of a request, independent of the order of the query parameters.
+
+    """
+    def __init__(self, origin: str = "https://api.github.com", interactions: list = None, metadata: dict = None) -> None:
+        """
+        __init__(self, origin="https://api.github.com", interactions=None, metadata=None)
+
+        Initializes the cassette.
+
+        Parameters
+        ----------
+        origin : str, default="https://api.github.com"
+            Protocol, host and port of the recorded api.
+        interactions : list, default=None
+            List of dictionaries with verb, url, status, headers and body.
+        metadata : dict, default=None
+            Additional information about the recording.
+
+        """
+        self.origin = origin
+        self.interactions = interactions if interactions is not None else []
+        self.metadata = metadata if metadata is not None else {}
+
+    @staticmethod
+    def load(cassette_file: Path) -> "Cassette":
+        """
+        load(cassette_file)
+
+        Loads a cassette from a json file or an archive of an ArchiveRecorder.
+
+        Parameters
+        ----------
+        cassette_file : Path
+            Path to the cassette or the archive.
+
+        Returns
+        -------
+        Cassette
+            The loaded cassette.
+
+        """
+        if Path(cassette_file).name.endswith(ArchiveRecorder.SUFFIX):
+            return ArchiveRecorder.load(cassette_file)
+        with open(cassette_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return Cassette(data["origin"], data["interactions"], data.get("metadata"))
+
+    def save(self, cassette_file: Path) -> None:
+        """
+        save(self, cassette_file)
+
+        Saves the cassette to a json file.
+
+        Parameters
+        ----------
+        cassette_file : Path
+            Path to the cassette.
+
+        """
+        Path(cassette_file).parent.mkdir(parents=True, exist_ok=True)
+        data = {"origin": self.origin, "interactions": self.interactions}
+        if self.metadata:
+            data["metadata"] = self.metadata
+        with open(cassette_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+
+    @staticmethod
+    def get_key(verb: str, url: str) -> str:
+        """
+        get_key(verb, url)
+
+        Returns the key of a request, independent of the order of the query parameters.
+
+        Parameters
+        ----------
+        verb : str
+            HTTP method.
+        url : str
+            Path and query of the request.
+
+        Returns
+        -------
+        str
+            Key of the request.
+
+        """
+        o = urllib.parse.urlparse(url)
+        query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(o.query, keep_blank_values=True)))
+        return f"{verb.upper()} {o.path}?{query}"
+
+class CassetteRecorder(ConnectionHook):
+    """
+    Connection hook which records all responses of a Github object into a cassette.
+
+    Attributes
+    ----------
+    cassette : Cassette
+        Cassette with the recorded interactions.
+
+    Methods
+    -------
+    install(github_connection)
+        Installs a new recorder in the connection of a Github object.
+    __init__(self, origin)
+        Initializes the recorder.
+    after_response(self, request, response)
+        Records the response.
+    save(self, cassette_file)
+        Saves the recorded cassette.
+
+    """
+
+    @staticmethod
+    def install(github_connection: Github) -> "CassetteRecorder":
+        """
+        install(github_connection)
+
+        Installs a new recorder in the connection of a Github object. The recorder is called after
+        all hooks which were installed before, e.g. the recorder gets the cached response instead of 304.
+
+        Parameters
+        ----------
+        github_connection : Github
+            Github object from pygithub.
+
+        Returns
+        -------
+        CassetteRecorder
+            The installed recorder.
+
+        """
+        connection = Connection.install(github_connection)
+        origin = f"{connection.PROTOCOL}://{connection.host}"
+        if connection.port != (443 if connection.PROTOCOL == "https" else 80):
+            origin += f":{connection.port}"
+        return connection.add_hook(CassetteRecorder(origin))
+
+    def __init__(self, origin: str) -> None:
+        """
+        __init__(self, origin)
+
+        Initializes the recorder.
+
+        Parameters
+        ----------
+        origin : str
+            Protocol, host and port of the recorded api.
+
+        """
+        self.cassette = Cassette(origin)
+        self.__lock = threading.Lock()
+
+    def after_response(self, request: Request, response: Response) -> Union[Response, None]:
+        """
+        after_response(self, request, response)
+
+        Records the response.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        Returns
+        -------
+        Response
+            The received response.
+
+        """
+        interaction = {
+            "verb": request.verb,
+            "url": request.url,
+            "status": response.status,
+            "headers": {key.lower(): value for key, value in response.getheaders()},
+            "body": response.read()
+        }
+        with self.__lock:
+            self.cassette.interactions.append(interaction)
+        return response
+
+    def save(self, cassette_file: Path) -> None:
+        """
+        save(self, cassette_file)
+
+        Saves the recorded cassette.
+
+        Parameters
+        ----------
+        cassette_file : Path
+            Path to the cassette.
+
+        """
+        with self.__lock:
+            self.cassette.save(cassette_file)
+
+class ArchiveRecorder(ConnectionHook):
+    """
+    Connection hook which writes all responses of a Github object to a compressed archive.
+
+    The archive is a gzip compressed file with one json object per line. The first line contains the origin
+    and the metadata, every further line one interaction. Interactions are written when they are received,
+    so the memory usage does not grow with the archive. The rate limit headers are not archived, because they
+    are outdated when the archive is replayed.
+
+    Attributes
+    ----------
+    SUFFIX : str
+        Suffix of the archive files.
+    archive_file : Path
+        Path to the archive.
+    interaction_count : int
+        Number of archived interactions.
+
+    Methods
+    -------
+    install(github_connection, archive_file, metadata=None)
+        Installs a new archive recorder in the connection of a Github object.
+    __init__(self, archive_file, origin, metadata=None)
+        Initializes the recorder and starts the archive.
+    add_interaction(self, interaction)
+        Writes an interaction to the archive.
+    after_response(self, request, response)
+        Archives the response.
+    close(self)
+        Finishes the archive.
+    load(archive_file)
+        Loads an archive as cassette.
+
+    """
+    SUFFIX = ".jsonl.gz"
+
+    @staticmethod
+    def install(github_connection: Github, archive_file: Path, metadata: dict = None) -> "ArchiveRecorder":
+        """
+        install(github_connection, archive_file, metadata=None)
+
+        Installs a new archive recorder in the connection of a Github object. The recorder is called after
+        all hooks which were installed before, e.g. the recorder gets the cached response instead of 304.
+
+        Parameters
+        ----------
+        github_connection : Github
+            Github object from pygithub.
+        archive_file : Path
+            Path to the archive, an existing archive is replaced.
+        metadata : dict, default=None
+            Additional information about the recording.
+
+        Returns
+        -------
+        ArchiveRecorder
+            The installed recorder.
+
+        """
+        connection = Connection.install(github_connection)
+        origin = f"{connection.PROTOCOL}://{connection.host}"
+        if connection.port != (443 if connection.PROTOCOL == "https" else 80):
+            origin += f":{connection.port}"
+        return connection.add_hook(ArchiveRecorder(archive_file, origin, metadata))
+
+    def __init__(self, archive_file: Path, origin: str, metadata: dict = None) -> None:
+        """
+        __init__(self, archive_file, origin, metadata=None)
+
+        Initializes the recorder and starts the archive.
+
+        Parameters
+        ----------
+        archive_file : Path
+            Path to the archive, an existing archive is replaced.
+        origin : str
+            Protocol, host and port of the recorded api.
+        metadata : dict, default=None
+            Additional information about the recording.
+
+        """
+        self.archive_file = Path(archive_file)
+        self.interaction_count = 0
+        self.__lock = threading.Lock()
+        self.archive_file.parent.mkdir(parents=True, exist_ok=True)
+        self.__file = gzip.open(self.archive_file, "wt", encoding="utf-8")
+        self.__file.write(json.dumps({"origin": origin, "metadata": metadata if metadata is not None else {}}) + "\n")
+
+    def add_interaction(self, interaction: dict) -> None:
+        """
+        add_interaction(self, interaction)
+
+        Writes an interaction to the archive. Interactions after close are ignored.
+
+        Parameters
+        ----------
+        interaction : dict
+            Dictionary with verb, url, status, headers and body.
+
+        """
+        line = json.dumps(interaction) + "\n"
+        with self.__lock:
+            if self.__file is None:
+                return
+            self.__file.write(line)
+            self.interaction_count += 1
+
+    def after_response(self, request: Request, response: Response) -> Union[Response, None]:
+        """
+        after_response(self, request, response)
+
+        Archives the response.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        Returns
+        -------
+        Response
+            The received response.
+
+        """
+        self.add_interaction({
+            "verb": request.verb,
+            "url": request.url,
+            "status": response.status,
+            "headers": {key.lower(): value for key, value in response.getheaders() if not key.lower().startswith("x-ratelimit")},
+            "body": response.read()
+        })
+        return response
+
+    def close(self) -> None:
+        """
+        close(self)
+
+        Finishes the archive.
+
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    @staticmethod
+    def load(archive_file: Path) -> Cassette:
+        """
+        load(archive_file)
+
+        Loads an archive as cassette.
+
+        Parameters
+        ----------
+        archive_file : Path
+            Path to the archive.
+
+        Returns
+        -------
+        Cassette
+            Cassette with the archived interactions.
+
+        """
+        with gzip.open(archive_file, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            interactions = [json.loads(line) for line in f if line.strip()]
+        return Cassette(header["origin"], interactions, header["metadata"])
+
+class ReplayServer():
+    """
+    Local http server which replays a cassette as stand-in for the GitHub api.
+
+    Recorded responses of the same request are replayed in the recorded order, the last one is repeated.
+    Urls of the recorded api in headers and bodies, e.g. the Link header for pagination, are replaced by
+    the url of the server. Unknown requests are answered with 404 Not Found.
+
+    Attributes
+    ----------
+    cassette : Cassette
+        The replayed cassette.
+    base_url : str
+        Url of the server, which is used as base_url of the Github object.
+    requests : list
+        Keys of all received requests.
+
+    Methods
+    -------
+    __init__(self, cassette, port=0)
+        Initializes the server.
+    start(self)
+        Starts the server in a background thread.
+    stop(self)
+        Stops the server.
+    get_response(self, verb, url)
+        Returns status, headers and body of the next recorded response of a request.
+
+    """
+    __REMOVED_HEADERS = ["content-encoding", "content-length", "transfer-encoding", "connection"]
+
+    def __init__(self, cassette: Union[Cassette, Path], port: int = 0) -> None:
+        """
+        __init__(self, cassette, port=0)
+
+        Initializes the server.
+
+        Parameters
+        ----------
+        cassette : Cassette or Path
+            Cassette or path to a cassette.
+        port : int, default=0
+            Port of the server, a free port is used if 0.
+
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        self.cassette = cassette
+        self.requests = []
+        self.__lock = threading.Lock()
+        self.__responses = {}
+        for interaction in cassette.interactions:
+            key = Cassette.get_key(interaction["verb"], interaction["url"])
+            self.__responses.setdefault(key, []).append(interaction)
+        self.__positions = {}
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def log_message(self, format, *args):
+                return
+            def handle_request(self):
+                length = int(self.headers.get("Content-Length", 0))
+                if length > 0:
+                    self.rfile.read(length)
+                status, headers, body = server.get_response(self.command, self.path)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = handle_request
+        self.__server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.__server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.__server.server_port}"
+        self.__thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        start(self)
+
+        Starts the server in a background thread.
+
+        """
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        stop(self)
+
+        Stops the server.
+
+        """
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def get_response(self, verb: str, url: str) -> tuple:
+        """
+        get_response(self, verb, url)
+
+        Returns status, headers and body of the next recorded response of a request.
+
+        Parameters
+        ----------
+        verb : str
+            HTTP method.
+        url : str
+            Path and query of the request.
+
+        Returns
+        -------
+        tuple
+            Status, headers and body with the urls of the server.
+
+        """
+        key = Cassette.get_key(verb, url)
+        with self.__lock:
+            self.requests.append(key)
+            interactions = self.__responses.get(key)
+            if interactions is None:
+                return 404, {"content-type": "application/json"}, json.dumps({"message": "Not Found"})
+            position = self.__positions.get(key, 0)
+            self.__positions[key] = min(position + 1, len(interactions) - 1)
+        interaction = interactions[position]
+        headers = {}
+        for header_key, value in interaction["headers"].items():
+            if header_key not in ReplayServer.__REMOVED_HEADERS:
+                headers[header_key] = value.replace(self.cassette.origin, self.base_url)
+        return interaction["status"], headers, interaction["body"].replace(self.cassette.origin, self.base_url)
@@ -0,0 +1,482 @@
+import threading
+import requests
+from typing import Union
+# github imports
+from github.MainClass import Github
+
+class Response():
+    """
+    Class that mimics the httplib response object expected by the requester of pygithub.
+
+    Attributes
+    ----------
+    status : int
+        HTTP status code.
+    headers : dict
+        Response headers.
+    text : str
+        Response body.
+
+    Methods
+    -------
+    __init__(self, status, headers, text)
+        Initializes the response.
+    getheaders(self)
+        Returns the response headers as items.
+    read(self)
+        Returns the response body.
+
+    """
+    def __init__(self, status: int, headers: dict, text: str) -> None:
+        """
+        __init__(self, status, headers, text)
+
+        Initializes the response.
+
+        Parameters
+        ----------
+        status : int
+            HTTP status code.
+        headers : dict
+            Response headers.
+        text : str
+            Response body.
+
+        """
+        self.status = status
+        self.headers = headers
+        self.text = text
+
+    def getheaders(self):
+        """
+        getheaders(self)
+
+        Returns the response headers as items.
+
+        Returns
+        -------
+        ItemsView
+            Items of the response headers.
+
+        """
+        return self.headers.items()
+
+    def read(self) -> str:
+        """
+        read(self)
+
+        Returns the response body.
+
+        Returns
+        -------
+        str
+            Response body.
+
+        """
+        return self.text
+
+class Request():
+    """
+    Class that holds one request of the requester of pygithub. Hooks may change the request.
+
+    Attributes
+    ----------
+    verb : str
+        HTTP method.
+    url : str
+        Path and query of the request.
+    input
+        Body of the request.
+    headers : dict
+        Request headers.
+
+    Methods
+    -------
+    __init__(self, verb, url, input, headers)
+        Initializes the request.
+
+    """
+    def __init__(self, verb: str, url: str, input, headers: dict) -> None:
+        """
+        __init__(self, verb, url, input, headers)
+
+        Initializes the request.
+
+        Parameters
+        ----------
+        verb : str
+            HTTP method.
+        url : str
+            Path and query of the request.
+        input
+            Body of the request.
+        headers : dict
+            Request headers.
+
+        """
+        self.verb = verb
+        self.url = url
+        self.input = input
+        self.headers = dict(headers) if headers is not None else {}
+
+class ConnectionHook():
+    """
+    A base class for hooks of a connection. Hooks are called by all threads and have to be thread-safe.
+
+    Methods
+    -------
+    before_request(self, request)
+        Is called before a request is sent.
+    observe_response(self, request, response)
+        Is called for every received response.
+    after_response(self, request, response)
+        Is called after a response is received.
+
+    """
+    def before_request(self, request: Request) -> Union[Response, None]:
+        """
+        before_request(self, request)
+
+        Is called before a request is sent. The request may be changed.
+
+        Parameters
+        ----------
+        request : Request
+            Request to send.
+
+        Returns
+        -------
+        Response or None
+            A response which is used instead of sending the request or None to send the request.
+
+        """
+        return None
+
+    def observe_response(self, request: Request, response: Response) -> None:
+        """
+        observe_response(self, request, response)
+
+        Is called for every received response before any after_response, also for responses which are
+        dropped by a hook and sent again. The response must not be changed.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        """
+        pass
+
+    def after_response(self, request: Request, response: Response) -> Union[Response, None]:
+        """
+        after_response(self, request, response)
+
+        Is called after a response is received.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        Returns
+        -------
+        Response or None
+            The response which is passed on, or None to send the request again.
+
+        """
+        return response
+
+class Connection():
+    """
+    Class that mimics the httplib connection object used by the requester of pygithub.
+
+    The requester of pygithub keeps one connection per Github object and stores the pending request
+    in the connection. This connection stores the pending request per thread and shares one requests
+    session with a connection pool, so that the same Github object can be used by several threads.
+    Hooks can change requests, answer requests and inspect or replace responses.
+
+    Attributes
+    ----------
+    PROTOCOL : str
+        Protocol of the connection.
+    host : str
+        Hostname of the GitHub api.
+    port : int
+        Port of the GitHub api.
+    timeout : int
+        Timeout of a request.
+    verify : bool
+        Verify the certificate of the host?
+    session : requests.Session
+        Session shared by all threads.
+    hooks : list
+        Hooks which are called for every request.
+
+    Methods
+    -------
+    install(github_connection)
+        Installs the thread-safe connection in the requester of a Github object and returns it.
+    __init__(self, host, port=None, strict=False, timeout=None, retry=None, pool_size=None, **kwargs)
+        Initializes the connection and the shared session.
+    add_hook(self, hook)
+        Adds a hook to the connection.
+    remove_hook(self, hook)
+        Removes a hook from the connection.
+    get_hook(self, hook_class)
+        Returns the first hook of a class.
+    request(self, verb, url, input, headers)
+        Stores the request of the current thread.
+    getresponse(self)
+        Sends the request of the current thread through all hooks and returns the response.
+    close(self)
+        Keeps the shared session open.
+
+    """
+    PROTOCOL = "https"
+
+    @staticmethod
+    def install(github_connection: Github) -> "Connection":
+        """
+        install(github_connection)
+
+        Installs the thread-safe connection in the requester of a Github object and returns it.
+        The installed connection is returned if the connection is already installed.
+
+        Parameters
+        ----------
+        github_connection : Github
+            Github object from pygithub.
+
+        Returns
+        -------
+        Connection
+            Connection of the Github object, which is used for all requests.
+
+        Notes
+        -----
+            The connection class is a private attribute of the pygithub requester: https://github.com/PyGithub/PyGithub/blob/main/github/Requester.py
+
+        """
+        requester = github_connection._Github__requester
+        connection = requester._Requester__connection
+        if isinstance(connection, Connection):
+            return connection
+        if requester._Requester__scheme == "http":
+            connection_class = HTTPConnection
+        else:
+            connection_class = HTTPSConnection
+        connection = connection_class(
+            requester._Requester__hostname,
+            requester._Requester__port,
+            timeout=requester._Requester__timeout,
+            retry=requester._Requester__retry,
+            pool_size=requester._Requester__pool_size,
+            verify=requester._Requester__verify
+        )
+        # the requester reuses its persistent connection for every request
+        requester._Requester__connectionClass = connection_class
+        requester._Requester__connection = connection
+        return connection
+
+    def __init__(self, host: str, port: int = None, strict: bool = False, timeout: int = None, retry=None, pool_size: int = None, **kwargs) -> None:
+        """
+        __init__(self, host, port=None, strict=False, timeout=None, retry=None, pool_size=None, **kwargs)
+
+        Initializes the connection and the shared session.
+
+        Parameters
+        ----------
+        host : str
+            Hostname of the GitHub api.
+        port : int, default=None
+            Port of the GitHub api. Default port of the protocol if None.
+        strict : bool, default=False
+            Unused, only for compatibility with httplib.
+        timeout : int, default=None
+            Timeout of a request.
+        retry : int or Retry, default=None
+            Retry strategy of the connection pool.
+        pool_size : int, default=None
+            Size of the connection pool.
+        **kwargs
+            Optional input, e.g. verify.
+
+        """
+        self.host = host
+        self.port = port if port else (443 if self.PROTOCOL == "https" else 80)
+        self.timeout = timeout
+        self.verify = kwargs.get("verify", True)
+        if retry is None:
+            retry = requests.adapters.DEFAULT_RETRIES
+        if pool_size is None:
+            pool_size = requests.adapters.DEFAULT_POOLSIZE
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount(f"{self.PROTOCOL}://", adapter)
+        self.hooks = []
+        self.__local = threading.local()
+
+    def add_hook(self, hook: ConnectionHook) -> ConnectionHook:
+        """
+        add_hook(self, hook)
+
+        Adds a hook to the connection. Hooks are called in the order they were added.
+
+        Parameters
+        ----------
+        hook : ConnectionHook
+            Hook to add.
+
+        Returns
+        -------
+        ConnectionHook
+            The added hook.
+
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: ConnectionHook) -> None:
+        """
+        remove_hook(self, hook)
+
+        Removes a hook from the connection. Requests which were already sent are still passed to the hook.
+
+        Parameters
+        ----------
+        hook : ConnectionHook
+            Hook to remove.
+
+        """
+        # a new list, because other threads may iterate over the hooks
+        self.hooks = [other_hook for other_hook in self.hooks if other_hook is not hook]
+
+    def get_hook(self, hook_class: type) -> Union[ConnectionHook, None]:
+        """
+        get_hook(self, hook_class)
+
+        Returns the first hook of a class.
+
+        Parameters
+        ----------
+        hook_class : type
+            Class of the hook.
+
+        Returns
+        -------
+        ConnectionHook or None
+            The hook or None if there is no hook of the class.
+
+        """
+        for hook in self.hooks:
+            if isinstance(hook, hook_class):
+                return hook
+        return None
+
+    def request(self, verb: str, url: str, input, headers: dict) -> None:
+        """
+        request(self, verb, url, input, headers)
+
+        Stores the request of the current thread.
+
+        Parameters
+        ----------
+        verb : str
+            HTTP method.
+        url : str
+            Path and query of the request.
+        input
+            Body of the request.
+        headers : dict
+            Request headers.
+
+        """
+        self.__local.request = Request(verb, url, input, headers)
+
+    def getresponse(self) -> Response:
+        """
+        getresponse(self)
+
+        Sends the request of the current thread through all hooks and returns the response.
+        Every response is observed by all hooks, then passed through the after_response hooks.
+        The request is sent again if a hook does not pass on the response.
+
+        Returns
+        -------
+        Response
+            Response of the request.
+
+        """
+        request = self.__local.request
+        while True:
+            response = None
+            for hook in self.hooks:
+                response = hook.before_request(request)
+                if response is not None:
+                    break
+            if response is None:
+                response = self.__send(request)
+            hooks = self.hooks
+            for hook in hooks:
+                hook.observe_response(request, response)
+            for hook in hooks:
+                response = hook.after_response(request, response)
+                if response is None:
+                    break
+            if response is not None:
+                return response
+
+    def __send(self, request: Request) -> Response:
+        """
+        __send(self, request)
+
+        Sends a request with the shared session.
+
+        Parameters
+        ----------
+        request : Request
+            Request to send.
+
+        Returns
+        -------
+        Response
+            Response of the request.
+
+        """
+        r = self.session.request(
+            request.verb,
+            f"{self.PROTOCOL}://{self.host}:{self.port}{request.url}",
+            headers=request.headers,
+            data=request.input,
+            timeout=self.timeout,
+            verify=self.verify,
+            allow_redirects=False
+        )
+        return Response(r.status_code, r.headers, r.text)
+
+    def close(self) -> None:
+        """
+        close(self)
+
+        Keeps the shared session open, the requester closes the connection after every request.
+
+        """
+        return
+
+class HTTPSConnection(Connection):
+    """
+    Thread-safe connection for https.
+
+    """
+    PROTOCOL = "https"
+
+class HTTPConnection(Connection):
+    """
+    Thread-safe connection for http, e.g. for a local GitHub stand-in.
+
+    """
+    PROTOCOL = "http"
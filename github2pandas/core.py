@@ -1,16 +1,22 @@
 import os
+import json
 import stat
 import typing
-import sys
+import urllib.parse
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Iterator, Union
 import pickle
+import time
+import datetime
+import itertools
 import github
 import human_id
-import time
 import math
 import pandas as pd
 import logging
+import contextlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 # github imports
 from github import GithubObject
 from github.MainClass import Github
@@ -19,6 +25,18 @@ from github.Repository import Repository as GitHubRepository
 from github.NamedUser import NamedUser as GitHubNamedUser
 from github.PaginatedList import PaginatedList
 from github.GithubException import RateLimitExceededException
+# github2pandas imports
+from github2pandas.api_metrics import ApiMetrics, MetricsSummary
+from github2pandas.cassette import ArchiveRecorder, ReplayServer
+from github2pandas.connection import Connection
+from github2pandas.http_cache import HttpCache
+from github2pandas.id_set import IdSet
+from github2pandas.progress import ConsoleProgressSink, ProgressReporter
+from github2pandas.rate_limit import RateLimitScheduler
+from github2pandas.storage import PickleStorage, Storage, StorageError
+from github2pandas.table_cache import TableCache
+from github2pandas.table_writer import TableWriter
+from github2pandas.user_registry import UserRegistry
 
 class Core():
     """
@@ -40,35 +58,103 @@ class Core():
         Maximum amount of returned informations for a general api call.    
     log_level : int
         Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET)    
+    number_of_threads : int, default=1
+        Number of threads which fetch pages of a paginated list concurrently.
+    storage : Storage
+        Storage backend of the pandas tables.
+    rate_limit_scheduler : RateLimitScheduler
+        Scheduler of all requests, shared by all objects with the same github_connection.
+    api_metrics : ApiMetrics
+        Metrics of all requests per module and endpoint, shared by all objects with the same github_connection.
+    api_metrics_summary : MetricsSummary
+        Summary of the requests of the last measured extraction or None.
     logger : logging.Logger
         Referenz to a logger object
     logger_no_print : logging.Logger
         Referenz to a logger object which does not print the log.
+    user_registry : UserRegistry
+        Registry of the users, shared by all objects of the same repository.
     users_ids : dict
         Dictionary of User Ids as Keys and anonym Ids as Value.
+    checkpoint_interval : int, default=300
+        Minimum number of seconds between two saved checkpoints of an extraction.
+    table_chunk_size : int, default=10000
+        Number of extracted rows which are written to one segment file by the table writers.
+    lazy_completion : bool, default=True
+        Are partial PyGithub objects completed by an additional request if an extracted attribute is missing?
+        If False only the fetched JSON is read, e.g. the name and email of users from listings are unknown.
+    archive_pages : bool, default=False
+        Are the raw responses of the extraction archived in current_dir by archive_api_pages?
+    extracted_ids : dict
+        Ids of the extracted items per extraction step as IdSet, they are saved with the checkpoint.
+    consistency_report : dict
+        Number of extracted items, dropped duplicates and missing expected ids per extraction step.
+    progress_reporter : ProgressReporter
+        Reporter of the progress bars. By default the progress is reported at most once per second and per percent
+        to stdout and the log. It can be replaced e.g. by ProgressReporter(CallbackProgressSink(callback)).
+    CHECKPOINT : str
+        Filename of the checkpoint of an extraction in current_dir.
+    ARCHIVE : str
+        Filename of the archive of the raw responses of an extraction in current_dir.
+    REACTION_CONTENTS : list
+        Contents of the reactions which are counted in the reaction summaries of GitHub.
+    table_cache : TableCache
+        Process-wide cache of the loaded pandas tables, e.g. Core.table_cache.set_max_size(0) disables it.
 
     Methods
     -------
-    __init__(self, github_connection, repo, repo_data_root_dir, current_dir, request_maximum = 40000, log_level=logging.INFO)
+    __init__(self, github_connection, repo, repo_data_root_dir, current_dir, request_maximum = 40000, log_level=logging.INFO, number_of_threads=1, github_tokens=None, http_cache_size=0, storage="pickle")
         Initializes core object with general informations.
     save_api_call(self, function, *args, **kwargs)
         Calls a GitHub function or method savely.
+    save_graphql_call(self, query, variables=None)
+        Sends a GraphQL query savely.
     get_save_total_count(self, paginated_list)
         Gets the total count of a paginated list savely. Waits until request limit is restored.
     get_save_api_data(self, paginated_list, index)
         Gets one item of the paginated list by index.
+    get_save_page(self, paginated_list, page_number)
+        Gets one page of the paginated list by page number savely.
+    get_save_pages(self, paginated_list, concurrent=True, first_page=None)
+        Yields the pages of a paginated list savely.
+    get_concurrent_pages(self, paginated_list, first_page=None)
+        Yields the pages of a paginated list in order while the following pages are fetched concurrently.
+    get_sharded_pages(self, windows)
+        Yields the pages of several listings in order while the following pages are fetched concurrently.
+    get_save_items(self, paginated_list, concurrent=True)
+        Yields the items of a paginated list savely page by page.
+    get_page_count(page)
+        Gets the number of pages of a listing from the Link header of its first page.
     wait_for_reset(self)
         Waits until request limit is refreshed.
+    measure_api_calls(self)
+        Context manager which records the requests of the extraction in api_metrics_summary.
+    archive_api_pages(self)
+        Context manager which archives the raw responses of the extraction if archive_pages is True.
+    rebuild_tables_from_archive(cls, data_root_dir, repo_full_name, log_level=logging.INFO, storage="pickle", **kwargs)
+        Generates the pandas tables of a subclass again from its archive without requests to GitHub.
     check_for_updates_paginated(self, new_paginated_list, list_count, old_df)
         Checks if the new_paginated_list has updates.
     extract_reactions(self, extract_function, parent_id, parent_name)
         Extracts reactions for element with parent_id by calling of extract_function.
     extract_reaction_data(self, reaction, parent_id, parent_name)
         Extracts general reaction data.
+    extract_reaction_counts(self, github_object, parent_id, parent_name)
+        Extracts the reaction counts of an element from its reaction summary.
+    extract_changed_reactions(self, extract_function, parent_id, parent_name, reaction_counts, stored_reaction_counts)
+        Extracts the reactions of an element only if its reaction counts changed.
+    get_stored_reaction_counts(reactions_df)
+        Returns the reaction counts of the stored reactions per parent.
+    get_unchanged_reactions(reactions_df, reaction_counts_df)
+        Returns the stored reactions of parents with unchanged reaction counts.
+    get_value(self, github_object, attribute)
+        Returns an attribute of a PyGithub object, without request if lazy_completion is False.
     extract_user_data(self, user, node_id_to_anonym_uuid=False)
         Extracts general user data.
     save_pandas_data_frame(self, file, data_frame)
         Saves the data_frame to a given file.
+    get_table_writer(self, file)
+        Returns a table writer which collects the extracted rows of a pandas table in chunks.
     extract_users(self, users)
         Extracts user data based on parameter users and returns a list of anonym user UUIDs. 
     extract_author_data_from_commit(self, commit_sha)
@@ -77,9 +163,33 @@ class Core():
         Extracts general committer data from a commit.
     extract_labels(self, github_labels)
         Gets all label names as a list.
-    extract_with_updated_and_since(self, github_method, label, data_extraction_function, *args, initial_data_list=None,initial_total_count=None, state=None,**kwargs)
+    extract_with_updated_and_since(self, github_method, label, data_extraction_function, *args, initial_data_list=None, state=None, expected_ids=None, **kwargs)
         Extracts and updates data, calls the method git_method and the function data_extraction_function.
-    progress_bar(self, iterable, prefix="", size=60, file=sys.stdout)
+    plan_since_windows(self, github_method, since=None, state=None)
+        Splits a listing sorted by updated into overlapping windows of at most request_maximum items.
+    get_extracted_ids(self, label)
+        Returns the ids of the extracted items of an extraction step.
+    report_missing_ids(self, label, expected_ids)
+        Records the expected ids which were not extracted in the consistency report.
+    start_checkpoint(self, params, name=None, **lists)
+        Starts the checkpoints of an extraction and resumes a stopped extraction with the same parameters.
+    update_checkpoint(self, label, data=None, finished=False)
+        Records the progress of an extraction step and saves the checkpoint periodically.
+    complete_pending_work(self)
+        Completes asynchronous extraction work before a checkpoint is saved.
+    get_checkpoint_progress(self, label)
+        Returns the recorded progress of an extraction step.
+    remove_checkpoint(self)
+        Removes the checkpoint after the extraction is finished.
+    upsert_data_frame(old_data_frame, new_data_frame, key="id", sort_by=None)
+        Updates and inserts the rows of new_data_frame into old_data_frame by key.
+    apply_schema(data_frame, schema)
+        Converts the columns of a data frame to the dtypes of a schema.
+    get_link_table(data_frame, key, column, key_name, value_name)
+        Returns a normalized link table of a list column.
+    get_schema_memory_usage(data_frame, schema)
+        Returns the memory usage of a data frame with and without its schema.
+    progress_bar(self, iterable, prefix="", size=60, total=None)
         Prints out a progress bar.
     copy_valid_params(self, base_dict ,input_params)
         Appends base_dict with the elements of input_param, returns the new dictionary.
@@ -89,10 +199,15 @@ class Core():
         A debug function. Prints the remaining api calls for the github key.
     file_error_handling(function, path, exc_info)
         Tries to change file permission and call the calling function again.
-    get_pandas_data_frame(data_dir, filename)
+    get_pandas_data_frame(data_dir, filename, columns=None, filters=None)
         Returns a pandas data frame stored in file.
 
     """
+    CHECKPOINT = "Checkpoint.p"
+    ARCHIVE = "Archive" + ArchiveRecorder.SUFFIX
+    REACTION_CONTENTS = ["+1", "-1", "laugh", "hooray", "confused", "heart", "rocket", "eyes"]
+    table_cache = TableCache()
+
     class Params():
         """
         A base class that holds methods for Params classes.
@@ -226,6 +341,8 @@ class Core():
         ----------
         DATA_DIR : str
             Base folder name.
+        SCHEMAS : dict
+            Dtypes of the columns of the pandas tables by filename, e.g. {"Issues.p": {"state": "category"}}.
 
         Methods
         -------
@@ -233,9 +350,18 @@ class Core():
             Returns a list of all pandas filenames.
         to_dict()
             Returns a dict with the folder as key and the list of all pandas filenames as value.
+        get_schema(filename)
+            Returns the dtypes of the columns of a pandas table.
         
         """
         DATA_DIR = ""
+        SCHEMAS = {}
+        __files_classes = []
+
+        def __init_subclass__(cls, **kwargs) -> None:
+            super().__init_subclass__(**kwargs)
+            # the list of the base class is shared by all Files classes
+            cls.__files_classes.append(cls)
 
         @classmethod
         def to_list(cls) -> list:
@@ -276,6 +402,29 @@ class Core():
             """
             return {cls.DATA_DIR: cls.to_list()}
 
+        @staticmethod
+        def get_schema(filename: str) -> dict:
+            """
+            get_schema(filename)
+
+            Returns the dtypes of the columns of a pandas table from the SCHEMAS of all Files classes.
+
+            Parameters
+            ----------
+            filename : str
+                Filename of the pandas table.
+
+            Returns
+            -------
+            dict
+                Dictionary with the column names as keys and the dtypes as values, empty if there is no schema.
+
+            """
+            for files_class in Core.Files.__files_classes:
+                if filename in files_class.SCHEMAS:
+                    return files_class.SCHEMAS[filename]
+            return {}
+
     
     class UserFiles(Files):
         """
@@ -289,9 +438,9 @@ class Core():
         """
         USERS = "Users.p"
     
-    def __init__(self, github_connection: Github, repo: GitHubRepository, repo_data_root_dir: Path, current_dir: str, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    def __init__(self, github_connection: Github, repo: GitHubRepository, repo_data_root_dir: Path, current_dir: str, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, github_tokens: list = None, http_cache_size: int = 0, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, repo_data_root_dir, current_dir, request_maximum = 40000, log_level=logging.INFO)
+        __init__(self, github_connection, repo, repo_data_root_dir, current_dir, request_maximum = 40000, log_level=logging.INFO, number_of_threads=1, github_tokens=None, http_cache_size=0, storage="pickle")
 
         Initializes core object with general informations.
 
@@ -309,6 +458,18 @@ class Core():
             Maximum amount of returned informations for a general api call.        
         log_level : int
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO    
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently. Pages are fetched one after another if 1.
+        github_tokens : list, default=None
+            Pool of tokens which is shared by all objects with the same github_connection. A token is a string or
+            a function which returns a token. Every request is sent with the token with the most remaining requests.
+        http_cache_size : int, default=0
+            Maximum size in bytes of the http cache in repo_data_root_dir, which is shared by all objects with the same
+            github_connection. Unchanged responses are revalidated with ETags and do not count against the rate limit.
+            No http cache is installed if 0.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object,
+            e.g. ParquetStorage("zstd") for another compression.
     
         """
         self.log_level = log_level
@@ -320,15 +481,23 @@ class Core():
         self.logger_no_print.setLevel(log_level)
         logging.basicConfig(format='%(levelname)s;%(asctime)s;%(message)s', filename=Path(repo_data_root_dir,"github2pandas.log"))
         self.github_connection = github_connection
+        self.rate_limit_scheduler = None
+        self.api_metrics = None
+        self.api_metrics_summary = None
+        if github_connection is not None:
+            self.rate_limit_scheduler = RateLimitScheduler.install(github_connection, github_tokens)
+            if http_cache_size > 0:
+                HttpCache.install(github_connection, repo_data_root_dir, http_cache_size)
+            self.api_metrics = ApiMetrics.install(github_connection)
         self.repo = repo
         self.repo_data_root_dir = repo_data_root_dir
         if repo is not None:
             self.repo_data_dir = Path(self.repo_data_root_dir,repo.full_name)
             self.repo_data_dir.mkdir(parents=True, exist_ok=True)
-            df_users = Core.get_pandas_data_frame(self.repo_data_dir, Core.UserFiles.USERS)
-            self.users_ids = {}
-            for index, row in df_users.iterrows():
-                self.users_ids[row["id"]] = row["anonym_uuid"]
+        else:
+            self.repo_data_dir = Path(self.repo_data_root_dir)
+        self.user_registry = UserRegistry.get_registry(self.repo_data_dir, Core.UserFiles.USERS)
+        self.users_ids = self.user_registry.users_ids
         if current_dir is None or current_dir == "":
             if repo is None:
                 self.current_dir = self.repo_data_root_dir
@@ -337,6 +506,16 @@ class Core():
         else:
             self.current_dir = Path(self.repo_data_dir,current_dir)
         self.request_maximum = request_maximum
+        self.number_of_threads = number_of_threads
+        self.storage = Storage.get_storage(storage)
+        self.checkpoint_interval = 300
+        self.table_chunk_size = 10000
+        self.lazy_completion = True
+        self.archive_pages = False
+        self.extracted_ids = {}
+        self.consistency_report = {}
+        self.progress_reporter = ProgressReporter(ConsoleProgressSink(self.logger_no_print, log_level <= logging.INFO))
+        self.__checkpoint = None
     
     def save_api_call(self, function, *args, **kwargs) -> Any: 
         """
@@ -370,6 +549,47 @@ class Core():
             else:
                 raise e
     
+    def save_graphql_call(self, query: str, variables: dict = None) -> dict:
+        """
+        save_graphql_call(self, query, variables=None)
+
+        Sends a GraphQL query savely. Waits until the GraphQL rate limit is restored if necessary.
+
+        Parameters
+        ----------
+        query : str
+            GraphQL query.
+        variables : dict, default=None
+            Variables of the query, no variables if None.
+
+        Returns
+        -------
+        dict
+            Data of the GraphQL response.
+
+        Notes
+        -----
+            GitHub GraphQL api: https://docs.github.com/en/graphql
+
+        """
+        variables = variables or {}
+        o = urllib.parse.urlparse(self.repo.url)
+        prefix = o.path[:o.path.find("/repos/")]
+        if prefix == "":
+            url = "/graphql"
+        else:
+            # GitHub Enterprise Server: /api/v3 => /api/graphql
+            url = f"{o.scheme}://{o.netloc}/api/graphql"
+        while True:
+            headers, data = self.save_api_call(self.repo._requester.requestJsonAndCheck, "POST", url, input={"query": query, "variables": variables})
+            errors = data.get("errors")
+            if not errors:
+                return data["data"]
+            if any(error.get("type") == "RATE_LIMITED" for error in errors):
+                self.rate_limit_scheduler.wait_for_reset("graphql")
+                continue
+            raise github.GithubException(200, data, headers)
+
     def get_save_total_count(self, paginated_list: PaginatedList) -> int:
         """
         get_save_total_count(self, paginated_list)
@@ -423,28 +643,331 @@ class Core():
             self.wait_for_reset()
             return paginated_list[index]
 
+    def get_save_page(self, paginated_list: PaginatedList, page_number: int) -> list:
+        """
+        get_save_page(self, paginated_list, page_number)
+
+        Gets one page of the paginated list by page number savely. After a rate limit sleep the page is requested again.
+
+        Parameters
+        ----------
+        paginated_list : PaginatedList
+            A paginated list as input.
+        page_number : int
+            Page number starting with 0.
+
+        Returns
+        -------
+        list
+            Items of the page or an empty list if the listing does not exist.
+
+        """
+        while True:
+            try:
+                return paginated_list.get_page(page_number)
+            except RateLimitExceededException:
+                self.wait_for_reset()
+            except github.GithubException as e:
+                if e.status in [404, 409]:
+                    # "Not Found" or "Git Repository is empty."
+                    return []
+                raise e
+
+    def get_save_pages(self, paginated_list: PaginatedList, concurrent: bool = True, first_page: list = None) -> Iterator[list]:
+        """
+        get_save_pages(self, paginated_list, concurrent=True, first_page=None)
+
+        Yields the pages of a paginated list savely. Every page costs exactly one request and
+        no additional total count request is necessary. After a rate limit sleep the same page is requested again.
+        The pages are fetched concurrently if number_of_threads is greater than 1.
+
+        Parameters
+        ----------
+        paginated_list : PaginatedList
+            A paginated list as input.
+        concurrent : bool, default=True
+            May the pages be fetched concurrently? False e.g. in worker threads.
+        first_page : list, default=None
+            First page which was already fetched by get_save_page, e.g. by a probe. The listing continues with the second page.
+
+        Yields
+        ------
+        list
+            Items of one page.
+
+        """
+        if concurrent and self.number_of_threads > 1:
+            yield from self.get_concurrent_pages(paginated_list, first_page)
+            return
+        if first_page is not None:
+            if len(first_page) == 0:
+                return
+            yield first_page
+            for page_number in range(1, Core.get_page_count(first_page)):
+                page = self.get_save_page(paginated_list, page_number)
+                if len(page) == 0:
+                    return
+                yield page
+            return
+        while paginated_list._couldGrow():
+            try:
+                page = paginated_list._fetchNextPage()
+            except RateLimitExceededException:
+                # the next page url is only updated after a successful request
+                self.wait_for_reset()
+                continue
+            except github.GithubException as e:
+                if e.status in [404, 409]:
+                    # "Not Found" or "Git Repository is empty."
+                    return
+                raise e
+            if len(page) == 0:
+                return
+            yield page
+
+    def get_concurrent_pages(self, paginated_list: PaginatedList, first_page: list = None) -> Iterator[list]:
+        """
+        get_concurrent_pages(self, paginated_list, first_page=None)
+
+        Yields the pages of a paginated list in order while the following pages are fetched concurrently.
+        The number of pages is taken from the Link header of the first page. The first page is yielded before
+        the following pages are requested, so a probe of the first page costs one request. Afterwards at most
+        two pages per thread are fetched in advance and no page after request_maximum items is requested.
+
+        Parameters
+        ----------
+        paginated_list : PaginatedList
+            A paginated list as input.
+        first_page : list, default=None
+            First page which was already fetched by get_save_page. It is requested if None.
+
+        Yields
+        ------
+        list
+            Items of one page.
+
+        """
+        if first_page is None:
+            first_page = self.get_save_page(paginated_list, 0)
+        if len(first_page) == 0:
+            return
+        page_count = min(Core.get_page_count(first_page), math.ceil(self.request_maximum / len(first_page)))
+        yield first_page
+        if page_count <= 1:
+            return
+        executor = ThreadPoolExecutor(max_workers=self.number_of_threads, thread_name_prefix="github2pandas")
+        futures = deque()
+        next_page_number = 1
+        try:
+            while True:
+                while next_page_number < page_count and len(futures) < 2 * self.number_of_threads:
+                    futures.append(executor.submit(self.get_save_page, paginated_list, next_page_number))
+                    next_page_number += 1
+                if len(futures) == 0:
+                    return
+                page = futures.popleft().result()
+                if len(page) == 0:
+                    return
+                yield page
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown()
+
+    def get_sharded_pages(self, windows: list) -> Iterator[list]:
+        """
+        get_sharded_pages(self, windows)
+
+        Yields the pages of several listings in order while the following pages of all listings are fetched concurrently.
+        At most two pages per thread are fetched in advance.
+
+        Parameters
+        ----------
+        windows : list
+            Tuples of a paginated list and the number of its pages which are fetched.
+
+        Yields
+        ------
+        list
+            Items of one page.
+
+        """
+        pages = ((paginated_list, page_number) for paginated_list, page_count in windows for page_number in range(page_count))
+        with ThreadPoolExecutor(max_workers=self.number_of_threads, thread_name_prefix="github2pandas") as executor:
+            futures = deque()
+            try:
+                for paginated_list, page_number in itertools.islice(pages, 2 * self.number_of_threads):
+                    futures.append(executor.submit(self.get_save_page, paginated_list, page_number))
+                while len(futures) > 0:
+                    page = futures.popleft().result()
+                    for paginated_list, page_number in itertools.islice(pages, 1):
+                        futures.append(executor.submit(self.get_save_page, paginated_list, page_number))
+                    yield page
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def get_save_items(self, paginated_list: PaginatedList, concurrent: bool = True) -> Iterator[Any]:
+        """
+        get_save_items(self, paginated_list, concurrent=True)
+
+        Yields the items of a paginated list savely page by page.
+
+        Parameters
+        ----------
+        paginated_list : PaginatedList
+            A paginated list as input. 
+        concurrent : bool, default=True
+            May the pages be fetched concurrently? False e.g. in worker threads.
+
+        Yields
+        ------
+        Any
+            Item of the paginated list.
+
+        """
+        for page in self.get_save_pages(paginated_list, concurrent):
+            for item in page:
+                yield item
+
+    @staticmethod
+    def get_page_count(page: list) -> int:
+        """
+        get_page_count(page)
+
+        Gets the number of pages of a listing from the Link header of its first page.
+
+        Parameters
+        ----------
+        page : list
+            First page of a paginated list.
+
+        Returns
+        -------
+        int
+            Number of pages of the listing.
+
+        """
+        if len(page) == 0:
+            return 0
+        headers = getattr(page[0], "_headers", None) or {}
+        for link in headers.get("link", "").split(","):
+            if 'rel="last"' in link:
+                url = link[link.find("<") + 1:link.find(">")]
+                query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+                if "page" in query:
+                    return int(query["page"][0])
+        return 1
+
     def wait_for_reset(self) -> None:
         """
         wait_for_reset(self)
 
-        Waits until request limit is refreshed.
+        Waits until request limit is refreshed. The reset time is taken from the rate limit headers
+        of the last response. The rate limit is never requested: without a received response there is nothing
+        to wait for, the request is sent again and the scheduler waits for the reset of its response.
 
         """
         self.logger.debug("Waiting for request limit refresh ...")
-        self.github_connection.get_rate_limit()
-        reset_timestamp = self.github_connection.rate_limiting_resettime
-        seconds_until_reset = reset_timestamp - time.time()
-        sleep_step_width = 1
-        sleeping_range = range(math.ceil(seconds_until_reset / sleep_step_width))
-        for i in self.progress_bar(sleeping_range, "Sleeping : ", 60):
-            time.sleep(sleep_step_width)
-        self.github_connection.get_rate_limit()
-        requests_remaning, requests_limit = self.github_connection.rate_limiting
-        while requests_remaning == 0:
-            self.logger.debug("No remaining requests sleep 1s ...")
-            time.sleep(1)
-            self.github_connection.get_rate_limit()
-            requests_remaning, requests_limit = self.github_connection.rate_limiting
+        self.rate_limit_scheduler.wait_for_reset()
+
+    @contextlib.contextmanager
+    def measure_api_calls(self) -> Iterator[Union[MetricsSummary, None]]:
+        """
+        measure_api_calls(self)
+
+        Context manager which records the requests of the extraction per endpoint in api_metrics_summary.
+        The requests are attributed to the class name of the object, e.g. Issues.
+
+        Yields
+        ------
+        MetricsSummary or None
+            Summary of the requests or None without github_connection.
+
+        """
+        if self.api_metrics is None:
+            yield None
+            return
+        with self.api_metrics.measure(type(self).__name__) as summary:
+            self.api_metrics_summary = summary
+            yield summary
+
+    @contextlib.contextmanager
+    def archive_api_pages(self) -> Iterator[Union[ArchiveRecorder, None]]:
+        """
+        archive_api_pages(self)
+
+        Context manager which archives the raw responses of the extraction compressed in current_dir if archive_pages
+        is True. The archive of the last extraction is replaced. Tables can be generated again from the archive by
+        rebuild_tables_from_archive, e.g. after a new column was added to an extractor.
+
+        Yields
+        ------
+        ArchiveRecorder or None
+            Recorder of the archive or None if archive_pages is False.
+
+        """
+        if not self.archive_pages or self.github_connection is None or self.repo is None:
+            yield None
+            return
+        o = urllib.parse.urlparse(self.repo.url)
+        metadata = {
+            "repo": self.repo.full_name,
+            "base_path": o.path[:o.path.find("/repos/")],
+            "per_page": self.github_connection.per_page
+        }
+        recorder = ArchiveRecorder.install(self.github_connection, Path(self.current_dir, Core.ARCHIVE), metadata)
+        # the repository is requested by rebuild_tables_from_archive before the extraction
+        recorder.add_interaction({
+            "verb": "GET",
+            "url": o.path,
+            "status": 200,
+            "headers": {"content-type": "application/json; charset=utf-8"},
+            "body": json.dumps(self.repo._rawData)
+        })
+        try:
+            yield recorder
+        finally:
+            Connection.install(self.github_connection).remove_hook(recorder)
+            recorder.close()
+
+    @classmethod
+    def rebuild_tables_from_archive(cls, data_root_dir: Path, repo_full_name: str, log_level: int = logging.INFO, storage: Union[str, Storage] = "pickle", **kwargs) -> "Core":
+        """
+        rebuild_tables_from_archive(cls, data_root_dir, repo_full_name, log_level=logging.INFO, storage="pickle", **kwargs)
+
+        Generates the pandas tables of a subclass again from its archive without requests to GitHub, e.g.
+        Issues.rebuild_tables_from_archive(data_root_dir, "owner/repo", params=params). The archive is replayed
+        by a local ReplayServer. Requests which are not in the archive are answered with 404 Not Found, so only
+        data of the archived responses can be extracted.
+
+        Parameters
+        ----------
+        data_root_dir : Path
+            Data root directory of the repositories.
+        repo_full_name : str
+            Full name of the repository, e.g. "owner/repo".
+        log_level : int, default=logging.INFO
+            Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET).
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables.
+        **kwargs
+            Parameters of generate_pandas_tables of the subclass.
+
+        Returns
+        -------
+        Core
+            Object of the subclass with the generated tables.
+
+        """
+        archive_file = Path(data_root_dir, repo_full_name, cls.Files.DATA_DIR, Core.ARCHIVE)
+        with ReplayServer(archive_file) as server:
+            metadata = server.cassette.metadata
+            github_connection = Github(base_url=server.base_url + metadata.get("base_path", ""), per_page=metadata.get("per_page", 30))
+            repo = github_connection.get_repo(repo_full_name)
+            core = cls(github_connection, repo, data_root_dir, log_level=log_level, storage=storage)
+            core.generate_pandas_tables(**kwargs)
+        return core
     
     def check_for_updates_paginated(self, new_paginated_list: PaginatedList, list_count: int, old_df: pd.DataFrame) -> bool:
         """
@@ -454,10 +977,10 @@ class Core():
 
         Parameters
         ----------
-        new_paginated_list : PaginatedList
-            paginated list with updated_at and sorted by updated.
+        new_paginated_list : PaginatedList or list
+            paginated list or its first page with updated_at and sorted by updated.
         list_count: int
-            Length of the paginated List.
+            Length of the paginated List, only checked against zero.
         old_df : pd.DataFrame
             old Dataframe.
 
@@ -504,13 +1027,9 @@ class Core():
         """
         reactions = self.save_api_call(extract_function)
         reaction_list = []
-        for i in range(self.request_maximum):
-            try:
-                reaction = self.get_save_api_data(reactions, i)
-                reaction_data = self.save_api_call(self.extract_reaction_data, reaction, parent_id, parent_name)
-                reaction_list.append(reaction_data)
-            except IndexError:
-                break 
+        for reaction in self.get_save_items(reactions):
+            reaction_data = self.save_api_call(self.extract_reaction_data, reaction, parent_id, parent_name)
+            reaction_list.append(reaction_data)
         return reaction_list
 
     def extract_reaction_data(self, reaction: GitHubReaction, parent_id: int, parent_name: str) -> dict:
@@ -547,7 +1066,154 @@ class Core():
         if not reaction._user == GithubObject.NotSet:
             reaction_data["author"] = self.extract_user_data(reaction.user)
         return reaction_data
+
+    def extract_reaction_counts(self, github_object, parent_id: int, parent_name: str) -> Union[dict, None]:
+        """
+        extract_reaction_counts(self, github_object, parent_id, parent_name)
+
+        Extracts the reaction counts of an element from the reaction summary of its fetched JSON without a request.
+
+        Parameters
+        ----------
+        github_object : GithubObject
+            Issue, issue comment or review comment object from pygithub.
+        parent_id : int
+            Id from parent as foreign key.
+        parent_name : str
+            Name of the parent.
+
+        Returns
+        -------
+        dict or None
+            Dictionary with the total count and the count of each reaction content or None if the JSON contains no summary.
+
+        """
+        summary = github_object._rawData.get("reactions")
+        if not isinstance(summary, dict):
+            return None
+        reaction_counts = {"parent_id": parent_id, "parent_name": parent_name, "total_count": summary.get("total_count", 0)}
+        for content in Core.REACTION_CONTENTS:
+            reaction_counts[content] = summary.get(content, 0)
+        return reaction_counts
+
+    def extract_changed_reactions(self, extract_function, parent_id: int, parent_name: str, reaction_counts: Union[dict, None], stored_reaction_counts: dict) -> list:
+        """
+        extract_changed_reactions(self, extract_function, parent_id, parent_name, reaction_counts, stored_reaction_counts)
+
+        Extracts the reactions of an element only if its reaction counts differ from the stored reactions.
+        Elements without reactions need no request either.
+
+        Parameters
+        ----------
+        extract_function
+            A function to call reactions.
+        parent_id : int
+            Id from reaction parent element as foreign key.
+        parent_name : str
+            Name of reaction parent element.
+        reaction_counts : dict or None
+            Reaction counts of the element from extract_reaction_counts. The reactions are always extracted if None.
+        stored_reaction_counts : dict
+            Reaction counts of the stored reactions from get_stored_reaction_counts.
+
+        Returns
+        -------
+        list
+            Returns a list of reactions, which is empty if the stored reactions are unchanged.
+
+        """
+        if reaction_counts is not None:
+            if reaction_counts["total_count"] == 0:
+                return []
+            counts = {content: reaction_counts[content] for content in Core.REACTION_CONTENTS if reaction_counts[content] > 0}
+            if stored_reaction_counts.get((parent_name, parent_id)) == counts:
+                return []
+        return self.extract_reactions(extract_function, parent_id, parent_name)
+
+    @staticmethod
+    def get_stored_reaction_counts(reactions_df: pd.DataFrame) -> dict:
+        """
+        get_stored_reaction_counts(reactions_df)
+
+        Returns the reaction counts of the stored reactions per parent.
+
+        Parameters
+        ----------
+        reactions_df : pd.DataFrame
+            Stored reactions table.
+
+        Returns
+        -------
+        dict
+            Dictionary with (parent_name, parent_id) as keys and dictionaries of the counts per content as values.
+
+        """
+        stored_reaction_counts = {}
+        if reactions_df.empty:
+            return stored_reaction_counts
+        counts = reactions_df.groupby(["parent_name", "parent_id", "content"], observed=True).size()
+        for (parent_name, parent_id, content), count in counts.items():
+            stored_reaction_counts.setdefault((parent_name, int(parent_id)), {})[content] = int(count)
+        return stored_reaction_counts
+
+    @staticmethod
+    def get_unchanged_reactions(reactions_df: pd.DataFrame, reaction_counts_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        get_unchanged_reactions(reactions_df, reaction_counts_df)
+
+        Returns the stored reactions of parents whose reaction counts are unchanged. These reactions were not
+        extracted again by extract_changed_reactions.
+
+        Parameters
+        ----------
+        reactions_df : pd.DataFrame
+            Stored reactions table.
+        reaction_counts_df : pd.DataFrame
+            Extracted reaction counts table.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of reactions_df with unchanged parents.
+
+        """
+        if reactions_df.empty or reaction_counts_df.empty:
+            return reactions_df.iloc[:0]
+        stored_reaction_counts = Core.get_stored_reaction_counts(reactions_df)
+        unchanged_parents = set()
+        for reaction_counts in reaction_counts_df.to_dict("records"):
+            key = (reaction_counts["parent_name"], int(reaction_counts["parent_id"]))
+            counts = {content: int(reaction_counts[content]) for content in Core.REACTION_CONTENTS if reaction_counts[content] > 0}
+            if counts and stored_reaction_counts.get(key) == counts:
+                unchanged_parents.add(key)
+        parents = pd.Series(list(zip(reactions_df["parent_name"], reactions_df["parent_id"].astype(int))), index=reactions_df.index)
+        return reactions_df[parents.isin(unchanged_parents)]
     
+    def get_value(self, github_object: GithubObject.GithubObject, attribute: str) -> Any:
+        """
+        get_value(self, github_object, attribute)
+
+        Returns an attribute of a PyGithub object. PyGithub completes a partial object by an additional request
+        if the attribute is missing. If lazy_completion is False only the fetched JSON is read instead.
+
+        Parameters
+        ----------
+        github_object : GithubObject
+            Object from pygithub.
+        attribute : str
+            Name of the attribute.
+
+        Returns
+        -------
+        Any
+            Value of the attribute or None if it is missing and lazy_completion is False.
+
+        """
+        if self.lazy_completion:
+            return getattr(github_object, attribute)
+        # the parsed attributes are stored with a leading underscore, missing attributes are NotSet with the value None
+        return getattr(github_object, "_" + attribute, GithubObject.NotSet).value
+
     def extract_user_data(self, user: GitHubNamedUser, node_id_to_anonym_uuid: bool = False) -> Union[str,None]:
         """
         extract_user_data(self, user, node_id_to_anonym_uuid=False)
@@ -573,38 +1239,41 @@ class Core():
         """
         if not user:
             return None
-        if user.node_id in self.users_ids:
-            return self.users_ids[user.node_id]
-        users_file = Path(self.repo_data_dir, Core.UserFiles.USERS)
-        users_df = pd.DataFrame()
-        if users_file.is_file():
-            users_df = pd.read_pickle(users_file)
+        anonym_uuid = self.user_registry.get_anonym_uuid(user.node_id)
+        if anonym_uuid is not None:
+            return anonym_uuid
         user_data = {}
         if node_id_to_anonym_uuid:
             user_data["anonym_uuid"] = user.node_id
         else:
             user_data["anonym_uuid"] = human_id.generate_id(seed=user.node_id)
         user_data["id"] = user.node_id
-        if hasattr(user, "name"):
-            user_data["name"] = user.name
-        if hasattr(user, "email"):
-            user_data["email"] = user.email
+        if self.lazy_completion:
+            if hasattr(user, "name"):
+                user_data["name"] = user.name
+            if hasattr(user, "email"):
+                user_data["email"] = user.email
+        else:
+            # users of listings contain no name and email
+            raw_data = getattr(user, "_rawData", {})
+            for key in ["name", "email"]:
+                if key in raw_data:
+                    user_data[key] = raw_data[key]
         if hasattr(user, "login"):
             user_data["login"] = user.login
             if user_data["login"] == "invalid-email-address" and not "name" in user_data:
                 logging.warning("None User",user)
                 return None
-        self.users_ids[user.node_id] = user_data["anonym_uuid"]
-        users_df = pd.concat([users_df,pd.DataFrame([user_data])], ignore_index=True)
-        with open(users_file, "wb") as f:
-            pickle.dump(users_df, f)
-        return user_data["anonym_uuid"]
+        return self.user_registry.add_user(user_data)
 
     def save_pandas_data_frame(self, file:str, data_frame: pd.DataFrame) -> None:
         """
         save_pandas_data_frame(self, file, data_frame)
 
-        Saves the data_frame to a given file.
+        Saves the data_frame to a given file with the storage backend. The columns are converted to the
+        dtypes of the schema of the file. The data_frame is pickled if the backend does not support it.
+        Files of the table from other backends are removed. The saved data_frame is put into the table
+        cache, so it is not read again.
 
         Parameters
         ----------
@@ -615,10 +1284,45 @@ class Core():
 
         """
         self.current_dir.mkdir(parents=True, exist_ok=True)
-        pd_file = Path(self.current_dir, file)
-        with open(pd_file, "wb") as f:
-            pickle.dump(data_frame, f)
+        data_frame = Core.apply_schema(data_frame, Core.Files.get_schema(file))
+        storage = self.storage
+        pd_file = storage.get_file(self.current_dir, file)
+        try:
+            storage.save(data_frame, pd_file)
+        except StorageError as e:
+            self.logger.warning(f"{file} is pickled: {e}")
+            storage = PickleStorage()
+            pd_file = storage.get_file(self.current_dir, file)
+            storage.save(data_frame, pd_file)
+        Core.table_cache.put(pd_file, data_frame)
+        # e.g. the pickle of the table before the backend was changed
+        for storage_class in Storage.get_storage_classes():
+            other_file = storage_class.get_file(self.current_dir, file)
+            if other_file != pd_file and other_file.is_file():
+                other_file.unlink()
+                Core.table_cache.invalidate(other_file)
     
+    def get_table_writer(self, file: str) -> TableWriter:
+        """
+        get_table_writer(self, file)
+
+        Returns a table writer which collects the extracted rows of a pandas table in chunks.
+        The segment files are written next to the table in current_dir.
+
+        Parameters
+        ----------
+        file : str
+            Name of the file of the table.
+
+        Returns
+        -------
+        TableWriter
+            Table writer with table_chunk_size rows per segment.
+
+        """
+        segment_dir = Path(self.current_dir, Path(file).stem + TableWriter.SEGMENTS_SUFFIX)
+        return TableWriter(segment_dir, self.table_chunk_size)
+
     def extract_users(self, users: PaginatedList) -> list:
         """
         extract_users(self, users)
@@ -737,11 +1441,17 @@ class Core():
             label_list.append(label.name)
         return label_list
 
-    def extract_with_updated_and_since(self, github_method, label: str, data_extraction_function, *args, initial_data_list: PaginatedList = None, initial_total_count: int = None, state: str = None, **kwargs) -> None:
+    def extract_with_updated_and_since(self, github_method, label: str, data_extraction_function, *args, initial_data_list: PaginatedList = None, state: str = None, expected_ids: typing.Iterable = None, **kwargs) -> None:
         """
-        extract_with_updated_and_since(self, github_method, label, data_extraction_function, *args, initial_data_list=None, initial_total_count=None, state=None, **kwargs)
+        extract_with_updated_and_since(self, github_method, label, data_extraction_function, *args, initial_data_list=None, state=None, expected_ids=None, **kwargs)
 
         Extracts and updates data, calls the method git_method and the function data_extraction_function.
+        The list is streamed page by page, the pages are fetched concurrently if number_of_threads is greater than 1.
+        After request_maximum items the list is requested again with since. Items which are listed again, e.g. with
+        the same updated_at, are dropped by the id set of get_extracted_ids.
+        If number_of_threads is greater than 1 and the list has more than request_maximum items, it is split into
+        since windows by plan_since_windows instead. The pages of all windows are fetched concurrently, the items are
+        extracted in order and deduplicated by id. Finally the items updated during the extraction are listed again.
 
         Parameters
         ----------
@@ -754,55 +1464,566 @@ class Core():
         *args
             Input for the data_extraction_function
         initial_data_list
-            List of initial data
-        initial_total_count
-            Initial count of requests
+            List of initial data sorted ascending by updated
         state
             corresponds to the github state of data, allows extracting with state consideration
+        expected_ids
+            Ids which should be extracted, e.g. of the stored table. The missing ids are listed in the consistency report.
         **kwargs
             Optional input for data_extraction_function
         """
-        if initial_data_list is None:
+        progress = self.get_checkpoint_progress(label)
+        if progress.get("finished"):
+            self.logger.info(f"{label} are resumed from the checkpoint")
+            return
+        if self.number_of_threads > 1 and initial_data_list is None:
+            started_at = datetime.datetime.utcnow()
+            windows = self.plan_since_windows(github_method, progress.get("since"), state)
+            if len(windows) > 1:
+                self.__extract_since_windows(github_method, windows, started_at, label, data_extraction_function, *args, state=state, **kwargs)
+                self.report_missing_ids(label, expected_ids)
+                return
+        extracted_ids = self.get_extracted_ids(label)
+        duplicates = 0
+        if "since" in progress:
+            # resume after the last extracted item
+            self.logger.info(f"{label} are resumed from the checkpoint since {progress['since']}")
+            if state is None:
+                data_list = self.save_api_call(github_method, since=progress["since"], sort="updated", direction="asc")
+            else:
+                data_list = self.save_api_call(github_method, state=state, since=progress["since"], sort="updated", direction="asc")
+        elif initial_data_list is None:
             if state is None:
                 data_list = self.save_api_call(github_method, sort="updated", direction="asc")
             else:
                 data_list = self.save_api_call(github_method, state=state, sort="updated", direction="asc")
         else:
             data_list = initial_data_list
-        if initial_total_count is None:
-            total_count = self.get_save_total_count(data_list)
-        else:
-            total_count = initial_total_count
-        last_id = 0
-        extract_data = True
         while True:
-            if total_count >= self.request_maximum:
-                self.logger.info(f"{label} >= request_maximum ==> mutiple {label} progress bars")
-                total_count = self.request_maximum
-            for i in self.progress_bar(range(total_count), f"{label}: "):
-                data = self.get_save_api_data(data_list, i)
-                if extract_data:
+            count = 0
+            for data in self.progress_bar(self.get_save_items(data_list), f"{label}: "):
+                count += 1
+                if extracted_ids.add(data.id):
                     data_extraction_function(data, *args, **kwargs)
-                elif data.id == last_id:
-                    extract_data = True
+                    self.update_checkpoint(label, data)
                 else:
-                    self.logger.error(f"Skip {label} with ID: {data.id}")
-            if total_count == self.request_maximum:
-                last_id = data.id
-                extract_data = False
+                    duplicates += 1
+                if count == self.request_maximum:
+                    break
+            if count == self.request_maximum:
+                self.logger.info(f"{label} >= request_maximum ==> mutiple {label} progress bars")
                 if state is None:
                     data_list = self.save_api_call(github_method, since=data.updated_at, sort="updated", direction="asc")
                 else:
                     data_list = self.save_api_call(github_method, state=state, since=data.updated_at, sort="updated", direction="asc")
-                total_count = self.get_save_total_count(data_list)
             else:
                 break
+        self.update_checkpoint(label, finished=True)
+        self.consistency_report[label] = {"extracted": len(extracted_ids), "duplicates": duplicates, "missing": []}
+        self.report_missing_ids(label, expected_ids)
+
+    def get_extracted_ids(self, label: str) -> IdSet:
+        """
+        get_extracted_ids(self, label)
+
+        Returns the ids of the extracted items of an extraction step. The ids of a resumed step are restored from the checkpoint.
+
+        Parameters
+        ----------
+        label : str
+            Name of the extraction step.
+
+        Returns
+        -------
+        IdSet
+            Ids of the extracted items.
+
+        """
+        if label not in self.extracted_ids:
+            progress = self.get_checkpoint_progress(label)
+            extracted_ids = progress.get("ids")
+            if extracted_ids is None:
+                extracted_ids = IdSet()
+                if "last_id" in progress:
+                    # checkpoint without ids
+                    extracted_ids.add(progress["last_id"])
+            self.extracted_ids[label] = extracted_ids
+        return self.extracted_ids[label]
+
+    def report_missing_ids(self, label: str, expected_ids: typing.Iterable = None) -> list:
+        """
+        report_missing_ids(self, label, expected_ids=None)
+
+        Records the expected ids which were not extracted by an extraction step in the consistency report and
+        logs a warning if ids are missing. Missing ids belong e.g. to deleted items or items which were skipped
+        because the list changed during the extraction.
+
+        Parameters
+        ----------
+        label : str
+            Name of the extraction step.
+        expected_ids : typing.Iterable, default=None
+            Ids which should be extracted. Nothing is checked if None.
+
+        Returns
+        -------
+        list
+            Sorted list of the missing ids.
+
+        """
+        report = self.consistency_report.setdefault(label, {"extracted": len(self.get_extracted_ids(label)), "duplicates": 0, "missing": []})
+        if expected_ids is None:
+            return report["missing"]
+        report["missing"] = self.get_extracted_ids(label).get_missing_ids(expected_ids)
+        if report["missing"]:
+            self.logger.warning(f"{len(report['missing'])} expected {label} were not extracted, e.g. ID: {report['missing'][0]}")
+        return report["missing"]
+
+    def plan_since_windows(self, github_method, since: datetime.datetime = None, state: str = None) -> list:
+        """
+        plan_since_windows(self, github_method, since=None, state=None)
+
+        Splits a listing sorted ascending by updated into windows of at most request_maximum items. The first item
+        of the last page of a window is the since of the next window, so adjacent windows overlap by one page and
+        each window costs one request to plan. A window is split in halves if GitHub refuses its last page
+        with 422 "Unprocessable Entity", e.g. if request_maximum exceeds the pagination limit of the listing.
+
+        Parameters
+        ----------
+        github_method
+            A github method with the parameters since, sort and direction.
+        since : datetime.datetime, default=None
+            Start of the first window, the complete listing if None.
+        state : str, default=None
+            corresponds to the github state of data, allows extracting with state consideration
+
+        Returns
+        -------
+        list
+            Tuples of the since of a window and the number of its pages.
+
+        """
+        windows = []
+        while True:
+            data_list = self.__get_sorted_list(github_method, since, state)
+            first_page = self.get_save_page(data_list, 0)
+            page_count = Core.get_page_count(first_page)
+            window_page_count = max(1, self.request_maximum // len(first_page)) if len(first_page) > 0 else 0
+            if page_count <= window_page_count:
+                windows.append((since, page_count))
+                return windows
+            last_page = self.__get_window_page(data_list, window_page_count - 1)
+            while last_page is None and window_page_count > 1:
+                window_page_count = (window_page_count + 1) // 2
+                last_page = self.__get_window_page(data_list, window_page_count - 1)
+            if not last_page:
+                windows.append((since, window_page_count))
+                return windows
+            windows.append((since, window_page_count))
+            if last_page[0].updated_at != since:
+                since = last_page[0].updated_at
+            elif last_page[-1].updated_at != since:
+                since = last_page[-1].updated_at
+            else:
+                # a window without progress: the items with the same updated_at beyond the window cannot be listed
+                self.logger.warning(f"More than {window_page_count * len(first_page)} items updated at {since}, the following are skipped")
+                since = since + datetime.timedelta(seconds=1)
+
+    def __get_window_page(self, data_list: PaginatedList, page_number: int) -> list:
+        """
+        __get_window_page(self, data_list, page_number)
+
+        Gets one page of a since window savely.
+
+        Parameters
+        ----------
+        data_list : PaginatedList
+            A paginated list as input.
+        page_number : int
+            Page number starting with 0.
+
+        Returns
+        -------
+        list
+            Items of the page or None if the page is refused with 422 "Unprocessable Entity".
+
+        """
+        try:
+            return self.get_save_page(data_list, page_number)
+        except github.GithubException as e:
+            if e.status == 422:
+                return None
+            raise e
+
+    def __extract_since_windows(self, github_method, windows: list, started_at: datetime.datetime, label: str, data_extraction_function, *args, state: str = None, **kwargs) -> None:
+        """
+        __extract_since_windows(self, github_method, windows, started_at, label, data_extraction_function, *args, state=None, **kwargs)
+
+        Extracts the items of since windows whose pages are fetched concurrently. The items are extracted in order,
+        items which are listed in two windows are dropped by the id set of get_extracted_ids. Items which are updated during the extraction
+        can move between the windows, so all items updated since started_at are listed again.
+
+        Parameters
+        ----------
+        github_method
+            A github method to call
+        windows : list
+            Tuples of the since of a window and the number of its pages from plan_since_windows.
+        started_at : datetime.datetime
+            Time of the planning in UTC.
+        label
+            label of data type to extract
+        data_extraction_function
+            An extraction function to call
+        *args
+            Input for the data_extraction_function
+        state : str, default=None
+            corresponds to the github state of data, allows extracting with state consideration
+        **kwargs
+            Optional input for data_extraction_function
+
+        """
+        self.logger.info(f"{label} >= request_maximum ==> {len(windows)} windows are extracted concurrently")
+        extracted_ids = self.get_extracted_ids(label)
+        duplicates = 0
+        pages = self.get_sharded_pages([(self.__get_sorted_list(github_method, window_since, state), page_count) for window_since, page_count in windows])
+        # a minute of tolerance for the clock of GitHub
+        catch_up_list = self.__get_sorted_list(github_method, started_at - datetime.timedelta(minutes=1), state)
+        items = itertools.chain(itertools.chain.from_iterable(pages), self.get_save_items(catch_up_list))
+        for data in self.progress_bar(items, f"{label}: "):
+            if extracted_ids.add(data.id):
+                data_extraction_function(data, *args, **kwargs)
+                self.update_checkpoint(label, data)
+            else:
+                duplicates += 1
+        self.update_checkpoint(label, finished=True)
+        self.consistency_report[label] = {"extracted": len(extracted_ids), "duplicates": duplicates, "missing": []}
+
+    def __get_sorted_list(self, github_method, since: datetime.datetime = None, state: str = None) -> PaginatedList:
+        """
+        __get_sorted_list(self, github_method, since=None, state=None)
+
+        Returns a listing sorted ascending by updated.
+
+        Parameters
+        ----------
+        github_method
+            A github method with the parameters since, sort and direction.
+        since : datetime.datetime, default=None
+            Only items updated at or after since are listed, all items if None.
+        state : str, default=None
+            corresponds to the github state of data, allows extracting with state consideration
+
+        Returns
+        -------
+        PaginatedList
+            Paginated list of the items.
+
+        """
+        kwargs = {"sort": "updated", "direction": "asc"}
+        if since is not None:
+            kwargs["since"] = since
+        if state is not None:
+            kwargs["state"] = state
+        return self.save_api_call(github_method, **kwargs)
+
+    def start_checkpoint(self, params: Params, name: str = None, **lists) -> None:
+        """
+        start_checkpoint(self, params, name=None, **lists)
+
+        Starts the checkpoints of an extraction. If current_dir contains the checkpoint of a stopped extraction
+        with the same name and the same parameters, the lists are restored and the extraction steps continue
+        where they stopped.
+
+        Parameters
+        ----------
+        params : Params
+            Extraction parameters.
+        name : str, default=None
+            Name of the extraction, the name of the class if None.
+        **lists
+            Lists or table writers which collect the extracted rows. They are saved with the checkpoint and restored
+            in place. Segment files of table writers are removed if no checkpoint is restored.
+
+        """
+        if name is None:
+            name = type(self).__name__
+        self.extracted_ids = {}
+        self.consistency_report = {}
+        params_state = Core.__get_params_state(params)
+        self.__checkpoint = {"name": name, "params": params_state, "progress": {}, "lists": lists, "saved": time.time()}
+        checkpoint_file = Path(self.current_dir, Core.CHECKPOINT)
+        checkpoint = None
+        if checkpoint_file.is_file():
+            try:
+                with open(checkpoint_file, "rb") as f:
+                    checkpoint = pickle.load(f)
+            except Exception as e:
+                self.logger.warning(f"Checkpoint {checkpoint_file} is not readable and ignored: {e}")
+        if checkpoint is not None and (checkpoint["name"] != name or checkpoint["params"] != params_state):
+            self.logger.info(f"Checkpoint {checkpoint_file} belongs to another extraction and is ignored")
+            checkpoint = None
+        for key, new_list in lists.items():
+            saved_list = None if checkpoint is None else checkpoint["lists"].get(key)
+            if isinstance(new_list, TableWriter):
+                new_list.restore(saved_list)
+            elif saved_list is not None:
+                new_list[:] = saved_list
+        if checkpoint is None:
+            return
+        self.__checkpoint["progress"] = checkpoint["progress"]
+        self.logger.info(f"{name} are resumed from the checkpoint of {time.ctime(checkpoint['saved'])}")
+
+    def update_checkpoint(self, label: str, data: Any = None, finished: bool = False) -> None:
+        """
+        update_checkpoint(self, label, data=None, finished=False)
+
+        Records the progress of an extraction step and saves the checkpoint if checkpoint_interval seconds
+        are passed since the last save or the step is finished. Does nothing without started checkpoints.
+
+        Parameters
+        ----------
+        label : str
+            Name of the extraction step.
+        data : Any, default=None
+            Last extracted item with id and updated_at, which are used to continue with since.
+        finished : bool, default=False
+            Is the extraction step finished?
+
+        """
+        if self.__checkpoint is None:
+            return
+        progress = self.__checkpoint["progress"].setdefault(label, {})
+        if finished:
+            progress["finished"] = True
+        elif data is not None:
+            progress["since"] = data.updated_at
+            progress["last_id"] = data.id
+            progress["ids"] = self.get_extracted_ids(label)
+        if finished or time.time() - self.__checkpoint["saved"] >= self.checkpoint_interval:
+            # the saved lists have to contain all rows of the recorded progress
+            self.complete_pending_work()
+            self.__checkpoint["saved"] = time.time()
+            self.current_dir.mkdir(parents=True, exist_ok=True)
+            checkpoint_file = Path(self.current_dir, Core.CHECKPOINT)
+            temp_file = checkpoint_file.with_name(checkpoint_file.name + ".tmp")
+            with open(temp_file, "wb") as f:
+                pickle.dump(self.__checkpoint, f)
+            # a killed process leaves the previous checkpoint intact
+            os.replace(temp_file, checkpoint_file)
+
+    def complete_pending_work(self) -> None:
+        """
+        complete_pending_work(self)
+
+        Completes asynchronous extraction work before a checkpoint is saved, so the lists of the checkpoint contain
+        all rows of the recorded progress. Subclasses which extract rows asynchronously override it.
+
+        """
+        return
+
+    def get_checkpoint_progress(self, label: str) -> dict:
+        """
+        get_checkpoint_progress(self, label)
+
+        Returns the recorded progress of an extraction step.
+
+        Parameters
+        ----------
+        label : str
+            Name of the extraction step.
+
+        Returns
+        -------
+        dict
+            Dictionary with finished, since, last_id and the extracted ids or an empty dictionary.
+
+        """
+        if self.__checkpoint is None:
+            return {}
+        return self.__checkpoint["progress"].get(label, {})
+
+    def remove_checkpoint(self) -> None:
+        """
+        remove_checkpoint(self)
+
+        Removes the checkpoint after the extraction is finished.
+
+        """
+        self.__checkpoint = None
+        checkpoint_file = Path(self.current_dir, Core.CHECKPOINT)
+        if checkpoint_file.is_file():
+            checkpoint_file.unlink()
+
+    @staticmethod
+    def upsert_data_frame(old_data_frame: pd.DataFrame, new_data_frame: pd.DataFrame, key: Union[str, list] = "id", sort_by: str = None) -> pd.DataFrame:
+        """
+        upsert_data_frame(old_data_frame, new_data_frame, key="id", sort_by=None)
+
+        Updates and inserts the rows of new_data_frame into old_data_frame by key.
+
+        Parameters
+        ----------
+        old_data_frame : pd.DataFrame
+            Stored rows.
+        new_data_frame : pd.DataFrame
+            Extracted rows, which replace stored rows with the same key.
+        key : str or list, default="id"
+            Column or columns with the unique key of a row.
+        sort_by : str, default=None
+            Column to sort the result by, the order of the rows is kept if None.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the rows of both data frames.
+
+        """
+        if old_data_frame.empty:
+            data_frame = new_data_frame
+        elif new_data_frame.empty:
+            data_frame = old_data_frame
+        else:
+            data_frame = pd.concat([old_data_frame, new_data_frame], ignore_index=True)
+            data_frame = data_frame.drop_duplicates(subset=key, keep="last")
+        if sort_by is not None and sort_by in data_frame:
+            data_frame = data_frame.sort_values(sort_by, kind="stable")
+        return data_frame.reset_index(drop=True)
+
+    @staticmethod
+    def apply_schema(data_frame: pd.DataFrame, schema: dict) -> pd.DataFrame:
+        """
+        apply_schema(data_frame, schema)
+
+        Converts the columns of a data frame to the dtypes of a schema. Missing columns are ignored and
+        columns which are not convertible, e.g. lists in a category column, are not changed.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame to convert, it is not changed.
+        schema : dict
+            Dictionary with the column names as keys and the dtypes as values, e.g. "category", "Int64",
+            "boolean" or "datetime64[ns]".
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the converted columns.
+
+        """
+        converted_data_frame = None
+        for column, dtype in schema.items():
+            if column not in data_frame or str(data_frame[column].dtype) == dtype:
+                continue
+            try:
+                if dtype.startswith("datetime64"):
+                    series = pd.to_datetime(data_frame[column])
+                else:
+                    series = data_frame[column].astype(dtype)
+            except (TypeError, ValueError):
+                continue
+            if converted_data_frame is None:
+                converted_data_frame = data_frame.copy(deep=False)
+            converted_data_frame[column] = series
+        if converted_data_frame is None:
+            return data_frame
+        return converted_data_frame
+
+    @staticmethod
+    def get_link_table(data_frame: pd.DataFrame, key: str, column: str, key_name: str, value_name: str) -> pd.DataFrame:
+        """
+        get_link_table(data_frame, key, column, key_name, value_name)
+
+        Returns a normalized link table of a list column with one row for each item of the lists.
+        Empty lists and missing values have no rows.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame with the list column.
+        key : str
+            Name of the key column of data_frame, e.g. id.
+        column : str
+            Name of the list column of data_frame, e.g. labels.
+        key_name : str
+            Name of the key column of the link table, e.g. issue_id.
+        value_name : str
+            Name of the value column of the link table, e.g. label.
+
+        Returns
+        -------
+        pd.DataFrame
+            Link table with the columns key_name and value_name.
+
+        """
+        if key not in data_frame or column not in data_frame:
+            return pd.DataFrame(columns=[key_name, value_name])
+        link_table = data_frame[[key, column]].explode(column).dropna(subset=[column])
+        return link_table.rename(columns={key: key_name, column: value_name}).reset_index(drop=True)
+
+    @staticmethod
+    def get_schema_memory_usage(data_frame: pd.DataFrame, schema: dict) -> tuple:
+        """
+        get_schema_memory_usage(data_frame, schema)
+
+        Returns the memory usage of a data frame with and without its schema. Without the schema the
+        columns have the dtypes which pandas infers from the extracted rows, mostly object.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame with the dtypes of the schema.
+        schema : dict
+            Dictionary with the column names as keys and the dtypes as values.
+
+        Returns
+        -------
+        tuple
+            Memory usage in bytes without and with the schema.
+
+        """
+        memory_usage = data_frame.memory_usage(index=True, deep=True)
+        inferred_memory_usage = memory_usage.copy()
+        for column in schema:
+            if column in data_frame:
+                series = data_frame[column]
+                values = series.astype(object).where(series.notna(), None).tolist()
+                inferred_memory_usage[column] = pd.Series(values, dtype=None).memory_usage(index=False, deep=True)
+        return int(inferred_memory_usage.sum()), int(memory_usage.sum())
+
+    @staticmethod
+    def __get_params_state(params: Params) -> dict:
+        """
+        __get_params_state(params)
+
+        Returns the values of extraction parameters including their subparameters.
+
+        Parameters
+        ----------
+        params : Params
+            Extraction parameters.
+
+        Returns
+        -------
+        dict
+            Dictionary with the parameter names as keys.
+
+        """
+        params_state = {}
+        for var, value in vars(params).items():
+            if isinstance(value, Core.Params):
+                params_state[var] = Core.__get_params_state(value)
+            else:
+                params_state[var] = value
+        return params_state
          
-    def progress_bar(self, iterable: typing.Iterable, prefix: str = "", size: int = 60) -> None:
+    def progress_bar(self, iterable: typing.Iterable, prefix: str = "", size: int = 60, total: int = None) -> None:
         """
-        progress_bar(self, iterable, prefix="", size=60, file=sys.stdout)
+        progress_bar(self, iterable, prefix="", size=60, total=None)
 
-        Prints out a progress bar.
+        Prints out a progress bar. The progress is reported by progress_reporter at a bounded rate
+        with throughput and ETA, the final state is always reported.
 
         Parameters
         ----------
@@ -812,23 +2033,12 @@ class Core():
             String infront of the progress bar.
         size : int
             Size of the progress bar.
+        total : int, default=None
+            Length of the iterable. If None the length of the iterable is used.
+            Only the number of items is printed for iterables without a length, e.g. streamed pages.
 
         """
-        count = len(iterable)
-        def show(j):
-            x = int(size*j/count)
-            if self.log_level <= logging.INFO:
-                sys.stdout.write("%s[%s%s] %i/%i\r" % (prefix, "#"*x, "."*(size-x), j, count))
-                sys.stdout.flush()     
-            self.logger_no_print.info("%s[%s%s] %i/%i" % (prefix, "#"*x, "."*(size-x), j, count))
-        if count > 0:
-            show(0)
-        for i, item in enumerate(iterable):
-            yield item
-            show(i+1)
-        if self.log_level <= logging.INFO:
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+        yield from self.progress_reporter.track(iterable, prefix, total, size)
 
     def copy_valid_params(self, base_dict: dict ,input_params: dict) -> dict:
         """
@@ -923,11 +2133,16 @@ class Core():
             function(path)
 
     @staticmethod
-    def get_pandas_data_frame(data_dir: Path, filename: str) -> pd.DataFrame:
+    def get_pandas_data_frame(data_dir: Path, filename: str, columns: list = None, filters: list = None) -> pd.DataFrame:
         """
-        get_pandas_data_frame(data_dir, filename)
+        get_pandas_data_frame(data_dir, filename, columns=None, filters=None)
 
         Returns a pandas data frame stored in file, if necessary creates one.
+        The newest file of the table from any storage backend is loaded. Parquet and Feather files
+        only read the selected columns and rows, pickles are filtered after loading. Complete tables
+        are cached in the table cache until the file is changed. The columns and rows of a cached
+        table are selected from the cache. The columns are converted to the dtypes of the schema of
+        the file, e.g. for tables which were saved before the schema was declared.
 
         Parameters
         ----------
@@ -935,6 +2150,11 @@ class Core():
             Path to pandas file.
         filename:str
             Filename.
+        columns : list, default=None
+            Names of the loaded columns, all columns if None.
+        filters : list, default=None
+            Conditions of the loaded rows as tuples (column, operator, value), e.g. [("state", "==", "open"),
+            ("created_at", ">=", "2021-01-01")]. Supported operators are ==, !=, <, <=, >, >=, in and not in.
 
         Returns
         -------
@@ -942,10 +2162,17 @@ class Core():
             Returns pandas data frame stored in file if file exist, otherwise a new data frame object.
 
         """        
-        pd_file = Path(data_dir, filename)
-        if pd_file.is_file():
-            return pd.read_pickle(pd_file)
-        else:
+        pd_file, storage = Storage.find_file(data_dir, filename)
+        if pd_file is None:
             return pd.DataFrame()
+        data_frame = Core.table_cache.get(pd_file)
+        if data_frame is not None:
+            return Storage.filter_data_frame(data_frame, columns, filters)
+        schema = Core.Files.get_schema(filename)
+        if columns is not None or filters:
+            return Core.apply_schema(storage.load(pd_file, columns, filters), schema)
+        data_frame = Core.apply_schema(storage.load(pd_file), schema)
+        Core.table_cache.put(pd_file, data_frame)
+        return data_frame
 
  
\ No newline at end of file
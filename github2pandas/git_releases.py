@@ -1,5 +1,7 @@
+import itertools
 import logging
 from pathlib import Path
+from typing import Union
 import pandas as pd
 # github imports
 from github import GithubObject
@@ -8,6 +10,7 @@ from github.Repository import Repository as GitHubRepository
 from github.GitRelease import GitRelease as GitHubGitRelease
 # github2pandas imports
 from github2pandas.core import Core
+from github2pandas.storage import Storage
 
 class GitReleases(Core):
     """
@@ -20,7 +23,7 @@ class GitReleases(Core):
     
     Methods
     -------
-    __init__(self, github_connection, repo, data_root_dir, request_maximum = 40000, log_level=logging.INFO)
+    __init__(self, github_connection, repo, data_root_dir, request_maximum = 40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
         Initializes git releases object with general information.
     generate_pandas_tables(self, check_for_updates=False)
         Generates pandas tables for git releases data.
@@ -39,14 +42,20 @@ class GitReleases(Core):
             Folder name for this module.
         GIT_RELEASES : str
             Filename of the git releases pandas table.
+        SCHEMAS : dict
+            Dtypes of the columns of the pandas tables.
 
         """
         DATA_DIR = "Releases"
         GIT_RELEASES = "Releases.p"
+        SCHEMAS = {
+            GIT_RELEASES: {"author": "category", "target_commitish": "category", "draft": "boolean", "prerelease": "boolean",
+                "created_at": "datetime64[ns]", "published_at": "datetime64[ns]"}
+        }
 
-    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, data_root_dir, request_maximum = 40000, log_level=logging.INFO)
+        __init__(self, github_connection, repo, data_root_dir, request_maximum = 40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
 
         Initializes git releases object with general information.
 
@@ -62,6 +71,10 @@ class GitReleases(Core):
             Maximum amount of returned informations for a general api call.
         log_level : int
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO    
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object.
 
         Notes
         -----
@@ -76,7 +89,9 @@ class GitReleases(Core):
             data_root_dir,
             GitReleases.Files.DATA_DIR,
             request_maximum=request_maximum,
-            log_level=log_level
+            log_level=log_level,
+            number_of_threads=number_of_threads,
+            storage=storage
         )
 
     @property
@@ -108,22 +123,23 @@ class GitReleases(Core):
         
         """
         git_releases = self.save_api_call(self.repo.get_releases)
-        total_count = self.get_save_total_count(git_releases)
-        if total_count == 0:
+        git_release_pages = self.get_save_pages(git_releases)
+        first_page = next(git_release_pages, [])
+        if len(first_page) == 0:
             return
         if check_for_updates:
             old_git_releases = self.git_releases_df
-            if not self.check_for_updates_paginated(git_releases, total_count, old_git_releases):
+            if not self.check_for_updates_paginated(first_page, len(first_page), old_git_releases):
                 self.logger.info("No new Git Releases information!")
                 return
         git_releases_list = []
-        for i in self.progress_bar(range(total_count), "Git Releases: "):
+        for git_release in self.progress_bar(itertools.chain(first_page, itertools.chain.from_iterable(git_release_pages)), "Git Releases: "):
             # git release data
-            git_release = self.get_save_api_data(git_releases, i)
             git_release_data = self.__extract_git_releases_data(git_release)
             git_releases_list.append(git_release_data)
         git_releases_df = pd.DataFrame(git_releases_list)
         self.save_pandas_data_frame(GitReleases.Files.GIT_RELEASES, git_releases_df)
+        self.user_registry.compact()
     
     def __extract_git_releases_data(self, git_release: GitHubGitRelease) -> dict:
         """
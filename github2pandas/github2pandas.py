@@ -3,6 +3,7 @@ import logging
 import os
 from pathlib import Path
 import numpy
+from typing import Union
 import pandas as pd
 # github imports
 from github.MainClass import Github
@@ -12,6 +13,7 @@ from github2pandas.git_releases import GitReleases
 from github2pandas.issues import Issues
 from github2pandas.pull_requests import PullRequests
 from github2pandas.repository import Repository
+from github2pandas.storage import Storage
 from github2pandas.version import Version
 from github2pandas.workflows import Workflows
 
@@ -24,7 +26,7 @@ class GitHub2Pandas():
     Attributes
     ----------
     __github_token : str
-        Github access token.
+        Github access token, the first string token of the pool of tokens.
     github_connection : Github
         Github object from pygithub.
     data_root_dir : Path 
@@ -33,34 +35,51 @@ class GitHub2Pandas():
         Maximum amount of returned informations for a general api call, default=40000.
     log_level : int
         Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET) 
+    number_of_threads : int
+        Number of threads which fetch pages of a paginated list concurrently, default=1.
+    storage : str or Storage
+        Storage backend of the pandas tables, default="pickle".
+    api_metrics : ApiMetrics
+        Metrics of all requests per module and endpoint, e.g. api_metrics.to_json(file) dumps them as JSON.
+        With api_metrics.profile_fields the requests are attributed to the extracted fields, see api_metrics.get_field_report().
+    lazy_completion : bool
+        Are partial objects completed by additional requests, e.g. for the names of users, default=True.
+        If False only the fetched JSON is read and no hidden request per row is sent.
+    archive_pages : bool
+        Are the raw responses of every extraction archived compressed in its data directory, default=False?
+        The tables can be generated again from the archives by rebuild_tables_from_archive.
     __core : Core
         Core object, contains common information about GitHub2Pandas request.
 
     Methods
     -------
-    __init__(self, github_token, data_root_dir, request_maximum = 40000, log_level=logging.INFO)
+    __init__(self, github_token, data_root_dir, request_maximum = 40000, log_level=logging.INFO, number_of_threads=1, http_cache_size=0, base_url="https://api.github.com", storage="pickle")
         Initializes Github2Pandas object with general informations.
     generate_git_releases_pandas_tables(self, repo)
         Generates git releases pandas tables for given Github repository depending on extraction parameters. 
-    generate_issues_pandas_tables(self, repo, issues_params=Issues.Params())
+    generate_issues_pandas_tables(self, repo, issues_params=Issues.Params(), graphql=False, incremental=False, link_tables=False, timeline=False)
         Generates issues pandas tables for given Github repository depending on extraction parameters.
     generate_pull_requests_pandas_tables(self, repo, pull_requests_params=PullRequests.Params())
         Generates pull requests pandas tables for given Github repository depending on extraction parameters.
     generate_repository_pandas_tables(self, repo, repository_params=Repository.Params())
         Generates repository pandas tables for given Github repository depending on extraction parameters.
-    generate_version_pandas_tables(self, repo, number_of_processes=os.cpu_count())
+    generate_version_pandas_tables(self, repo, number_of_processes=os.cpu_count(), link_tables=False)
         Generates version pandas tables for given Github repository depending on extraction parameters.
-    generate_workflows_pandas_tables(self, repo, workflows_params=Workflows.Params())
+    generate_workflows_pandas_tables(self, repo, workflows_params=Workflows.Params(), link_tables=False)
         Generates workflows pandas tables for given Github repository depending on extraction parameters.
     generate_pandas_tables(self, repo, extraction_params)
         Generates pandas tables for given Github repository depending on extraction parameters.
+    rebuild_tables_from_archive(data_root_dir, repo_full_name, params=Params(), log_level=logging.INFO, storage="pickle")
+        Generates the pandas tables of all archived extractions again without requests to GitHub.
     get_repos(self, whitelist_patterns=None, blacklist_patterns=None)
         Returns repositories corresponding with the pattern in the given lists.
     get_repo(self, repo_owner, repo_name)
         Gets a repository by owner and name.
     save_tables_to_excel(repo_data_dir, filename)
         Converts all pandas tables into one excel file.
-    get_pandas_data_frame(repo_data_dir, data_dir_name, filename)
+    get_memory_report(repo_data_dir)
+        Returns the memory usage of all pandas tables with and without their schemas.
+    get_pandas_data_frame(repo_data_dir, data_dir_name, filename, columns=None, filters=None)
         Returns a pandas data frame stored in file.    
     get_unknown_users(repo_data_dir)
         Get all unknown users from commits.  
@@ -173,22 +192,34 @@ class GitHub2Pandas():
                         files[value.DATA_DIR] = value.to_list()
             return files
 
-    def __init__(self, github_token: str, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    def __init__(self, github_token: Union[str, list], data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, http_cache_size: int = 0, base_url: str = "https://api.github.com", storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_token, data_root_dir, request_maximum = 40000, log_level=logging.INFO)
+        __init__(self, github_token, data_root_dir, request_maximum = 40000, log_level=logging.INFO, number_of_threads=1, http_cache_size=0, base_url="https://api.github.com", storage="pickle")
 
         Initializes Github2Pandas object with general informations.
 
         Parameters
         ----------
-        github_token : str
-            Github access token.
+        github_token : str, Callable or list
+            Github access token, a function which returns a token, e.g. for GitHub App installation tokens, or a pool
+            of tokens and functions. Every request is sent with the token with the most remaining requests.
         data_root_dir : Path
             Data root directory for the repository.
         request_maximum : int, default=40000
             Maxmimum amount of returned informations for a general api call.
         log_level : int
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET) .
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        http_cache_size : int, default=0
+            Maximum size in bytes of the http cache in data_root_dir, e.g. 256*1024**2. Unchanged responses are revalidated
+            with ETags and do not count against the rate limit. The cache stores the response bodies unencrypted on disk.
+            No http cache is used if 0.
+        base_url : str, default="https://api.github.com"
+            Url of the GitHub api, e.g. of a GitHub Enterprise server or of a ReplayServer.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object,
+            e.g. ParquetStorage("zstd"). Tables of other backends are still loaded.
 
         Notes
         -----
@@ -196,13 +227,39 @@ class GitHub2Pandas():
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        self.__github_token = github_token
-        self.github_connection = Github(github_token, per_page=100)
+        if isinstance(github_token, str) or callable(github_token):
+            github_token = [github_token]
+        # empty tokens would send anonymous requests
+        github_tokens = [token for token in github_token if token]
+        if not github_tokens or not all(isinstance(token, str) or callable(token) for token in github_tokens):
+            raise ValueError("A GitHub token, a function which returns a token or a pool of them is required")
+        self.__github_token = next((token for token in github_tokens if isinstance(token, str)), None)
+        self.github_connection = Github(self.__github_token, base_url=base_url, per_page=100)
         data_root_dir.mkdir(parents=True, exist_ok=True)
         self.data_root_dir = data_root_dir
         self.request_maximum = request_maximum
         self.log_level = log_level
-        self.__core = Core(self.github_connection,None,self.data_root_dir,None,log_level=log_level)
+        self.number_of_threads = number_of_threads
+        self.storage = Storage.get_storage(storage)
+        self.__core = Core(self.github_connection,None,self.data_root_dir,None,log_level=log_level,number_of_threads=number_of_threads,github_tokens=github_tokens if len(github_tokens) > 1 or callable(github_tokens[0]) else None,http_cache_size=http_cache_size,storage=self.storage)
+        self.api_metrics = self.__core.api_metrics
+        self.lazy_completion = True
+        self.archive_pages = False
+
+    def __prepare(self, extraction: Core) -> None:
+        """
+        __prepare(self, extraction)
+
+        Passes the extraction options to an extraction object.
+
+        Parameters
+        ----------
+        extraction : Core
+            Object of an extraction, e.g. Issues.
+
+        """
+        extraction.lazy_completion = self.lazy_completion
+        extraction.archive_pages = self.archive_pages
 
     def generate_git_releases_pandas_tables(self, repo: GitHubRepository) -> GitReleases:
         """
@@ -218,23 +275,25 @@ class GitHub2Pandas():
         Returns
         -------
         GitReleases
-            A GitReleases object.
+            A GitReleases object, its api_metrics_summary contains the requests of the extraction.
 
         Notes
         -----
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        git_releases = GitReleases(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level)
+        git_releases = GitReleases(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level,self.number_of_threads,self.storage)
+        self.__prepare(git_releases)
         try:
-            git_releases.generate_pandas_tables()
+            with git_releases.measure_api_calls(), git_releases.archive_api_pages():
+                git_releases.generate_pandas_tables()
         except Exception as e:
             self.__core.logger.error("Error in releases. Releases are not extracted!", exc_info=e)
         return git_releases
 
-    def generate_issues_pandas_tables(self, repo: GitHubRepository, issues_params: Issues.Params = Issues.Params()) -> Issues:
+    def generate_issues_pandas_tables(self, repo: GitHubRepository, issues_params: Issues.Params = Issues.Params(), graphql: bool = False, incremental: bool = False, link_tables: bool = False, timeline: bool = False) -> Issues:
         """
-        generate_issues_pandas_tables(self, repo, issues_params=Issues.Params())
+        generate_issues_pandas_tables(self, repo, issues_params=Issues.Params(), graphql=False, incremental=False, link_tables=False, timeline=False)
 
         Generates issues pandas tables for given Github repository depending on extraction parameters.
 
@@ -244,20 +303,30 @@ class GitHub2Pandas():
             Repository object from pygithub.
         issues_params : Issues.Params, default=Issues.Params()
             Parameters that define what should be extracted.
+        graphql : bool, default=False
+            Extracts the issues with nested comments, reactions and events by GraphQL queries.
+        incremental : bool, default=False
+            Extracts only updated issues, comments and events and updates the stored tables.
+        link_tables : bool, default=False
+            Saves the labels and assignees of the issues additionally as link tables.
+        timeline : bool, default=False
+            Extracts the comments and events of changed issues from their timelines instead of the repository listings.
 
         Returns
         -------
         Issues
-            A Issues object.
+            A Issues object, its api_metrics_summary contains the requests of the extraction.
 
         Notes
         -----
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        issues = Issues(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level)
+        issues = Issues(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level,self.number_of_threads,self.storage)
+        self.__prepare(issues)
         try:
-            issues.generate_pandas_tables(params=issues_params)
+            with issues.measure_api_calls(), issues.archive_api_pages():
+                issues.generate_pandas_tables(params=issues_params, graphql=graphql, incremental=incremental, link_tables=link_tables, timeline=timeline)
         except Exception as e:
             self.__core.logger.error("Error in issues. Issues are not extracted!", exc_info=e)
         return issues
@@ -278,16 +347,18 @@ class GitHub2Pandas():
         Returns
         -------
         PullRequests
-            A PullRequests object.
+            A PullRequests object, its api_metrics_summary contains the requests of the extraction.
 
         Notes
         -----
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        pull_requests = PullRequests(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level)
+        pull_requests = PullRequests(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level,self.number_of_threads,self.storage)
+        self.__prepare(pull_requests)
         try:
-            pull_requests.generate_pandas_tables(params=pull_requests_params)
+            with pull_requests.measure_api_calls(), pull_requests.archive_api_pages():
+                pull_requests.generate_pandas_tables(params=pull_requests_params)
         except Exception as e:
             self.__core.logger.error("Error in pull requests. Pull requests are not extracted!", exc_info=e)
         return pull_requests
@@ -308,23 +379,25 @@ class GitHub2Pandas():
         Returns
         -------
         Repository
-            A Repository object.
+            A Repository object, its api_metrics_summary contains the requests of the extraction.
 
         Notes
         -----
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        repository = Repository(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level)
+        repository = Repository(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level,self.number_of_threads,self.storage)
+        self.__prepare(repository)
         try:
-            repository.generate_pandas_tables(params=repository_params)
+            with repository.measure_api_calls(), repository.archive_api_pages():
+                repository.generate_pandas_tables(params=repository_params)
         except Exception as e:
             self.__core.logger.error("Error in repository. Repository is not extracted!", exc_info=e)
         return repository
 
-    def generate_version_pandas_tables(self, repo: GitHubRepository, number_of_processes: int = os.cpu_count()) -> Version:
+    def generate_version_pandas_tables(self, repo: GitHubRepository, number_of_processes: int = os.cpu_count(), link_tables: bool = False) -> Version:
         """
-        generate_version_pandas_tables(self, repo, number_of_processes=os.cpu_count())
+        generate_version_pandas_tables(self, repo, number_of_processes=os.cpu_count(), link_tables=False)
 
         Generates version pandas tables for given Github repository depending on extraction parameters.
 
@@ -334,28 +407,32 @@ class GitHub2Pandas():
             Repository object from pygithub.
         number_of_processes : int, default=os.cpu_count()
             Number of processes to use
+        link_tables : bool, default=False
+            Saves the branches of the commits additionally as link table.
 
         Returns
         -------
         Version
-            A Version object.
+            A Version object, its api_metrics_summary contains the requests of the extraction.
 
         Notes
         -----
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        version = Version(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level, number_of_processes)
+        version = Version(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level, number_of_processes, self.number_of_threads,self.storage)
+        self.__prepare(version)
         try:
             version.clone_repository(self.__github_token)
-            version.generate_pandas_tables()
+            with version.measure_api_calls():
+                version.generate_pandas_tables(link_tables=link_tables)
         except Exception as e:
             self.__core.logger.error("Error in version. Version are not extracted!", exc_info=e)
         return version
 
-    def generate_workflows_pandas_tables(self, repo: GitHubRepository, workflows_params: Workflows.Params = Workflows.Params()) -> Workflows:
+    def generate_workflows_pandas_tables(self, repo: GitHubRepository, workflows_params: Workflows.Params = Workflows.Params(), link_tables: bool = False) -> Workflows:
         """
-        generate_workflows_pandas_tables(self, repo, workflows_params=Workflows.Params())
+        generate_workflows_pandas_tables(self, repo, workflows_params=Workflows.Params(), link_tables=False)
 
         Generates workflows pandas tables for given Github repository depending on extraction parameters.
 
@@ -365,20 +442,24 @@ class GitHub2Pandas():
             Repository object from pygithub.
         workflows_params : Workflows.Params, default=Workflows.Params()
             Parameters that define what should be extracted.
+        link_tables : bool, default=False
+            Saves the pull requests of the runs additionally as link table.
 
         Returns
         -------
         Workflows
-            A Workflows object.
+            A Workflows object, its api_metrics_summary contains the requests of the extraction.
 
         Notes
         -----
             PyGithub Repository object structure: https://pygithub.readthedocs.io/en/latest/github_objects/Repository.html
 
         """
-        workflows = Workflows(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level)
+        workflows = Workflows(self.github_connection,repo,self.data_root_dir,self.request_maximum,self.log_level,self.number_of_threads,self.storage)
+        self.__prepare(workflows)
         try:
-            workflows.generate_pandas_tables(params=workflows_params)
+            with workflows.measure_api_calls(), workflows.archive_api_pages():
+                workflows.generate_pandas_tables(params=workflows_params, link_tables=link_tables)
         except Exception as e:
             self.__core.logger.error("Error in workflows. Workflows are not extracted!", exc_info=e)
         return workflows
@@ -410,6 +491,48 @@ class GitHub2Pandas():
         if params.workflows_params.has_true():
             workflows = self.generate_workflows_pandas_tables(repo)
      
+    @staticmethod
+    def rebuild_tables_from_archive(data_root_dir: Path, repo_full_name: str, params: Params = Params(), log_level: int = logging.INFO, storage: Union[str, Storage] = "pickle") -> list:
+        """
+        rebuild_tables_from_archive(data_root_dir, repo_full_name, params=Params(), log_level=logging.INFO, storage="pickle")
+
+        Generates the pandas tables of all archived extractions of a repository again without requests to GitHub,
+        e.g. after a new column was added to an extractor. The archives are written if archive_pages is True.
+        Version is not archived, because it is extracted from the git repository.
+
+        Parameters
+        ----------
+        data_root_dir : Path
+            Data root directory of the repositories.
+        repo_full_name : str
+            Full name of the repository, e.g. "owner/repo".
+        params : Params, default=Params()
+            Parameters that define what should be extracted.
+        log_level : int, default=logging.INFO
+            Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET).
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables.
+
+        Returns
+        -------
+        list
+            Objects of the rebuilt extractions.
+
+        """
+        # the pull requests are extracted with the tables of the issues
+        extractions = [
+            (GitReleases, params.git_releases, {}),
+            (Issues, params.issues_params.has_true(), {"params": params.issues_params}),
+            (PullRequests, params.pull_requests_params.has_true(), {"params": params.pull_requests_params}),
+            (Repository, params.repository_params.has_true(), {"params": params.repository_params}),
+            (Workflows, params.workflows_params.has_true(), {"params": params.workflows_params})
+        ]
+        rebuilt = []
+        for extraction_class, extract, kwargs in extractions:
+            if extract and Path(data_root_dir, repo_full_name, extraction_class.Files.DATA_DIR, Core.ARCHIVE).is_file():
+                rebuilt.append(extraction_class.rebuild_tables_from_archive(data_root_dir, repo_full_name, log_level=log_level, storage=storage, **kwargs))
+        return rebuilt
+
     def get_repos(self, whitelist_patterns: list = None, blacklist_patterns: list = None) -> list:
         """
         get_repos(self, whitelist_patterns=None, blacklist_patterns=None)
@@ -437,9 +560,7 @@ class GitHub2Pandas():
         relevant_repos = []
         user = self.__core.save_api_call(self.github_connection.get_user)
         repos = self.__core.save_api_call(user.get_repos)
-        repo_total_count = self.__core.get_save_total_count(repos)
-        for i in self.__core.progress_bar(range(repo_total_count), "Repositories:   "):
-            repo = self.__core.get_save_api_data(repos, i)
+        for repo in self.__core.progress_bar(self.__core.get_save_items(repos), "Repositories:   "):
             whitelist_pass = False
             if whitelist_patterns == [] or whitelist_patterns == None:
                 whitelist_pass = True
@@ -520,11 +641,50 @@ class GitHub2Pandas():
         writer.save()
 
     @staticmethod
-    def get_pandas_data_frame(repo_data_dir: Path, data_dir_name: str,  filename: str) -> pd.DataFrame:
+    def get_memory_report(repo_data_dir: Path) -> pd.DataFrame:
+        """
+        get_memory_report(repo_data_dir)
+
+        Returns the memory usage of all pandas tables with and without their schemas.
+
+        Parameters
+        ----------
+        repo_data_dir : Path
+            Path to repository
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with the columns table, rows, object_bytes (memory usage with the dtypes which pandas infers
+            from the extracted rows), schema_bytes (memory usage with the schema) and saved_bytes.
+
+        """
+        report = []
+        for folder, files in GitHub2Pandas.Files.to_dict().items():
+            for file in files:
+                schema = Core.Files.get_schema(file)
+                if not file.endswith(".p") or not schema:
+                    continue
+                df = GitHub2Pandas.get_pandas_data_frame(repo_data_dir, folder, file)
+                if df.empty:
+                    continue
+                object_bytes, schema_bytes = Core.get_schema_memory_usage(df, schema)
+                report.append({
+                    "table": f"{folder}/{file}",
+                    "rows": len(df),
+                    "object_bytes": object_bytes,
+                    "schema_bytes": schema_bytes,
+                    "saved_bytes": object_bytes - schema_bytes
+                })
+        return pd.DataFrame(report, columns=["table", "rows", "object_bytes", "schema_bytes", "saved_bytes"])
+
+    @staticmethod
+    def get_pandas_data_frame(repo_data_dir: Path, data_dir_name: str,  filename: str, columns: list = None, filters: list = None) -> pd.DataFrame:
         """
-        get_pandas_data_frame(repo_data_dir, data_dir_name, filename)
+        get_pandas_data_frame(repo_data_dir, data_dir_name, filename, columns=None, filters=None)
 
         Returns a pandas data frame stored in file, if necessary creates one.
+        Only the selected columns and rows are loaded, see Core.get_pandas_data_frame.
 
         Parameters
         ----------
@@ -534,6 +694,10 @@ class GitHub2Pandas():
             Name of a data directory
         filename : str
             Filename
+        columns : list, default=None
+            Names of the loaded columns, all columns if None.
+        filters : list, default=None
+            Conditions of the loaded rows as tuples (column, operator, value), e.g. ("state", "==", "open").
 
         Returns
         -------
@@ -541,7 +705,7 @@ class GitHub2Pandas():
             Returns pandas data frame stored in file if file exist, otherwise a new data frame object.
 
         """
-        return Core.get_pandas_data_frame(Path(repo_data_dir,data_dir_name), filename)
+        return Core.get_pandas_data_frame(Path(repo_data_dir,data_dir_name), filename, columns, filters)
     
     @staticmethod
     def get_unknown_users(repo_data_dir: str):
@@ -561,7 +725,7 @@ class GitHub2Pandas():
             List of unknown user names
         
         """
-        pd_commits = Version.get_pandas_data_frame(Path(repo_data_dir,Version.Files.DATA_DIR), Version.Files.COMMITS)
+        pd_commits = Version.get_pandas_data_frame(Path(repo_data_dir,Version.Files.DATA_DIR), Version.Files.COMMITS, columns=["unknown_user"])
         if "unknown_user" in pd_commits:
             unknown_user_commits = pd_commits.loc[pd_commits.unknown_user.notna()]
             unknown_users = unknown_user_commits.unknown_user.unique()
@@ -584,12 +748,16 @@ class GitHub2Pandas():
             A complete new user with uuid will be generated.
 
         """
-        core = Core(None,None,repo_data_dir,None)
+        # the commits are saved with the storage backend of the existing file
+        commits_file, storage = Storage.find_file(Path(repo_data_dir,Version.Files.DATA_DIR), Version.Files.COMMITS)
+        core = Core(None,None,repo_data_dir,None,storage=storage if storage is not None else "pickle")
         pd_commits = Version.get_pandas_data_frame(Path(repo_data_dir,Version.Files.DATA_DIR), Version.Files.COMMITS)
         if "unknown_user" in pd_commits:
+            # the new uuids are no categories of the loaded columns
+            pd_commits = pd_commits.astype({column: object for column in ["author", "committer", "unknown_user"] if column in pd_commits})
             unknown_users = pd_commits.unknown_user.unique()
             if unknown_user_name in unknown_users:
-                users = Core.get_pandas_data_frame(repo_data_dir, Core.UserFiles.USERS)
+                users = core.user_registry.users_df
                 p_user = users.loc[users.anonym_uuid == uuid]
                 new_uuid = None
                 if not p_user.empty:
@@ -602,7 +770,7 @@ class GitHub2Pandas():
                     if not unknown_user_name in alias:
                         alias.append(unknown_user_name)
                     users.loc[users.anonym_uuid == uuid, 'alias'] = alias
-                    core.save_pandas_data_frame(Core.UserFiles.USERS, users)
+                    core.user_registry.save(users)
                     new_uuid = user["anonym_uuid"]
                 else:
                     class UserData:
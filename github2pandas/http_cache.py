@@ -0,0 +1,278 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Union
+# github imports
+from github.MainClass import Github
+# github2pandas imports
+from github2pandas.connection import Connection, ConnectionHook, Request, Response
+
+class HttpCache(ConnectionHook):
+    """
+    Connection hook which caches GET responses on disk and revalidates them with conditional requests.
+
+    Responses with ETag or Last-Modified header are stored in a sqlite database. A cached url is requested
+    with If-None-Match or If-Modified-Since. GitHub answers unchanged resources with 304 Not Modified, which
+    does not count against the rate limit, and the cached response is used instead. The least recently used
+    responses are removed if the cache exceeds max_size.
+
+    Attributes
+    ----------
+    CACHE_DB : str
+        Filename of the sqlite database.
+    db_file : Path
+        Path to the sqlite database.
+    max_size : int
+        Maximum size of all cached bodies in bytes.
+    hits : int
+        Number of responses served from the cache.
+    misses : int
+        Number of GET requests which were not served from the cache.
+
+    Methods
+    -------
+    install(github_connection, repo_data_root_dir, max_size=256*1024**2)
+        Returns the http cache of a Github object and installs one if necessary.
+    __init__(self, db_file, max_size=256*1024**2)
+        Initializes the http cache.
+    get_key(request)
+        Returns the cache key of a request.
+    before_request(self, request)
+        Adds the conditional headers of a cached response.
+    after_response(self, request, response)
+        Stores new responses and replaces 304 responses by the cached response.
+    get_size(self)
+        Returns the size of all cached bodies in bytes.
+    clear(self)
+        Removes all cached responses.
+
+    """
+    CACHE_DB = "HttpCache.db"
+    __install_lock = threading.Lock()
+
+    @staticmethod
+    def install(github_connection: Github, repo_data_root_dir: Path, max_size: int = 256*1024**2) -> "HttpCache":
+        """
+        install(github_connection, repo_data_root_dir, max_size=256*1024**2)
+
+        Returns the http cache of a Github object and installs one if necessary.
+
+        Parameters
+        ----------
+        github_connection : Github
+            Github object from pygithub.
+        repo_data_root_dir : Path
+            Data root directory, contains the sqlite database.
+        max_size : int, default=256*1024**2
+            Maximum size of all cached bodies in bytes.
+
+        Returns
+        -------
+        HttpCache
+            Http cache of the Github object.
+
+        """
+        connection = Connection.install(github_connection)
+        with HttpCache.__install_lock:
+            http_cache = connection.get_hook(HttpCache)
+            if http_cache is None:
+                http_cache = connection.add_hook(HttpCache(Path(repo_data_root_dir, HttpCache.CACHE_DB), max_size))
+        return http_cache
+
+    def __init__(self, db_file: Path, max_size: int = 256*1024**2) -> None:
+        """
+        __init__(self, db_file, max_size=256*1024**2)
+
+        Initializes the http cache.
+
+        Parameters
+        ----------
+        db_file : Path
+            Path to the sqlite database.
+        max_size : int, default=256*1024**2
+            Maximum size of all cached bodies in bytes.
+
+        """
+        self.db_file = Path(db_file)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.__db = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.__db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "headers TEXT, body TEXT, size INTEGER, last_access REAL)"
+        )
+        self.__db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self.__db.commit()
+        self.__size = self.__db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def get_key(request: Request) -> str:
+        """
+        get_key(request)
+
+        Returns the cache key of a request. Responses depend on the permissions of the token, so the key contains
+        a hash of the Authorization header and a response is never served to a request with another token.
+
+        Parameters
+        ----------
+        request : Request
+            Request to send.
+
+        Returns
+        -------
+        str
+            Url, Accept header and hash of the Authorization header of the request.
+
+        """
+        accept = next((value for key, value in request.headers.items() if key.lower() == "accept"), "")
+        authorization = next((value for key, value in request.headers.items() if key.lower() == "authorization"), "")
+        token_hash = hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16] if authorization else ""
+        return f"{request.url} {accept} {token_hash}"
+
+    def before_request(self, request: Request) -> Union[Response, None]:
+        """
+        before_request(self, request)
+
+        Adds the conditional headers of a cached response.
+
+        Parameters
+        ----------
+        request : Request
+            Request to send.
+
+        Returns
+        -------
+        None
+            The request is always sent.
+
+        """
+        if request.verb != "GET":
+            return None
+        key = HttpCache.get_key(request)
+        with self.__lock:
+            row = self.__db.execute("SELECT etag, last_modified FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        etag, last_modified = row
+        if etag:
+            request.headers["If-None-Match"] = etag
+        if last_modified:
+            request.headers["If-Modified-Since"] = last_modified
+        request.cache_key = key
+        return None
+
+    def after_response(self, request: Request, response: Response) -> Union[Response, None]:
+        """
+        after_response(self, request, response)
+
+        Stores new responses and replaces 304 responses by the cached response.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        Returns
+        -------
+        Response
+            The received or the cached response.
+
+        """
+        if request.verb != "GET":
+            return response
+        headers = {key.lower(): value for key, value in response.getheaders()}
+        if response.status == 304 and hasattr(request, "cache_key"):
+            with self.__lock:
+                row = self.__db.execute("SELECT headers, body FROM responses WHERE key = ?", (request.cache_key,)).fetchone()
+                if row is not None:
+                    self.__db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), request.cache_key))
+                    self.__db.commit()
+                    self.hits += 1
+            if row is None:
+                # removed since the request was sent, the request is sent again without condition
+                request.headers.pop("If-None-Match", None)
+                request.headers.pop("If-Modified-Since", None)
+                del request.cache_key
+                return None
+            cached_headers = json.loads(row[0])
+            # e.g. the rate limit headers of the new response are up to date
+            cached_headers.update({key: value for key, value in headers.items() if key not in ["content-length", "content-type"]})
+            request.cache_hit = True
+            return Response(200, cached_headers, row[1])
+        with self.__lock:
+            self.misses += 1
+        if response.status == 200 and ("etag" in headers or "last-modified" in headers):
+            self.__store(HttpCache.get_key(request), headers, response.read())
+        return response
+
+    def get_size(self) -> int:
+        """
+        get_size(self)
+
+        Returns the size of all cached bodies in bytes.
+
+        Returns
+        -------
+        int
+            Size of all cached bodies in bytes.
+
+        """
+        with self.__lock:
+            return self.__size
+
+    def clear(self) -> None:
+        """
+        clear(self)
+
+        Removes all cached responses.
+
+        """
+        with self.__lock:
+            self.__db.execute("DELETE FROM responses")
+            self.__db.commit()
+            self.__size = 0
+
+    def __store(self, key: str, headers: dict, body: str) -> None:
+        """
+        __store(self, key, headers, body)
+
+        Stores a response and removes the least recently used responses if the cache is too large.
+
+        Parameters
+        ----------
+        key : str
+            Cache key of the request.
+        headers : dict
+            Headers of the response with lower case keys.
+        body : str
+            Body of the response.
+
+        """
+        size = len(body.encode("utf-8"))
+        if size > self.max_size:
+            return
+        with self.__lock:
+            row = self.__db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.__size -= row[0]
+            self.__db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, headers.get("etag"), headers.get("last-modified"), json.dumps(headers), body, size, time.time())
+            )
+            self.__size += size
+            while self.__size > self.max_size:
+                oldest = self.__db.execute("SELECT key, size FROM responses ORDER BY last_access LIMIT 100").fetchall()
+                for oldest_key, oldest_size in oldest:
+                    self.__db.execute("DELETE FROM responses WHERE key = ?", (oldest_key,))
+                    self.__size -= oldest_size
+                    if self.__size <= self.max_size:
+                        break
+            self.__db.commit()
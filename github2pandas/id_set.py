@@ -0,0 +1,167 @@
+import bisect
+from array import array
+from typing import Iterable, Iterator
+
+class IdSet():
+    """
+    Compact set of the non-negative integer ids of the extracted items, e.g. to drop items which are listed twice.
+
+    The ids are split into chunks of 65536 ids by their high bits. The low bits of a chunk are stored in a sorted
+    array of 2 bytes per id or in a bitmap of 8 KiB if the chunk contains more than ARRAY_MAXIMUM ids. A set of a
+    million ids of one repository needs a few MB instead of about 60 MB of a python set. Adding and looking up an
+    id takes constant time.
+
+    Attributes
+    ----------
+    CHUNK_BITS : int
+        Number of low bits of an id which are stored in a chunk.
+    ARRAY_MAXIMUM : int
+        Maximum number of ids of a chunk which is stored as sorted array.
+
+    Methods
+    -------
+    __init__(self, ids=())
+        Initializes the id set.
+    add(self, id)
+        Adds an id.
+    update(self, ids)
+        Adds several ids.
+    get_missing_ids(self, expected_ids)
+        Returns the expected ids which are not in the set.
+    get_memory_usage(self)
+        Returns the number of bytes of the chunks.
+
+    """
+    CHUNK_BITS = 16
+    ARRAY_MAXIMUM = 4096
+
+    def __init__(self, ids: Iterable[int] = ()) -> None:
+        """
+        __init__(self, ids=())
+
+        Initializes the id set.
+
+        Parameters
+        ----------
+        ids : Iterable[int], default=()
+            Initial ids of the set.
+
+        """
+        self.__chunks = {}
+        self.__length = 0
+        self.update(ids)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __contains__(self, id: int) -> bool:
+        chunk = self.__chunks.get(id >> IdSet.CHUNK_BITS)
+        if chunk is None:
+            return False
+        low = id & ((1 << IdSet.CHUNK_BITS) - 1)
+        if isinstance(chunk, bytearray):
+            return chunk[low >> 3] >> (low & 7) & 1 == 1
+        index = bisect.bisect_left(chunk, low)
+        return index < len(chunk) and chunk[index] == low
+
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self.__chunks):
+            chunk = self.__chunks[high]
+            base = high << IdSet.CHUNK_BITS
+            if isinstance(chunk, bytearray):
+                for index, byte in enumerate(chunk):
+                    if byte:
+                        for bit in range(8):
+                            if byte >> bit & 1:
+                                yield base + (index << 3) + bit
+            else:
+                for low in chunk:
+                    yield base + low
+
+    def add(self, id: int) -> bool:
+        """
+        add(self, id)
+
+        Adds an id. A chunk is converted to a bitmap if it contains more than ARRAY_MAXIMUM ids.
+
+        Parameters
+        ----------
+        id : int
+            Non-negative integer id.
+
+        Returns
+        -------
+        bool
+            True if the id is new, False if it was already in the set.
+
+        """
+        high = id >> IdSet.CHUNK_BITS
+        low = id & ((1 << IdSet.CHUNK_BITS) - 1)
+        chunk = self.__chunks.get(high)
+        if chunk is None:
+            chunk = self.__chunks[high] = array("H")
+        if isinstance(chunk, bytearray):
+            mask = 1 << (low & 7)
+            if chunk[low >> 3] & mask:
+                return False
+            chunk[low >> 3] |= mask
+        else:
+            index = bisect.bisect_left(chunk, low)
+            if index < len(chunk) and chunk[index] == low:
+                return False
+            chunk.insert(index, low)
+            if len(chunk) > IdSet.ARRAY_MAXIMUM:
+                bitmap = bytearray(1 << (IdSet.CHUNK_BITS - 3))
+                for value in chunk:
+                    bitmap[value >> 3] |= 1 << (value & 7)
+                self.__chunks[high] = bitmap
+        self.__length += 1
+        return True
+
+    def update(self, ids: Iterable[int]) -> None:
+        """
+        update(self, ids)
+
+        Adds several ids.
+
+        Parameters
+        ----------
+        ids : Iterable[int]
+            Non-negative integer ids.
+
+        """
+        for id in ids:
+            self.add(int(id))
+
+    def get_missing_ids(self, expected_ids: Iterable[int]) -> list:
+        """
+        get_missing_ids(self, expected_ids)
+
+        Returns the expected ids which are not in the set.
+
+        Parameters
+        ----------
+        expected_ids : Iterable[int]
+            Ids which should be in the set.
+
+        Returns
+        -------
+        list
+            Sorted list of the missing ids.
+
+        """
+        return sorted({int(id) for id in expected_ids if int(id) not in self})
+
+    def get_memory_usage(self) -> int:
+        """
+        get_memory_usage(self)
+
+        Returns the number of bytes of the chunks without the overhead of the python objects.
+
+        Returns
+        -------
+        int
+            Number of bytes.
+
+        """
+        return sum(len(chunk) if isinstance(chunk, bytearray) else len(chunk) * chunk.itemsize for chunk in self.__chunks.values())
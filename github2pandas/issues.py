@@ -1,4 +1,11 @@
+import itertools
 import logging
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Iterator, Union
 from pandas import DataFrame
 import pandas as pd
 from pathlib import Path
@@ -9,8 +16,12 @@ from github.Repository import Repository as GitHubRepository
 from github.Issue import Issue as GitHubIssue
 from github.IssueComment import IssueComment as GitHubIssueComment
 from github.IssueEvent import IssueEvent as GitHubIssueEvent
+from github.NamedUser import NamedUser as GitHubNamedUser
+from github.TimelineEvent import TimelineEvent as GitHubTimelineEvent
+from github.PaginatedList import PaginatedList
 # github2pandas imports
 from github2pandas.core import Core
+from github2pandas.storage import Storage
 
 class Issues(Core):
     """
@@ -26,23 +37,61 @@ class Issues(Core):
         Pandas DataFrame object with issue events data.
     reactions_df : DataFrame
         Pandas DataFrame object with issue reactions data.
+    reaction_counts_df : DataFrame
+        Pandas DataFrame object with the reaction counts of issues and comments.
+    issue_labels_df : DataFrame
+        Pandas DataFrame object with the labels of the issues.
+    issue_assignees_df : DataFrame
+        Pandas DataFrame object with the assignees of the issues.
 
     Methods
     -------
-    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
         Initializes Issues object with general information.
-    generate_pandas_tables(self, check_for_updates=False, extraction_params=Params())
+    generate_pandas_tables(self, check_for_updates=False, params=Params(), graphql=False, incremental=False, link_tables=False, timeline=False)
         Extracts the issues from a repository.
-    extract_issue(self, data, params, events_overflow)
+    extract_issue(self, data, params, events_overflow, timeline=False)
         Extracts the issue.
     extract_comment(self, data, params)
         Extracts the comments from issues.
+    __extract_reactions(self, data, parent_name, params)
+        Extracts the reaction counts and reactions of an issue or comment.
+    complete_pending_work(self)
+        Merges the concurrently fetched issue events in issue order.
+    __extract_issue_events(self, issue)
+        Extracts all events of one issue.
     __extract_issue_data(self, issue)
         Extracts general data of one issue.
     __extract_comment_data(self, comment)
         Extracts data of one issue comment.
     __extract_event_data(self, event, issue_id=None)
         Extracts data of one issue event.
+    __extract_timeline(self, issue, params)
+        Extracts the comments and events of one issue from its timeline.
+    __extract_timeline_item_data(self, item, issue)
+        Extracts the data of one timeline item as comment or event.
+    __get_timeline_user(item, user)
+        Returns a user of the JSON of a timeline item as user object.
+    __get_timeline_issues(self, issues_df)
+        Returns the issues whose timeline was extracted.
+    __get_updated_list(self, github_method, old_data_frame, state=None)
+        Returns the list of items updated since the last extraction.
+    __extract_graphql(self, params)
+        Extracts issues and pull requests with nested comments, reactions and events by GraphQL queries.
+    __extract_graphql_issue(self, issue, params)
+        Extracts one issue node of a GraphQL response.
+    __extract_graphql_reaction_data(self, reaction, parent_id, parent_name)
+        Extracts the data of one reaction node.
+    __get_graphql_connections(self, typename, params)
+        Returns the nested connections of a GraphQL type.
+    __get_graphql_fields(self, typename, params)
+        Returns the queried fields of a GraphQL type.
+    __get_graphql_nodes(self, parent, connection_name, params)
+        Yields all nodes of a nested GraphQL connection.
+    __get_graphql_user(user)
+        Returns an actor node as user object.
+    __get_graphql_datetime(value)
+        Returns a GraphQL DateTime as datetime.
     
     """
     class Params(Core.Params):
@@ -51,13 +100,13 @@ class Issues(Core):
 
         Methods
         -------
-        __init__(self, issues, reactions, events, comments)
+        __init__(self, issues, reactions, events, comments, reaction_counts)
             Initializes all parameters with a default.
         
         """
-        def __init__(self, issues: bool = True, reactions: bool = False, events: bool = True, comments: bool = True) -> None:
+        def __init__(self, issues: bool = True, reactions: bool = False, events: bool = True, comments: bool = True, reaction_counts: bool = False) -> None:
             """
-            __init__(self, issues, reactions, events, comments)
+            __init__(self, issues, reactions, events, comments, reaction_counts)
        
             Initializes all parameters with a default.
 
@@ -71,12 +120,17 @@ class Issues(Core):
                 Extract events of issues?
             comments : bool, default=True
                 Extract comments of issues?
+            reaction_counts : bool, default=False
+                Extract the reaction counts of issues and comments from their reaction summaries without additional requests?
+                With reactions the reactions are then only requested for issues and comments whose counts differ from the
+                stored reactions.
             
             """
             self.issues = issues
             self.reactions = reactions
             self.events = events
             self.comments = comments
+            self.reaction_counts = reaction_counts
     
     class Files(Core.Files):
         """
@@ -94,6 +148,14 @@ class Issues(Core):
             Filename of the issues reactions pandas table.
         EVENTS : str
             Filename of the issues events pandas table.
+        ISSUES_REACTION_COUNTS : str
+            Filename of the reaction counts pandas table of issues and comments.
+        ISSUE_LABELS : str
+            Filename of the issue labels link table.
+        ISSUE_ASSIGNEES : str
+            Filename of the issue assignees link table.
+        SCHEMAS : dict
+            Dtypes of the columns of the pandas tables.
 
         """
         DATA_DIR = "Issues"
@@ -101,10 +163,80 @@ class Issues(Core):
         COMMENTS = "Comments.p"
         ISSUES_REACTIONS = "IssuesReactions.p"
         EVENTS = "Events.p"
+        ISSUES_REACTION_COUNTS = "IssuesReactionCounts.p"
+        ISSUE_LABELS = "IssueLabels.p"
+        ISSUE_ASSIGNEES = "IssueAssignees.p"
+        SCHEMAS = {
+            ISSUES: {"number": "Int64", "state": "category", "author": "category", "closed_by": "category", "locked": "boolean",
+                "active_lock_reason": "category", "comments": "Int64", "is_pull_request": "boolean",
+                "created_at": "datetime64[ns]", "updated_at": "datetime64[ns]", "closed_at": "datetime64[ns]"},
+            COMMENTS: {"author": "category", "issue_url": "category", "created_at": "datetime64[ns]", "updated_at": "datetime64[ns]"},
+            ISSUES_REACTIONS: {"parent_id": "Int64", "parent_name": "category", "content": "category", "author": "category",
+                "created_at": "datetime64[ns]"},
+            EVENTS: {"issue_id": "Int64", "event": "category", "author": "category", "assignee": "category", "assigner": "category",
+                "label": "category", "source_issue_id": "Int64", "review_state": "category", "created_at": "datetime64[ns]"},
+            ISSUES_REACTION_COUNTS: dict({"parent_id": "Int64", "parent_name": "category", "total_count": "Int64"},
+                **{content: "Int64" for content in Core.REACTION_CONTENTS}),
+            ISSUE_LABELS: {"label": "category"},
+            ISSUE_ASSIGNEES: {"assignee": "category"}
+        }
 
-    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    # GraphQL queries
+    # email is only queried for users, the nullability differs for other actors
+    __GRAPHQL_USER = "fragment user on Actor { login ... on User { id name email } ... on Bot { id } ... on Organization { id name } ... on Mannequin { id } }"
+    __GRAPHQL_FIELDS = {
+        "Issue": "__typename id databaseId number title body state locked activeLockReason createdAt updatedAt closedAt author { ...user } commentCount: comments { totalCount }",
+        "IssueComment": "__typename id databaseId body createdAt updatedAt author { ...user }",
+        "Label": "name",
+        "Reaction": "databaseId content createdAt user { ...user }",
+        "User": "...user"
+    }
+    __GRAPHQL_FIELDS["PullRequest"] = __GRAPHQL_FIELDS["Issue"]
+    # timeline items of issues with additional fields
+    __GRAPHQL_ISSUE_EVENTS = {
+        "AssignedEvent": "assignee { ...user }",
+        "ClosedEvent": "closer { ... on Commit { oid } }",
+        "ConvertedNoteToIssueEvent": "",
+        "DemilestonedEvent": "",
+        "LabeledEvent": "label { name }",
+        "LockedEvent": "",
+        "MarkedAsDuplicateEvent": "",
+        "MentionedEvent": "",
+        "MilestonedEvent": "",
+        "PinnedEvent": "",
+        "ReferencedEvent": "commit { oid }",
+        "RenamedTitleEvent": "",
+        "ReopenedEvent": "",
+        "SubscribedEvent": "",
+        "TransferredEvent": "",
+        "UnassignedEvent": "assignee { ...user }",
+        "UnlabeledEvent": "label { name }",
+        "UnlockedEvent": "",
+        "UnmarkedAsDuplicateEvent": "",
+        "UnpinnedEvent": "",
+        "UnsubscribedEvent": ""
+    }
+    # timeline items of pull requests with additional fields
+    __GRAPHQL_PULL_REQUEST_EVENTS = dict(__GRAPHQL_ISSUE_EVENTS, **{
+        "ConvertToDraftEvent": "",
+        "HeadRefDeletedEvent": "",
+        "HeadRefForcePushedEvent": "",
+        "HeadRefRestoredEvent": "",
+        "MergedEvent": "commit { oid }",
+        "ReadyForReviewEvent": "",
+        "ReviewDismissedEvent": "",
+        "ReviewRequestRemovedEvent": "",
+        "ReviewRequestedEvent": ""
+    })
+    # timeline items which are extracted by other listings
+    __TIMELINE_SKIPPED_EVENTS = ["line-commented", "commit-commented"]
+    # GraphQL enums => REST values
+    __GRAPHQL_LOCK_REASONS = {"OFF_TOPIC": "off-topic", "TOO_HEATED": "too heated", "RESOLVED": "resolved", "SPAM": "spam"}
+    __GRAPHQL_REACTIONS = {"THUMBS_UP": "+1", "THUMBS_DOWN": "-1", "LAUGH": "laugh", "HOORAY": "hooray", "CONFUSED": "confused", "HEART": "heart", "ROCKET": "rocket", "EYES": "eyes"}
+
+    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
 
         Initializes Issues object with general information.
 
@@ -120,6 +252,10 @@ class Issues(Core):
             Maximum amount of returned informations for a general api call.
         log_level : int, default=logging.INFO
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO    
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object.
            
 
         Notes
@@ -135,8 +271,12 @@ class Issues(Core):
             data_root_dir,
             Issues.Files.DATA_DIR,
             request_maximum=request_maximum,
-            log_level=log_level
+            log_level=log_level,
+            number_of_threads=number_of_threads,
+            storage=storage
         )
+        self.__event_executor = None
+        self.__event_futures = deque()
     
     @property
     def issues_df(self) -> pd.DataFrame:
@@ -198,12 +338,58 @@ class Issues(Core):
         """
         return Core.get_pandas_data_frame(self.current_dir, Issues.Files.ISSUES_REACTIONS)
 
-    def generate_pandas_tables(self, check_for_updates: bool = False, params: Params = Params()) -> None:
+    @property
+    def reaction_counts_df(self) -> pd.DataFrame:
+        """
+        reaction_counts_df(self)
+
+        Pandas DataFrame object with the reaction counts of issues and comments.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the total count and the count of each reaction content per issue and comment.
+            
+        """
+        return Core.get_pandas_data_frame(self.current_dir, Issues.Files.ISSUES_REACTION_COUNTS)
+
+    @property
+    def issue_labels_df(self) -> pd.DataFrame:
+        """
+        issue_labels_df(self)
+
+        Pandas DataFrame object with the labels of the issues.
+
+        Returns
+        -------
+        pd.DataFrame
+            Link table with the columns issue_id and label.
+            
+        """
+        return Core.get_pandas_data_frame(self.current_dir, Issues.Files.ISSUE_LABELS)
+
+    @property
+    def issue_assignees_df(self) -> pd.DataFrame:
+        """
+        issue_assignees_df(self)
+
+        Pandas DataFrame object with the assignees of the issues.
+
+        Returns
+        -------
+        pd.DataFrame
+            Link table with the columns issue_id and assignee.
+            
+        """
+        return Core.get_pandas_data_frame(self.current_dir, Issues.Files.ISSUE_ASSIGNEES)
+
+    def generate_pandas_tables(self, check_for_updates: bool = False, params: Params = Params(), graphql: bool = False, incremental: bool = False, link_tables: bool = False, timeline: bool = False) -> None:
         """
-        generate_pandas_tables(self, check_for_updates=False, params=Params())
+        generate_pandas_tables(self, check_for_updates=False, params=Params(), graphql=False, incremental=False, link_tables=False, timeline=False)
 
         Extracts the issues from a repository.
         Checks first if there are any new issues information in dependence of parameter check_for_updates.
+        The REST extraction is checkpointed periodically and a stopped extraction with the same params is resumed.
 
         Parameters
         ----------
@@ -211,75 +397,226 @@ class Issues(Core):
             Determines whether update is necessary. Does not work when params "reactions" is True.
         params : Params, default=Params()
             Can hold extraction parameters, that define what will be extracted.
+        graphql : bool, default=False
+            Extracts issues and pull requests with nested comments, reactions and events by GraphQL queries
+            of 100 issues instead of one REST request per issue for reactions and events.
+        incremental : bool, default=False
+            Extracts only issues and comments which are updated since the last extraction and new events.
+            They are updated and inserted by id into the stored tables. The reactions of updated issues and
+            comments are replaced. Only supported by the REST extraction.
+        link_tables : bool, default=False
+            Saves the labels and assignees of the issues additionally as link tables with one row per issue
+            and label or assignee.
+        timeline : bool, default=False
+            Extracts the comments and events of each issue together from its timeline instead of the repository
+            listings of comments and events. The timeline contains cross references, renames and reviews as well.
+            Only the timelines of issues whose updated_at changed since the stored issues are requested, the stored
+            comments and events of the other issues and the reactions of their comments are kept. Only supported by the
+            REST extraction.
+
+        Notes
+        -----
+            In GraphQL mode the ids of pull requests are the pull request ids instead of the issue ids and the ids of
+            events are GraphQL node ids.
+            Adding a reaction does not change updated_at, new reactions of unchanged issues are not extracted incrementally.
+            With params "reaction_counts" the reactions of issues and comments whose reaction counts equal the stored
+            reactions are kept instead of requested again. Only supported by the REST extraction.
+            Timeline events without id, e.g. cross references, have the id None. The stored comments and events of
+            unchanged issues are only complete if the stored tables were extracted with the same params.
         
         """
+        if timeline and graphql:
+            self.logger.warning("Timeline extraction is only supported by the REST extraction")
+            timeline = False
         extract_issues = False
-        if params.issues or params.reactions:
+        if params.issues or params.reactions or params.reaction_counts or (timeline and (params.events or params.comments)):
             extract_issues = True
-            issues = self.save_api_call(self.repo.get_issues, state='all', sort="updated")
-            total_count = self.get_save_total_count(issues)
             if check_for_updates:
-                if params.reactions:
-                    self.logger.warning("Check for update does not work when params \"reactions\" is True")
+                if params.reactions or params.reaction_counts:
+                    self.logger.warning("Check for update does not work when params \"reactions\" or \"reaction_counts\" is True")
                 else:
+                    issues = self.save_api_call(self.repo.get_issues, state='all', sort="updated")
+                    first_page = self.get_save_page(issues, 0)
                     old_issues = self.issues_df
-                    if not self.check_for_updates_paginated(issues, total_count, old_issues):
+                    if not self.check_for_updates_paginated(first_page, len(first_page), old_issues):
                         self.logger.info("No new Issue information!")
                         return
-        events_overflow = False
-        if params.events:
-            events = self.save_api_call(self.repo.get_issues_events)
-            events_total_count = self.get_save_total_count(events)
-            if events_total_count >= self.request_maximum:
-                events_overflow = True
-                extract_issues = True
-                self.logger.info("Issues Events will be processed in Issues")
-        self.__issue_list = []
-        self.__comment_list = []
-        self.__event_list = []
-        self.__reaction_list = []
-        # issue data
-        if extract_issues:
-            issues = issues.reversed
-            self.extract_with_updated_and_since(
-                self.repo.get_issues,
-                "Issues",
-                self.extract_issue,
+        self.__issue_list = self.get_table_writer(Issues.Files.ISSUES)
+        self.__comment_list = self.get_table_writer(Issues.Files.COMMENTS)
+        self.__event_list = self.get_table_writer(Issues.Files.EVENTS)
+        self.__reaction_list = self.get_table_writer(Issues.Files.ISSUES_REACTIONS)
+        self.__reaction_count_list = self.get_table_writer(Issues.Files.ISSUES_REACTION_COUNTS)
+        if incremental and graphql:
+            self.logger.warning("Incremental extraction is only supported by the REST extraction")
+            incremental = False
+        reaction_counts = params.reaction_counts
+        if reaction_counts and graphql:
+            self.logger.warning("Reaction counts are only supported by the REST extraction")
+            reaction_counts = False
+        old_issues_df = old_comments_df = old_events_df = old_reactions_df = old_reaction_counts_df = DataFrame()
+        if incremental:
+            old_issues_df = self.issues_df
+        if incremental or (timeline and reaction_counts):
+            old_reaction_counts_df = self.reaction_counts_df
+        if incremental or timeline:
+            old_comments_df = self.comments_df
+            old_events_df = self.events_df
+        # issues whose updated_at is unchanged keep their stored timeline
+        stored_issues_df = DataFrame()
+        if timeline:
+            stored_issues_df = old_issues_df if incremental else self.issues_df
+        self.__stored_updated_at = dict(zip(stored_issues_df["id"], stored_issues_df["updated_at"])) if "id" in stored_issues_df else {}
+        if incremental or ((reaction_counts or timeline) and params.reactions):
+            old_reactions_df = self.reactions_df
+        self.__stored_reaction_counts = Core.get_stored_reaction_counts(old_reactions_df) if reaction_counts else {}
+        if graphql:
+            for table_writer in [self.__issue_list, self.__comment_list, self.__event_list, self.__reaction_list, self.__reaction_count_list]:
+                table_writer.clear()
+            self.__extract_graphql(params)
+        else:
+            self.start_checkpoint(
                 params,
-                events_overflow,
-                initial_data_list=issues,
-                initial_total_count=total_count,
-                state="all")
-        if params.events:
-            # issue event data < request maximum
-            if not events_overflow:
-                for i in self.progress_bar(range(events_total_count), "Issues Events:   "):
-                    event = self.get_save_api_data(events, i)
-                    event_data = self.save_api_call(self.__extract_event_data, event)
-                    self.__event_list.append(event_data)
-        if params.comments:
-            self.extract_with_updated_and_since(
-                self.repo.get_issues_comments,
-                "Issues Comments",
-                self.extract_comment,
-                params)
+                name="Issues" + (" incremental" if incremental else "") + (" timeline" if timeline else ""),
+                issues=self.__issue_list,
+                comments=self.__comment_list,
+                events=self.__event_list,
+                reactions=self.__reaction_list,
+                reaction_counts=self.__reaction_count_list)
+            events_overflow = False
+            if params.events and not timeline:
+                events = self.save_api_call(self.repo.get_issues_events)
+                # the probe costs one request, the other pages are only requested without overflow
+                first_event_page = self.get_save_page(events, 0)
+                # the Link header of the first page gives an upper bound of the events count
+                if self.get_page_count(first_event_page) * len(first_event_page) >= self.request_maximum:
+                    events_overflow = True
+                    extract_issues = True
+                    self.logger.info("Issues Events will be processed in Issues")
+            # issue data
+            if extract_issues:
+                if events_overflow and self.number_of_threads > 1:
+                    # the event lists of the issues are fetched by a worker pool
+                    self.__event_executor = ThreadPoolExecutor(max_workers=self.number_of_threads, thread_name_prefix="github2pandas")
+                # a complete extraction reports stored issues which are not listed anymore
+                expected_issue_ids = None if incremental else Core.get_pandas_data_frame(self.current_dir, Issues.Files.ISSUES, columns=["id"]).get("id")
+                try:
+                    self.extract_with_updated_and_since(
+                        self.repo.get_issues,
+                        "Issues",
+                        self.extract_issue,
+                        params,
+                        events_overflow,
+                        timeline,
+                        initial_data_list=self.__get_updated_list(self.repo.get_issues, old_issues_df, state="all"),
+                        state="all",
+                        expected_ids=expected_issue_ids)
+                    self.complete_pending_work()
+                finally:
+                    if self.__event_executor is not None:
+                        for future in self.__event_futures:
+                            future.cancel()
+                        self.__event_futures.clear()
+                        self.__event_executor.shutdown()
+                        self.__event_executor = None
+            if params.events and not timeline:
+                # issue event data < request maximum
+                if not events_overflow and not self.get_checkpoint_progress("Issues Events").get("finished"):
+                    events = itertools.chain.from_iterable(self.get_save_pages(events, first_page=first_event_page))
+                    # events are listed newest first
+                    old_event_ids = set(old_events_df["id"]) if "id" in old_events_df else set()
+                    events = itertools.takewhile(lambda event: event.id not in old_event_ids, events)
+                    for event in self.progress_bar(events, "Issues Events:   "):
+                        event_data = self.save_api_call(self.__extract_event_data, event)
+                        self.__event_list.append(event_data)
+                    self.update_checkpoint("Issues Events", finished=True)
+            if params.comments and not timeline:
+                self.extract_with_updated_and_since(
+                    self.repo.get_issues_comments,
+                    "Issues Comments",
+                    self.extract_comment,
+                    params,
+                    initial_data_list=self.__get_updated_list(self.repo.get_issues_comments, old_comments_df))
         # Save lists
         if extract_issues:
-            issues_df = DataFrame(self.__issue_list)
+            issues_df = self.__issue_list.to_data_frame()
+            if graphql and not issues_df.empty:
+                issues_df = issues_df.sort_values("updated_at", kind="stable", ignore_index=True)
+            if timeline:
+                # the stored timelines of the other issues are kept, in a complete extraction only of the listed issues
+                kept_issues_df = stored_issues_df
+                if "id" in kept_issues_df and "id" in issues_df:
+                    kept_issues_df = kept_issues_df[~kept_issues_df["id"].isin(self.__get_timeline_issues(issues_df)["id"])]
+                    if not incremental:
+                        kept_issues_df = kept_issues_df[kept_issues_df["id"].isin(issues_df["id"])]
+            if incremental:
+                updated_issue_ids = set(issues_df["id"]) if "id" in issues_df else set()
+                issues_df = Core.upsert_data_frame(old_issues_df, issues_df, sort_by="updated_at")
             self.save_pandas_data_frame(Issues.Files.ISSUES, issues_df)
+            if link_tables:
+                self.save_pandas_data_frame(Issues.Files.ISSUE_LABELS, Core.get_link_table(issues_df, "id", "labels", "issue_id", "label"))
+                self.save_pandas_data_frame(Issues.Files.ISSUE_ASSIGNEES, Core.get_link_table(issues_df, "id", "assignees", "issue_id", "assignee"))
+        updated_comment_ids = kept_comment_ids = set()
         if params.comments:
-            comments_df = DataFrame(self.__comment_list)
+            comments_df = self.__comment_list.to_data_frame()
+            if graphql and not comments_df.empty:
+                comments_df = comments_df.sort_values("updated_at", kind="stable", ignore_index=True)
+            updated_comment_ids = set(comments_df["id"]) if "id" in comments_df else set()
+            if timeline:
+                if "issue_url" in old_comments_df and "url" in kept_issues_df:
+                    kept_comments_df = old_comments_df[old_comments_df["issue_url"].isin(kept_issues_df["url"])]
+                    kept_comment_ids = set(kept_comments_df["id"])
+                    comments_df = pd.concat([kept_comments_df, comments_df], ignore_index=True)
+            elif incremental:
+                comments_df = Core.upsert_data_frame(old_comments_df, comments_df, sort_by="updated_at")
             self.save_pandas_data_frame(Issues.Files.COMMENTS, comments_df)
         if params.events:
-            events_df = DataFrame(self.__event_list)
+            events_df = self.__event_list.to_data_frame()
+            if timeline:
+                if "issue_id" in old_events_df and "id" in kept_issues_df:
+                    events_df = pd.concat([old_events_df[old_events_df["issue_id"].isin(kept_issues_df["id"])], events_df], ignore_index=True)
+            elif incremental:
+                events_df = Core.upsert_data_frame(old_events_df, events_df)
             self.save_pandas_data_frame(Issues.Files.EVENTS, events_df)
+        if reaction_counts:
+            reaction_counts_df = self.__reaction_count_list.to_data_frame()
+            if timeline and "parent_id" in old_reaction_counts_df:
+                # the counts of the comments of kept timelines are kept
+                kept_counts = (old_reaction_counts_df["parent_name"] == "comment") & old_reaction_counts_df["parent_id"].isin(kept_comment_ids)
+                reaction_counts_df = pd.concat([old_reaction_counts_df[kept_counts], reaction_counts_df], ignore_index=True)
+            if incremental:
+                self.save_pandas_data_frame(Issues.Files.ISSUES_REACTION_COUNTS,
+                    Core.upsert_data_frame(old_reaction_counts_df, reaction_counts_df, key=["parent_name", "parent_id"]))
+            else:
+                self.save_pandas_data_frame(Issues.Files.ISSUES_REACTION_COUNTS, reaction_counts_df)
         if params.reactions:
-            reactions_df = DataFrame(self.__reaction_list)
+            reactions_df = self.__reaction_list.to_data_frame()
+            if not old_reactions_df.empty:
+                kept_reactions = pd.Series(False, index=old_reactions_df.index)
+                if reaction_counts:
+                    # the reactions of parents with unchanged counts were not requested again
+                    kept_reactions.loc[Core.get_unchanged_reactions(old_reactions_df, reaction_counts_df).index] = True
+                if incremental:
+                    # reactions can be removed, the reactions of updated parents are replaced
+                    updated_parent = (old_reactions_df["parent_name"] == "issue") & old_reactions_df["parent_id"].isin(updated_issue_ids)
+                    if params.comments:
+                        updated_parent |= (old_reactions_df["parent_name"] == "comment") & old_reactions_df["parent_id"].isin(updated_comment_ids)
+                    kept_reactions |= ~updated_parent
+                if timeline and params.comments:
+                    # the comments of kept timelines keep their reactions, comments which left the timelines lose them
+                    comment_parent = old_reactions_df["parent_name"] == "comment"
+                    kept_comment = comment_parent & old_reactions_df["parent_id"].isin(kept_comment_ids)
+                    removed_comment = comment_parent & ~old_reactions_df["parent_id"].isin(kept_comment_ids | updated_comment_ids)
+                    kept_reactions = (kept_reactions | kept_comment) & ~removed_comment
+                reactions_df = Core.upsert_data_frame(old_reactions_df[kept_reactions], reactions_df)
             self.save_pandas_data_frame(Issues.Files.ISSUES_REACTIONS, reactions_df)
+        for table_writer in [self.__issue_list, self.__comment_list, self.__event_list, self.__reaction_list, self.__reaction_count_list]:
+            table_writer.clear()
+        self.remove_checkpoint()
+        self.user_registry.compact()
     
-    def extract_issue(self, data: GitHubIssue, params: Params, events_overflow: bool) -> None:
+    def extract_issue(self, data: GitHubIssue, params: Params, events_overflow: bool, timeline: bool = False) -> None:
         """
-        extract_issue(self, data, params, events_overflow)
+        extract_issue(self, data, params, events_overflow, timeline=False)
 
         Extracts the issue.
 
@@ -291,6 +628,8 @@ class Issues(Core):
             Holds extraction parameters, that define what will be extracted.
         events_overflow : bool
             Downloads Events in Issues, if event amount greater than request_maximum
+        timeline : bool, default=False
+            Extracts the comments and events from the timeline of the issue if it changed since the last extraction.
         
         Notes
         -----
@@ -300,22 +639,52 @@ class Issues(Core):
         issue_data = self.__extract_issue_data(data)
         self.__issue_list.append(issue_data)
         # reaction data
-        if params.reactions:
-            self.__reaction_list += self.extract_reactions(
-                data.get_reactions, 
-                data.id, 
-                "issue")
+        self.__extract_reactions(data, "issue", params)
+        if timeline:
+            if (params.events or params.comments) and self.__stored_updated_at.get(data.id) != data.updated_at:
+                self.__extract_timeline(data, params)
+            return
         if params.events:
             # events data >= request maximum
             if events_overflow:
-                events = self.save_api_call(data.get_events)
-                for i in range(self.request_maximum):
-                    try:
-                        event = self.get_save_api_data(events, i)
-                        event_data = self.save_api_call(self.__extract_event_data, event, issue_id=data.id)
-                        self.__event_list.append(event_data)
-                    except IndexError:
-                        break
+                if self.__event_executor is None:
+                    self.__event_list += self.__extract_issue_events(data)
+                    return
+                # at most two issues per thread are fetched in advance
+                while len(self.__event_futures) >= 2 * self.number_of_threads:
+                    self.__event_list += self.__event_futures.popleft().result()
+                self.__event_futures.append(self.__event_executor.submit(self.__extract_issue_events, data))
+
+    def complete_pending_work(self) -> None:
+        """
+        complete_pending_work(self)
+
+        Merges the concurrently fetched issue events in issue order into the events list.
+
+        """
+        while self.__event_futures:
+            self.__event_list += self.__event_futures.popleft().result()
+
+    def __extract_issue_events(self, issue: GitHubIssue) -> list:
+        """
+        __extract_issue_events(self, issue)
+
+        Extracts all events of one issue. It is called by the worker threads if more issue events than
+        request_maximum exist, the pages of one issue are fetched sequentially.
+
+        Parameters
+        ----------
+        issue : GitHubIssue
+            Issue object from pygithub.
+
+        Returns
+        -------
+        list
+            List with the extracted data of the issue events.
+
+        """
+        events = self.save_api_call(issue.get_events)
+        return [self.save_api_call(self.__extract_event_data, event, issue_id=issue.id) for event in self.get_save_items(events, concurrent=False)]
 
     def extract_comment(self, data: GitHubIssueComment, params: Params) -> None:
         """
@@ -338,12 +707,40 @@ class Issues(Core):
         comment_data = self.save_api_call(self.__extract_comment_data, data)
         self.__comment_list.append(comment_data)
         # issue comment reaction data
+        self.__extract_reactions(data, "comment", params)
+
+    def __extract_reactions(self, data: Union[GitHubIssue, GitHubIssueComment], parent_name: str, params: Params) -> None:
+        """
+        __extract_reactions(self, data, parent_name, params)
+
+        Extracts the reaction counts and the reactions of an issue or comment. With params "reaction_counts" the
+        reactions are only requested if the counts of the reaction summary differ from the stored reactions.
+
+        Parameters
+        ----------
+        data : GitHubIssue or GitHubIssueComment
+            Issue or IssueComment object from pygithub.
+        parent_name : str
+            Name of the parent, "issue" or "comment".
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        """
+        if not params.reaction_counts:
+            if params.reactions:
+                self.__reaction_list += self.extract_reactions(data.get_reactions, data.id, parent_name)
+            return
+        reaction_counts = self.extract_reaction_counts(data, data.id, parent_name)
+        if reaction_counts is not None:
+            self.__reaction_count_list.append(reaction_counts)
         if params.reactions:
-            self.__reaction_list += self.extract_reactions(
-                data.get_reactions, 
-                data.id, 
-                "comment")
-                
+            self.__reaction_list += self.extract_changed_reactions(
+                data.get_reactions,
+                data.id,
+                parent_name,
+                reaction_counts,
+                self.__stored_reaction_counts)
+
     def __extract_issue_data(self, issue: GitHubIssue) -> dict:
         """
         __extract_issue_data(self, issue)
@@ -461,7 +858,8 @@ class Issues(Core):
         event_data["event"] = event.event
         event_data["id"] = event.id
         if issue_id is None:
-            event_data["issue_id"] = event.issue.id
+            issue = self.get_value(event, "issue")
+            event_data["issue_id"] = issue.id if issue is not None else None
         else:
             event_data["issue_id"] = issue_id
         if not event._label == GithubObject.NotSet:
@@ -469,3 +867,483 @@ class Issues(Core):
         # event_data["last_modified"] = event.last_modified NaN?
         # milestone ?
         return event_data
+
+    def __extract_timeline(self, issue: GitHubIssue, params: Params) -> None:
+        """
+        __extract_timeline(self, issue, params)
+
+        Extracts the comments and events of one issue from its timeline in one paginated listing.
+        The reactions and reaction counts of the comments are extracted like the ones of listed comments.
+
+        Parameters
+        ----------
+        issue : GitHubIssue
+            Issue object from pygithub.
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        """
+        timeline = self.save_api_call(issue.get_timeline)
+        for item in self.get_save_items(timeline):
+            item_type, item_data = self.save_api_call(self.__extract_timeline_item_data, item, issue) or (None, None)
+            if item_type == "comment" and params.comments:
+                self.__comment_list.append(item_data)
+                # issue comment reaction data
+                self.__extract_reactions(self.__get_timeline_comment(item), "comment", params)
+            elif item_type == "event" and params.events:
+                self.__event_list.append(item_data)
+
+    def __extract_timeline_item_data(self, item: GitHubTimelineEvent, issue: GitHubIssue) -> tuple:
+        """
+        __extract_timeline_item_data(self, item, issue)
+
+        Extracts the data of one timeline item as a row of the comments or events table. Review comments and
+        commit comments are skipped, they are extracted by PullRequests.
+
+        Parameters
+        ----------
+        item : GitHubTimelineEvent
+            TimelineEvent object from pygithub.
+        issue : GitHubIssue
+            Issue object from pygithub.
+
+        Returns
+        -------
+        tuple
+            Type of the item ("comment", "event" or None) and the dictionary with the extracted data.
+
+        Notes
+        -----
+            Timeline items differ by event, the fields are read from the fetched JSON.
+            Timeline events structure: https://docs.github.com/en/rest/issues/timeline
+
+        """
+        raw_data = item._rawData
+        event = raw_data.get("event")
+        if event in Issues.__TIMELINE_SKIPPED_EVENTS:
+            return None, None
+        if event == "commented":
+            comment_data = {}
+            comment_data["body"] = raw_data.get("body")
+            comment_data["created_at"] = item.created_at
+            comment_data["id"] = raw_data.get("id")
+            comment_data["issue_url"] = issue.url
+            comment_data["updated_at"] = GithubObject.GithubObject._makeDatetimeAttribute(raw_data.get("updated_at")).value
+            if raw_data.get("user") is not None:
+                comment_data["author"] = self.extract_user_data(self.__get_timeline_user(item, raw_data["user"]))
+            return "comment", comment_data
+        event_data = {}
+        # reviews have a user instead of an actor
+        actor = raw_data.get("actor", raw_data.get("user"))
+        if actor is not None:
+            event_data["author"] = self.extract_user_data(self.__get_timeline_user(item, actor))
+        for key in ["assignee", "assigner"]:
+            if raw_data.get(key) is not None:
+                event_data[key] = self.extract_user_data(self.__get_timeline_user(item, raw_data[key]))
+        event_data["commit_sha"] = raw_data.get("commit_id", raw_data.get("sha"))
+        created_at = raw_data.get("created_at", raw_data.get("submitted_at"))
+        if created_at is None and event == "committed":
+            created_at = raw_data.get("committer", {}).get("date")
+        event_data["created_at"] = GithubObject.GithubObject._makeDatetimeAttribute(created_at).value
+        event_data["event"] = event
+        event_data["id"] = raw_data.get("id")
+        event_data["issue_id"] = issue.id
+        if raw_data.get("label") is not None:
+            event_data["label"] = raw_data["label"].get("name")
+        if raw_data.get("rename") is not None:
+            event_data["rename_from"] = raw_data["rename"].get("from")
+            event_data["rename_to"] = raw_data["rename"].get("to")
+        if event == "cross-referenced":
+            source_issue = (raw_data.get("source") or {}).get("issue") or {}
+            event_data["source_issue_id"] = source_issue.get("id")
+            event_data["source_issue_url"] = source_issue.get("url")
+        if event == "reviewed":
+            event_data["review_state"] = raw_data.get("state")
+        return "event", event_data
+
+    @staticmethod
+    def __get_timeline_comment(item: GitHubTimelineEvent) -> GitHubIssueComment:
+        """
+        __get_timeline_comment(item)
+
+        Returns a "commented" timeline item as issue comment object, e.g. to request its reactions.
+
+        Parameters
+        ----------
+        item : GitHubTimelineEvent
+            TimelineEvent object from pygithub.
+
+        Returns
+        -------
+        GitHubIssueComment
+            IssueComment object from pygithub.
+
+        """
+        return GitHubIssueComment(item._requester, {}, item._rawData, completed=True)
+
+    @staticmethod
+    def __get_timeline_user(item: GitHubTimelineEvent, user: dict) -> GitHubNamedUser:
+        """
+        __get_timeline_user(item, user)
+
+        Returns a user of the JSON of a timeline item as user object.
+
+        Parameters
+        ----------
+        item : GitHubTimelineEvent
+            TimelineEvent object from pygithub.
+        user : dict
+            JSON of the user.
+
+        Returns
+        -------
+        GitHubNamedUser
+            NamedUser object from pygithub.
+
+        """
+        return GitHubNamedUser(item._requester, {}, user, completed=False)
+
+    def __get_timeline_issues(self, issues_df: DataFrame) -> DataFrame:
+        """
+        __get_timeline_issues(self, issues_df)
+
+        Returns the extracted issues whose timeline was extracted because their updated_at changed since the
+        stored issues.
+
+        Parameters
+        ----------
+        issues_df : DataFrame
+            Extracted issues.
+
+        Returns
+        -------
+        DataFrame
+            Rows of issues_df with an extracted timeline.
+
+        """
+        if "id" not in issues_df:
+            return issues_df
+        changed = [self.__stored_updated_at.get(issue_id) != updated_at for issue_id, updated_at in zip(issues_df["id"], issues_df["updated_at"])]
+        return issues_df[changed]
+
+
+    def __get_updated_list(self, github_method, old_data_frame: DataFrame, state: str = None) -> PaginatedList:
+        """
+        __get_updated_list(self, github_method, old_data_frame, state=None)
+
+        Returns the list of items updated since the last extraction.
+
+        Parameters
+        ----------
+        github_method
+            A github method with the parameter since.
+        old_data_frame : DataFrame
+            Stored table with the column updated_at, an empty table for a complete extraction.
+        state : str, default=None
+            Corresponds to the github state of data.
+
+        Returns
+        -------
+        PaginatedList
+            List sorted ascending by updated or None if old_data_frame is empty.
+
+        """
+        if "updated_at" not in old_data_frame or old_data_frame["updated_at"].isna().all():
+            return None
+        since = old_data_frame["updated_at"].max().to_pydatetime()
+        self.logger.info(f"Extracting updates since {since}")
+        if state is None:
+            return self.save_api_call(github_method, since=since, sort="updated", direction="asc")
+        return self.save_api_call(github_method, state=state, since=since, sort="updated", direction="asc")
+
+    def __extract_graphql(self, params: Params) -> None:
+        """
+        __extract_graphql(self, params)
+
+        Extracts issues and pull requests with nested comments, reactions and events by GraphQL queries.
+        Every query returns 100 issues, nested connections with more nodes are requested separately.
+
+        Parameters
+        ----------
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        Notes
+        -----
+            GitHub GraphQL Issue object structure: https://docs.github.com/en/graphql/reference/objects#issue
+
+        """
+        owner, name = self.repo.full_name.split("/")
+        # the REST api lists pull requests as issues
+        for typename, connection_name, label in [("Issue", "issues", "Issues:          "), ("PullRequest", "pullRequests", "Pull Requests:   ")]:
+            fields = self.__get_graphql_fields(typename, params)
+            query = (
+                f"query($owner: String!, $name: String!, $cursor: String) {{ repository(owner: $owner, name: $name) {{ "
+                f"{connection_name}(first: 100, after: $cursor, orderBy: {{field: UPDATED_AT, direction: ASC}}) {{ "
+                f"totalCount pageInfo {{ hasNextPage endCursor }} nodes {{ {fields} }} }} }} }} {Issues.__GRAPHQL_USER}"
+            )
+            variables = {"owner": owner, "name": name, "cursor": None}
+            connection = self.save_graphql_call(query, variables)["repository"][connection_name]
+            def get_issues(connection):
+                while True:
+                    yield from connection["nodes"]
+                    if not connection["pageInfo"]["hasNextPage"]:
+                        return
+                    variables["cursor"] = connection["pageInfo"]["endCursor"]
+                    connection = self.save_graphql_call(query, variables)["repository"][connection_name]
+            for issue in self.progress_bar(get_issues(connection), label, total=connection["totalCount"]):
+                self.__extract_graphql_issue(issue, params)
+
+    def __extract_graphql_issue(self, issue: dict, params: Params) -> None:
+        """
+        __extract_graphql_issue(self, issue, params)
+
+        Extracts one issue node of a GraphQL response with the same columns as the REST api.
+
+        Parameters
+        ----------
+        issue : dict
+            Issue or PullRequest node.
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        """
+        issue_id = issue["databaseId"]
+        issue_url = f"{self.repo.url}/issues/{issue['number']}"
+        issue_data = {}
+        issue_data["assignees"] = self.extract_users(Issues.__get_graphql_user(user) for user in self.__get_graphql_nodes(issue, "assignees", params))
+        issue_data["body"] = issue["body"]
+        issue_data["closed_at"] = Issues.__get_graphql_datetime(issue["closedAt"])
+        issue_data["comments"] = issue["commentCount"]["totalCount"]
+        issue_data["created_at"] = Issues.__get_graphql_datetime(issue["createdAt"])
+        issue_data["id"] = issue_id
+        issue_data["labels"] = [label["name"] for label in self.__get_graphql_nodes(issue, "labels", params)]
+        issue_data["locked"] = issue["locked"]
+        issue_data["active_lock_reason"] = Issues.__GRAPHQL_LOCK_REASONS.get(issue["activeLockReason"])
+        issue_data["number"] = issue["number"]
+        # pull requests can be merged
+        issue_data["state"] = "open" if issue["state"] == "OPEN" else "closed"
+        issue_data["title"] = issue["title"]
+        issue_data["updated_at"] = Issues.__get_graphql_datetime(issue["updatedAt"])
+        issue_data["url"] = issue_url
+        issue_data["author"] = self.extract_user_data(Issues.__get_graphql_user(issue["author"]))
+        issue_data["is_pull_request"] = issue["__typename"] == "PullRequest"
+        self.__issue_list.append(issue_data)
+        if params.reactions:
+            for reaction in self.__get_graphql_nodes(issue, "reactions", params):
+                self.__reaction_list.append(self.__extract_graphql_reaction_data(reaction, issue_id, "issue"))
+        if params.comments:
+            for comment in self.__get_graphql_nodes(issue, "comments", params):
+                comment_data = {}
+                comment_data["body"] = comment["body"]
+                comment_data["created_at"] = Issues.__get_graphql_datetime(comment["createdAt"])
+                comment_data["id"] = comment["databaseId"]
+                comment_data["issue_url"] = issue_url
+                comment_data["updated_at"] = Issues.__get_graphql_datetime(comment["updatedAt"])
+                comment_data["author"] = self.extract_user_data(Issues.__get_graphql_user(comment["author"]))
+                self.__comment_list.append(comment_data)
+                if params.reactions:
+                    for reaction in self.__get_graphql_nodes(comment, "reactions", params):
+                        self.__reaction_list.append(self.__extract_graphql_reaction_data(reaction, comment["databaseId"], "comment"))
+        if params.events:
+            for event in self.__get_graphql_nodes(issue, "timelineItems", params):
+                event_data = {}
+                event_data["author"] = self.extract_user_data(Issues.__get_graphql_user(event["actor"]))
+                if "assignee" in event:
+                    event_data["assignee"] = self.extract_user_data(Issues.__get_graphql_user(event["assignee"]))
+                    event_data["assigner"] = event_data["author"]
+                commit = event.get("closer") or event.get("commit")
+                event_data["commit_sha"] = commit.get("oid") if commit else None
+                event_data["created_at"] = Issues.__get_graphql_datetime(event["createdAt"])
+                if event["__typename"] == "RenamedTitleEvent":
+                    event_data["event"] = "renamed"
+                else:
+                    event_data["event"] = re.sub(r"(?<!^)(?=[A-Z])", "_", event["__typename"][:-len("Event")]).lower()
+                event_data["id"] = event["id"]
+                event_data["issue_id"] = issue_id
+                if event.get("label") is not None:
+                    event_data["label"] = event["label"]["name"]
+                self.__event_list.append(event_data)
+
+    def __extract_graphql_reaction_data(self, reaction: dict, parent_id: int, parent_name: str) -> dict:
+        """
+        __extract_graphql_reaction_data(self, reaction, parent_id, parent_name)
+
+        Extracts the data of one reaction node with the same columns as extract_reaction_data.
+
+        Parameters
+        ----------
+        reaction : dict
+            Reaction node.
+        parent_id : int
+            Id from parent as foreign key.
+        parent_name : str
+            Name of the parent.
+
+        Returns
+        -------
+        dict
+            Dictionary with the extracted reaction data.
+
+        """
+        reaction_data = {}
+        reaction_data["parent_id"] = parent_id
+        reaction_data["parent_name"] = parent_name
+        reaction_data["content"] = Issues.__GRAPHQL_REACTIONS.get(reaction["content"], reaction["content"].lower())
+        reaction_data["created_at"] = Issues.__get_graphql_datetime(reaction["createdAt"])
+        reaction_data["id"] = reaction["databaseId"]
+        reaction_data["author"] = self.extract_user_data(Issues.__get_graphql_user(reaction["user"]))
+        return reaction_data
+
+    def __get_graphql_connections(self, typename: str, params: Params) -> dict:
+        """
+        __get_graphql_connections(self, typename, params)
+
+        Returns the nested connections of a GraphQL type, which are required by the extraction parameters.
+
+        Parameters
+        ----------
+        typename : str
+            Name of the GraphQL type.
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        Returns
+        -------
+        dict
+            Dictionary with connection names as keys and tuples of page size, additional arguments and the type
+            of the nodes as values.
+
+        """
+        connections = {}
+        if typename in ["Issue", "PullRequest"]:
+            connections["assignees"] = (10, "", "User")
+            connections["labels"] = (25, "", "Label")
+            if params.reactions:
+                connections["reactions"] = (100, "", "Reaction")
+            if params.comments:
+                connections["comments"] = (50, "", "IssueComment")
+            if params.events:
+                events = Issues.__GRAPHQL_ISSUE_EVENTS if typename == "Issue" else Issues.__GRAPHQL_PULL_REQUEST_EVENTS
+                item_types = ", ".join(re.sub(r"(?<!^)(?=[A-Z])", "_", event).upper() for event in events)
+                connections["timelineItems"] = (100, f", itemTypes: [{item_types}]", f"{typename}TimelineItems")
+        elif typename == "IssueComment" and params.reactions:
+            connections["reactions"] = (25, "", "Reaction")
+        return connections
+
+    def __get_graphql_fields(self, typename: str, params: Params) -> str:
+        """
+        __get_graphql_fields(self, typename, params)
+
+        Returns the queried fields of a GraphQL type including the first page of its nested connections.
+
+        Parameters
+        ----------
+        typename : str
+            Name of the GraphQL type.
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        Returns
+        -------
+        str
+            Fields of the GraphQL type.
+
+        """
+        if typename.endswith("TimelineItems"):
+            events = Issues.__GRAPHQL_ISSUE_EVENTS if typename == "IssueTimelineItems" else Issues.__GRAPHQL_PULL_REQUEST_EVENTS
+            return " ".join(f"... on {event} {{ __typename id createdAt actor {{ ...user }} {fields} }}" for event, fields in events.items())
+        fields = Issues.__GRAPHQL_FIELDS[typename]
+        for connection_name, (page_size, arguments, node_typename) in self.__get_graphql_connections(typename, params).items():
+            node_fields = self.__get_graphql_fields(node_typename, params)
+            fields += f" {connection_name}(first: {page_size}{arguments}) {{ pageInfo {{ hasNextPage endCursor }} nodes {{ {node_fields} }} }}"
+        return fields
+
+    def __get_graphql_nodes(self, parent: dict, connection_name: str, params: Params) -> Iterator[dict]:
+        """
+        __get_graphql_nodes(self, parent, connection_name, params)
+
+        Yields all nodes of a nested GraphQL connection. The following pages of the first page in parent
+        are requested with 100 nodes each.
+
+        Parameters
+        ----------
+        parent : dict
+            Node with __typename, id and the first page of the connection.
+        connection_name : str
+            Name of the connection.
+        params : Params
+            Holds extraction parameters, that define what will be extracted.
+
+        Returns
+        -------
+        Iterator[dict]
+            Nodes of the connection.
+
+        """
+        connection = parent[connection_name]
+        while True:
+            yield from connection["nodes"]
+            if not connection["pageInfo"]["hasNextPage"]:
+                return
+            typename = parent["__typename"]
+            page_size, arguments, node_typename = self.__get_graphql_connections(typename, params)[connection_name]
+            fields = self.__get_graphql_fields(node_typename, params)
+            query = (
+                f"query($id: ID!, $cursor: String) {{ node(id: $id) {{ ... on {typename} {{ "
+                f"{connection_name}(first: 100, after: $cursor{arguments}) {{ pageInfo {{ hasNextPage endCursor }} nodes {{ {fields} }} }} }} }} }}"
+            )
+            if "...user" in fields:
+                query += f" {Issues.__GRAPHQL_USER}"
+            data = self.save_graphql_call(query, {"id": parent["id"], "cursor": connection["pageInfo"]["endCursor"]})
+            connection = data["node"][connection_name]
+
+    @staticmethod
+    def __get_graphql_user(user: dict) -> SimpleNamespace:
+        """
+        __get_graphql_user(user)
+
+        Returns an actor node as user object for extract_user_data.
+
+        Parameters
+        ----------
+        user : dict
+            Actor node.
+
+        Returns
+        -------
+        SimpleNamespace
+            User object with node_id, login, name and email or None for deleted users.
+
+        """
+        if user is None or "id" not in user:
+            return None
+        user_data = {"node_id": user["id"], "login": user["login"]}
+        if "name" in user:
+            user_data["name"] = user["name"]
+        if "email" in user:
+            # the REST api returns None for private emails
+            user_data["email"] = user["email"] or None
+        return SimpleNamespace(**user_data)
+
+    @staticmethod
+    def __get_graphql_datetime(value: str) -> datetime:
+        """
+        __get_graphql_datetime(value)
+
+        Returns a GraphQL DateTime as naive UTC datetime like pygithub.
+
+        Parameters
+        ----------
+        value : str
+            ISO-8601 encoded UTC date string or None.
+
+        Returns
+        -------
+        datetime
+            Parsed datetime or None.
+
+        """
+        if value is None:
+            return None
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
@@ -0,0 +1,297 @@
+import logging
+import math
+import sys
+import time
+from typing import Callable, Iterator
+import typing
+
+class Progress():
+    """
+    State of an extraction loop which is reported to a progress sink.
+
+    Attributes
+    ----------
+    prefix : str
+        Name of the extraction loop.
+    count : int
+        Number of processed items.
+    total : int or None
+        Number of all items or None if unknown.
+    elapsed : float
+        Seconds since the start of the loop.
+    rate : float
+        Processed items per second.
+    eta : float or None
+        Estimated seconds until the loop is finished or None if unknown.
+    finished : bool
+        Is the loop finished?
+    size : int
+        Size of a progress bar.
+
+    """
+
+    def __init__(self, prefix: str, count: int, total: int, elapsed: float, finished: bool = False, size: int = 60) -> None:
+        self.prefix = prefix
+        self.count = count
+        self.total = total
+        self.elapsed = elapsed
+        self.rate = count / elapsed if elapsed > 0 else 0.0
+        self.eta = None
+        if total is not None and self.rate > 0:
+            self.eta = max(total - count, 0) / self.rate
+        self.finished = finished
+        self.size = size
+
+class ProgressSink():
+    """
+    Progress sink which ignores the progress, base class of the other sinks.
+
+    Methods
+    -------
+    report(self, progress)
+        Reports the progress of an extraction loop.
+
+    """
+
+    def report(self, progress: Progress) -> None:
+        """
+        report(self, progress)
+
+        Reports the progress of an extraction loop.
+
+        Parameters
+        ----------
+        progress : Progress
+            State of the extraction loop.
+
+        """
+
+class ConsoleProgressSink(ProgressSink):
+    """
+    Progress sink which prints a progress bar with throughput and ETA and writes it to a log.
+
+    Attributes
+    ----------
+    logger : logging.Logger
+        Logger of the progress lines, e.g. a logger which does not print.
+    print_progress : bool
+        Is the progress bar printed to stdout?
+
+    Methods
+    -------
+    __init__(self, logger=None, print_progress=True)
+        Initializes the console progress sink.
+    report(self, progress)
+        Prints and logs the progress of an extraction loop.
+    format(progress)
+        Returns the progress as one line.
+
+    """
+
+    def __init__(self, logger: logging.Logger = None, print_progress: bool = True) -> None:
+        """
+        __init__(self, logger=None, print_progress=True)
+
+        Initializes the console progress sink.
+
+        Parameters
+        ----------
+        logger : logging.Logger, default=None
+            Logger of the progress lines. The progress is not logged if None.
+        print_progress : bool, default=True
+            Is the progress bar printed to stdout?
+
+        """
+        self.logger = logger
+        self.print_progress = print_progress
+
+    def report(self, progress: Progress) -> None:
+        """
+        report(self, progress)
+
+        Prints and logs the progress of an extraction loop.
+
+        Parameters
+        ----------
+        progress : Progress
+            State of the extraction loop.
+
+        """
+        line = ConsoleProgressSink.format(progress)
+        if self.print_progress:
+            sys.stdout.write(line + ("\n" if progress.finished else "\r"))
+            sys.stdout.flush()
+        if self.logger is not None:
+            self.logger.info(line)
+
+    @staticmethod
+    def format(progress: Progress) -> str:
+        """
+        format(progress)
+
+        Returns the progress as one line. Only the number of items is shown for loops without a total.
+
+        Parameters
+        ----------
+        progress : Progress
+            State of the extraction loop.
+
+        Returns
+        -------
+        str
+            Progress bar with count, total, throughput and ETA.
+
+        """
+        if progress.total is None:
+            line = "%s%i" % (progress.prefix, progress.count)
+        else:
+            x = min(int(progress.size*progress.count/progress.total), progress.size) if progress.total > 0 else progress.size
+            line = "%s[%s%s] %i/%i" % (progress.prefix, "#"*x, "."*(progress.size-x), progress.count, progress.total)
+        if progress.count > 0:
+            line += " %.1f/s" % progress.rate
+            if progress.finished:
+                line += " in %s" % ConsoleProgressSink.__format_seconds(progress.elapsed)
+            elif progress.eta is not None:
+                line += " ETA %s" % ConsoleProgressSink.__format_seconds(progress.eta)
+        return line
+
+    @staticmethod
+    def __format_seconds(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return "%i:%02i:%02i" % (hours, minutes, seconds)
+
+class CallbackProgressSink(ProgressSink):
+    """
+    Progress sink which calls a function with the progress, e.g. to update a notebook widget.
+
+    Attributes
+    ----------
+    callback : Callable
+        Function which is called with a Progress object.
+
+    Methods
+    -------
+    __init__(self, callback)
+        Initializes the callback progress sink.
+    report(self, progress)
+        Calls the callback with the progress.
+
+    """
+
+    def __init__(self, callback: Callable[[Progress], None]) -> None:
+        """
+        __init__(self, callback)
+
+        Initializes the callback progress sink.
+
+        Parameters
+        ----------
+        callback : Callable
+            Function which is called with a Progress object.
+
+        """
+        self.callback = callback
+
+    def report(self, progress: Progress) -> None:
+        """
+        report(self, progress)
+
+        Calls the callback with the progress.
+
+        Parameters
+        ----------
+        progress : Progress
+            State of the extraction loop.
+
+        """
+        self.callback(progress)
+
+class ProgressReporter():
+    """
+    Reports the progress of extraction loops at a bounded rate to a progress sink.
+
+    The progress is reported at the start and the end of a loop and in between at most once per interval
+    seconds and once per percent of the total. The loops do no I/O for the other items.
+
+    Attributes
+    ----------
+    sink : ProgressSink
+        Sink of the reported progress.
+    interval : float
+        Minimum number of seconds between two reports.
+    percent : float
+        Minimum progress in percent of the total between two reports. Only the interval is used if 0.
+
+    Methods
+    -------
+    __init__(self, sink=None, interval=1.0, percent=1.0)
+        Initializes the progress reporter.
+    track(self, iterable, prefix="", total=None, size=60)
+        Yields the items of an iterable and reports the progress.
+
+    """
+
+    def __init__(self, sink: ProgressSink = None, interval: float = 1.0, percent: float = 1.0) -> None:
+        """
+        __init__(self, sink=None, interval=1.0, percent=1.0)
+
+        Initializes the progress reporter.
+
+        Parameters
+        ----------
+        sink : ProgressSink, default=None
+            Sink of the reported progress. The progress is ignored if None.
+        interval : float, default=1.0
+            Minimum number of seconds between two reports.
+        percent : float, default=1.0
+            Minimum progress in percent of the total between two reports. Only the interval is used if 0.
+
+        """
+        self.sink = sink if sink is not None else ProgressSink()
+        self.interval = interval
+        self.percent = percent
+
+    def track(self, iterable: typing.Iterable, prefix: str = "", total: int = None, size: int = 60) -> Iterator:
+        """
+        track(self, iterable, prefix="", total=None, size=60)
+
+        Yields the items of an iterable and reports the progress.
+
+        Parameters
+        ----------
+        iterable : typing.Iterable
+            A iterable as input.
+        prefix : str, default=""
+            Name of the loop.
+        total : int, default=None
+            Length of the iterable. If None the length of the iterable is used if it has one.
+        size : int, default=60
+            Size of a progress bar.
+
+        """
+        if total is None and hasattr(iterable, "__len__"):
+            total = len(iterable)
+        start = time.monotonic()
+        last_report = start
+        # the items are only counted until the next report is due
+        step = math.ceil(total * self.percent / 100) if total and self.percent > 0 else None
+        next_count = step
+        if total is None or total > 0:
+            self.sink.report(Progress(prefix, 0, total, 0.0, size=size))
+        count = 0
+        for item in iterable:
+            yield item
+            count += 1
+            if step is not None and count >= next_count:
+                next_count = count + step
+                if count < total:
+                    now = time.monotonic()
+                    last_report = now
+                    self.sink.report(Progress(prefix, count, total, now - start, size=size))
+            elif self.interval >= 0:
+                now = time.monotonic()
+                if now - last_report >= self.interval:
+                    last_report = now
+                    self.sink.report(Progress(prefix, count, total, now - start, size=size))
+        self.sink.report(Progress(prefix, count, total, time.monotonic() - start, finished=True, size=size))
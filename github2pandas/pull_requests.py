@@ -2,6 +2,7 @@ import logging
 from pandas import DataFrame
 import pandas as pd
 from pathlib import Path
+from typing import Union
 # github imports
 from github import GithubObject
 from github.MainClass import Github
@@ -12,6 +13,7 @@ from github.PullRequestReview import PullRequestReview as GitHubPullRequestRevie
 # github2pandas imports
 from github2pandas.issues import Issues
 from github2pandas.core import Core
+from github2pandas.storage import Storage
 
 class PullRequests(Core):
     """
@@ -27,10 +29,12 @@ class PullRequests(Core):
         Pandas DataFrame object with pull request reviews data.
     reactions_df : DataFrame
         Pandas DataFrame object with pull request reactions data.
+    reaction_counts_df : DataFrame
+        Pandas DataFrame object with the reaction counts of review comments.
 
     Methods
     -------
-    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
         Initializes pull request object with general information.
     generate_pandas_tables(self, check_for_updates=False, params=Params())
         Extracts the complete pull request data from a repository.
@@ -52,13 +56,13 @@ class PullRequests(Core):
 
         Methods
         -------
-        __init__(self, pull_requests, deep_pull_requests, commits, review_requests, review_comments, reactions, reviews)
+        __init__(self, pull_requests, deep_pull_requests, commits, review_requests, review_comments, reactions, reviews, issues_params, reaction_counts)
             Initializes all parameters with a default.
         
         """
-        def __init__(self, pull_requests: bool = True, deep_pull_requests: bool = False, commits: bool = False, review_requests: bool = False, review_comments: bool = True, reactions: bool = False, reviews: bool = False, issues_params: Issues.Params = Issues.Params()) -> None:
+        def __init__(self, pull_requests: bool = True, deep_pull_requests: bool = False, commits: bool = False, review_requests: bool = False, review_comments: bool = True, reactions: bool = False, reviews: bool = False, issues_params: Issues.Params = Issues.Params(), reaction_counts: bool = False) -> None:
             """
-            __init__(self, pull_requests, deep_pull_requests, commits, review_requests, review_comments, reactions, reviews)
+            __init__(self, pull_requests, deep_pull_requests, commits, review_requests, review_comments, reactions, reviews, issues_params, reaction_counts)
             
             Initializes all parameters with a default.
 
@@ -80,6 +84,10 @@ class PullRequests(Core):
                 Extract reviews of pull requests?
             issues_params : Issues.Params, default=Issues.Params()
                 Issue Parameters are only used if there are not extracted Issues.
+            reaction_counts : bool, default=False
+                Extract the reaction counts of review comments from their reaction summaries without additional requests?
+                With reactions the reactions are then only requested for review comments whose counts differ from the
+                stored reactions.
 
             """
             self.pull_requests = pull_requests
@@ -90,6 +98,7 @@ class PullRequests(Core):
             self.reactions = reactions
             self.reviews = reviews
             self.issues_params = issues_params
+            self.reaction_counts = reaction_counts
 
     class Files(Core.Files):
         """
@@ -107,6 +116,10 @@ class PullRequests(Core):
             Filename of the pull requests reactions pandas table.
         REVIEWS : str
             Filename of the pull requests reviews pandas table.
+        PULL_REQUESTS_REACTION_COUNTS : str
+            Filename of the reaction counts pandas table of review comments.
+        SCHEMAS : dict
+            Dtypes of the columns of the pandas tables.
 
         """
         DATA_DIR = "PullRequests"
@@ -114,10 +127,23 @@ class PullRequests(Core):
         REVIEWS_COMMENTS = "ReviewsComments.p"
         PULL_REQUESTS_REACTIONS = "PullRequestsReactions.p"
         REVIEWS = "Reviews.p"
+        PULL_REQUESTS_REACTION_COUNTS = "PullRequestsReactionCounts.p"
+        SCHEMAS = {
+            PULL_REQUESTS: {"draft": "boolean", "mergeable": "boolean", "mergeable_state": "category", "merged": "boolean",
+                "rebaseable": "boolean", "maintainer_can_modify": "boolean", "merged_by": "category",
+                "merged_at": "datetime64[ns]", "updated_at": "datetime64[ns]"},
+            REVIEWS_COMMENTS: {"author": "category", "path": "category", "pull_request_url": "category",
+                "created_at": "datetime64[ns]", "updated_at": "datetime64[ns]"},
+            PULL_REQUESTS_REACTIONS: {"parent_id": "Int64", "parent_name": "category", "content": "category", "author": "category",
+                "created_at": "datetime64[ns]"},
+            REVIEWS: {"pull_request_id": "Int64", "author": "category", "state": "category", "submitted_at": "datetime64[ns]"},
+            PULL_REQUESTS_REACTION_COUNTS: dict({"parent_id": "Int64", "parent_name": "category", "total_count": "Int64"},
+                **{content: "Int64" for content in Core.REACTION_CONTENTS})
+        }
 
-    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, data_root_dir, request_maximum, log_level)
+        __init__(self, github_connection, repo, data_root_dir, request_maximum, log_level, number_of_threads, storage)
 
         Initial pull request object with general information.
 
@@ -133,6 +159,10 @@ class PullRequests(Core):
             Maximum amount of returned informations for a general api call
         log_level : int
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO    
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object.
 
         Notes
         -----
@@ -147,7 +177,9 @@ class PullRequests(Core):
             data_root_dir,
             PullRequests.Files.DATA_DIR,
             request_maximum=request_maximum,
-            log_level=log_level
+            log_level=log_level,
+            number_of_threads=number_of_threads,
+            storage=storage
         )
     
     @property
@@ -209,6 +241,21 @@ class PullRequests(Core):
             
         """
         return Core.get_pandas_data_frame(self.current_dir, PullRequests.Files.PULL_REQUESTS_REACTIONS)
+
+    @property
+    def reaction_counts_df(self):
+        """
+        reaction_counts_df(self)
+
+        Pandas DataFrame object with the reaction counts of review comments.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the total count and the count of each reaction content per review comment.
+            
+        """
+        return Core.get_pandas_data_frame(self.current_dir, PullRequests.Files.PULL_REQUESTS_REACTION_COUNTS)
   
     def generate_pandas_tables(self, check_for_updates: bool = False, params: Params = Params()) -> None:
         """
@@ -216,6 +263,7 @@ class PullRequests(Core):
 
         Extracts the complete pull request data from a repository. 
         Check first if there are any new pull requests information in dependence of parameter check_for_updates.
+        The extraction is checkpointed periodically and a stopped extraction with the same params is resumed.
 
         Parameters
         ----------
@@ -239,36 +287,55 @@ class PullRequests(Core):
             if total_count == 0:
                 return
             if check_for_updates:
-                if params.reactions:
-                    self.logger.warning("Check for update does not work when param reactions is True")
+                if params.reactions or params.reaction_counts:
+                    self.logger.warning("Check for update does not work when param reactions or reaction_counts is True")
                 elif params.reviews:
                     self.logger.warning("Check for update does not work when param reviews is True")
                 else:
-                    old_pull_requests = self.pull_request_df
+                    old_pull_requests = self.pull_requests_df
                     if not self.check_for_updates_paginated(pull_requests, total_count, old_pull_requests):
                         self.logger.info("No new Pull Request information!")
                         return
-        self.__pull_request_list = []
-        self.__review_comment_list = []
-        self.__reviews_list = []
-        self.__reactions_list = []
-        if extract_pull_requests:
+        self.__pull_request_list = self.get_table_writer(PullRequests.Files.PULL_REQUESTS)
+        self.__review_comment_list = self.get_table_writer(PullRequests.Files.REVIEWS_COMMENTS)
+        self.__reviews_list = self.get_table_writer(PullRequests.Files.REVIEWS)
+        self.__reactions_list = self.get_table_writer(PullRequests.Files.PULL_REQUESTS_REACTIONS)
+        self.__reaction_counts_list = self.get_table_writer(PullRequests.Files.PULL_REQUESTS_REACTION_COUNTS)
+        old_reactions_df = self.reactions_df if params.reaction_counts and params.reactions else DataFrame()
+        self.__stored_reaction_counts = Core.get_stored_reaction_counts(old_reactions_df)
+        self.start_checkpoint(
+            params,
+            pull_requests=self.__pull_request_list,
+            review_comments=self.__review_comment_list,
+            reviews=self.__reviews_list,
+            reactions=self.__reactions_list,
+            reaction_counts=self.__reaction_counts_list)
+        if extract_pull_requests and not self.get_checkpoint_progress("Pull Requests").get("finished"):
             # check if issues(with pull request data) are extracted
-            issues_df = Core.get_pandas_data_frame(Path(self.repo_data_dir,Issues.Files.DATA_DIR), Issues.Files.ISSUES)
+            issues_df = Core.get_pandas_data_frame(Path(self.repo_data_dir,Issues.Files.DATA_DIR), Issues.Files.ISSUES, columns=["is_pull_request", "number"])
             if issues_df.empty or issues_df[issues_df["is_pull_request"] == True]["is_pull_request"].count() < total_count:
                 self.logger.info("Issues are missing. Extracting Issues now!")
                 issues = Issues(
                     self.github_connection,
                     self.repo,
                     self.repo_data_root_dir,
-                    self.request_maximum
+                    self.request_maximum,
+                    storage=self.storage
                     )
                 issues.generate_pandas_tables(params=params.issues_params)
                 issues_df = issues.issues_df
+            # pull requests of a resumed extraction
+            extracted_ids = set()
+            extracted_numbers = set()
+            for pull_request_data in self.__pull_request_list:
+                extracted_ids.add(pull_request_data["id"])
+                extracted_numbers.add(pull_request_data["number"])
             if total_count < self.request_maximum:
-                for i in self.progress_bar(range(total_count), "Pull Requests:   "):
-                    pull_request = self.get_save_api_data(pull_requests, i)
+                for pull_request in self.progress_bar(self.get_save_items(pull_requests), "Pull Requests:   ", total=total_count):
+                    if pull_request.id in extracted_ids:
+                        continue
                     self.extract_pull_request(pull_request, params)
+                    self.update_checkpoint("Pull Requests")
             else:
                 # get a pull request for each issue labeled as pull request
                 pull_requests_df = issues_df[issues_df["is_pull_request"] == True]
@@ -277,8 +344,13 @@ class PullRequests(Core):
                     while issues_df.loc[count,"is_pull_request"] == False:
                         count += 1
                     number = int(issues_df.loc[count,"number"])
+                    count += 1
+                    if number in extracted_numbers:
+                        continue
                     pull_request = self.save_api_call(self.repo.get_pull, number)
                     self.extract_pull_request(pull_request, params)
+                    self.update_checkpoint("Pull Requests")
+            self.update_checkpoint("Pull Requests", finished=True)
         if params.review_comments:
             # extract comments
             self.extract_with_updated_and_since(
@@ -287,17 +359,27 @@ class PullRequests(Core):
                 self.extract_review_comment,
                 params)
         if extract_pull_requests:
-            pull_request_df = DataFrame(self.__pull_request_list)
+            pull_request_df = self.__pull_request_list.to_data_frame()
             self.save_pandas_data_frame(PullRequests.Files.PULL_REQUESTS, pull_request_df)
         if params.review_comments:
-            review_comment_df = DataFrame(self.__review_comment_list)
+            review_comment_df = self.__review_comment_list.to_data_frame()
             self.save_pandas_data_frame(PullRequests.Files.REVIEWS_COMMENTS, review_comment_df)
         if params.reviews:
-            reviews_df = DataFrame(self.__reviews_list)
+            reviews_df = self.__reviews_list.to_data_frame()
             self.save_pandas_data_frame(PullRequests.Files.REVIEWS, reviews_df)
+        if params.reaction_counts:
+            reaction_counts_df = self.__reaction_counts_list.to_data_frame()
+            self.save_pandas_data_frame(PullRequests.Files.PULL_REQUESTS_REACTION_COUNTS, reaction_counts_df)
         if params.reactions:
-            reactions_df = DataFrame(self.__reactions_list)
+            reactions_df = self.__reactions_list.to_data_frame()
+            if params.reaction_counts:
+                # the reactions of review comments with unchanged counts were not requested again
+                reactions_df = Core.upsert_data_frame(Core.get_unchanged_reactions(old_reactions_df, reaction_counts_df), reactions_df)
             self.save_pandas_data_frame(PullRequests.Files.PULL_REQUESTS_REACTIONS, reactions_df)
+        for table_writer in [self.__pull_request_list, self.__review_comment_list, self.__reviews_list, self.__reactions_list, self.__reaction_counts_list]:
+            table_writer.clear()
+        self.remove_checkpoint()
+        self.user_registry.compact()
     
     def extract_pull_request(self, pull_request: GitHubPullRequest, params: Params) -> None:
         """
@@ -320,33 +402,21 @@ class PullRequests(Core):
         pull_request_data = self.__extract_pull_request_data(pull_request, params.deep_pull_requests)
         if params.reviews:
             reviews = self.save_api_call(pull_request.get_reviews)
-            for i in range(self.request_maximum):
-                try:
-                    review = self.get_save_api_data(reviews, i)
-                    review_data = self.save_api_call(self.__extract_review_data, review, pull_request.id)
-                    self.__reviews_list.append(review_data)
-                except IndexError:
-                    break
+            for review in self.get_save_items(reviews):
+                review_data = self.save_api_call(self.__extract_review_data, review, pull_request.id)
+                self.__reviews_list.append(review_data)
         if params.review_requests:
             pull_request_data["review_requested_users"] = []
             review_requests_users, review_requests_teams = self.save_api_call(pull_request.get_review_requests)
-            for i in range(self.request_maximum):
-                try:
-                    review_request_user = self.get_save_api_data(review_requests_users, i)
-                    pull_request_data["review_requested_users"].append(self.extract_user_data(review_request_user))
-                except IndexError:
-                    break
+            for review_request_user in self.get_save_items(review_requests_users):
+                pull_request_data["review_requested_users"].append(self.extract_user_data(review_request_user))
         
         if params.commits:
             # Maximum of 250 Commits
-            pull_request_data["commits"] = []
+            pull_request_data["commit_shas"] = []
             commits = self.save_api_call(pull_request.get_commits)
-            for i in range(self.request_maximum):
-                try:
-                    commit = self.get_save_api_data(commits, i)
-                    pull_request_data["commit_shas"].append(commit.sha)
-                except IndexError:
-                    break
+            for commit in self.get_save_items(commits):
+                pull_request_data["commit_shas"].append(commit.sha)
         self.__pull_request_list.append(pull_request_data)
 
     def extract_review_comment(self, data: GitHubPullRequestComment, params: Params) -> None:
@@ -369,7 +439,18 @@ class PullRequests(Core):
         """
         review_comment_data = self.save_api_call(self.__extract_review_comment_data, data)
         self.__review_comment_list.append(review_comment_data)
-        if params.reactions:
+        if params.reaction_counts:
+            reaction_counts = self.extract_reaction_counts(data, data.id, "review_comment")
+            if reaction_counts is not None:
+                self.__reaction_counts_list.append(reaction_counts)
+            if params.reactions:
+                self.__reactions_list += self.extract_changed_reactions(
+                    data.get_reactions,
+                    data.id,
+                    "review_comment",
+                    reaction_counts,
+                    self.__stored_reaction_counts)
+        elif params.reactions:
             self.__reactions_list += self.extract_reactions(
                 data.get_reactions,
                 data.id,
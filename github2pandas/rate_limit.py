@@ -0,0 +1,465 @@
+import json
+import logging
+import threading
+import time
+from typing import Union
+# github imports
+from github.MainClass import Github
+# github2pandas imports
+from github2pandas.connection import Connection, ConnectionHook, Request, Response
+
+class RateLimitScheduler(ConnectionHook):
+    """
+    Connection hook which schedules all requests of a Github object within the rate limits of GitHub.
+
+    The remaining requests and the reset time are read from the X-RateLimit headers of every response.
+    Requests are sent without delay as long as enough requests are remaining. Below pace_threshold
+    the remaining requests are spread evenly until the reset. Requests which hit the primary or the
+    secondary rate limit are sent again after the reset or after Retry-After.
+
+    With a pool of tokens every request is sent with the token which has the most remaining requests
+    and the rate limits are accounted per token. A token of the pool is either a string or a function
+    which returns a token, e.g. for GitHub App installation tokens. The function is called again if
+    GitHub rejects the returned token.
+
+    Attributes
+    ----------
+    SECONDARY_RATE_LIMIT_WAIT : int
+        Seconds to wait after a secondary rate limit without Retry-After header.
+    RESET_MARGIN : int
+        Additional seconds to wait after a reset time.
+    pace_threshold : float
+        Fraction of the rate limit below which the remaining requests are spread until the reset.
+    reserve : int
+        Number of requests which are kept until the reset.
+    limits : dict
+        Dictionary with the token index and the resource as key and a dictionary with limit, remaining and reset as value.
+        The token index is None for the token of the Github object.
+    requests : dict
+        Dictionary with the token index and the resource as key and the number of sent requests as value.
+    sleep_time : float
+        Total seconds slept by the scheduler.
+    logger : logging.Logger
+        Referenz to a logger object.
+
+    Methods
+    -------
+    install(github_connection, github_tokens=None)
+        Returns the scheduler of a Github object and installs one if necessary.
+    __init__(self, pace_threshold=0.2, reserve=0, sleep=time.sleep)
+        Initializes the scheduler.
+    add_tokens(self, github_tokens)
+        Adds tokens to the pool of tokens.
+    get_resource(url)
+        Returns the rate limit resource of a request url.
+    before_request(self, request)
+        Selects the token and waits until the request may be sent.
+    after_response(self, request, response)
+        Updates the rate limits and requests a resend if a rate limit was hit.
+    wait_for_reset(self, resource="core")
+        Waits until the rate limit of the resource is reset, if no request is remaining.
+    get_remaining(self, resource="core")
+        Returns the number of remaining requests of a resource.
+    get_token_usage(self)
+        Returns the rate limits and the number of requests per token.
+
+    """
+    SECONDARY_RATE_LIMIT_WAIT = 60
+    RESET_MARGIN = 1
+    __install_lock = threading.Lock()
+
+    @staticmethod
+    def install(github_connection: Github, github_tokens: list = None) -> "RateLimitScheduler":
+        """
+        install(github_connection, github_tokens=None)
+
+        Returns the scheduler of a Github object and installs one if necessary.
+        All objects using the same Github object share the scheduler.
+
+        Parameters
+        ----------
+        github_connection : Github
+            Github object from pygithub.
+        github_tokens : list, default=None
+            Pool of tokens. A token is a string or a function which returns a token.
+
+        Returns
+        -------
+        RateLimitScheduler
+            Scheduler of the Github object.
+
+        """
+        connection = Connection.install(github_connection)
+        with RateLimitScheduler.__install_lock:
+            scheduler = connection.get_hook(RateLimitScheduler)
+            if scheduler is None:
+                scheduler = connection.add_hook(RateLimitScheduler())
+        if github_tokens:
+            scheduler.add_tokens(github_tokens)
+        return scheduler
+
+    def __init__(self, pace_threshold: float = 0.2, reserve: int = 0, sleep = time.sleep) -> None:
+        """
+        __init__(self, pace_threshold=0.2, reserve=0, sleep=time.sleep)
+
+        Initializes the scheduler.
+
+        Parameters
+        ----------
+        pace_threshold : float, default=0.2
+            Fraction of the rate limit below which the remaining requests are spread until the reset.
+        reserve : int, default=0
+            Number of requests which are kept until the reset.
+        sleep : Function, default=time.sleep
+            Function which is called to wait.
+
+        """
+        self.pace_threshold = pace_threshold
+        self.reserve = reserve
+        self.limits = {}
+        self.requests = {}
+        self.sleep_time = 0
+        self.logger = logging.getLogger("github2pandas")
+        self.__sleep = sleep
+        self.__lock = threading.Lock()
+        self.__tokens = []
+        self.__token_values = []
+        self.__next_request_time = {}
+        self.__blocked_until = {}
+
+    def add_tokens(self, github_tokens: list) -> None:
+        """
+        add_tokens(self, github_tokens)
+
+        Adds tokens to the pool of tokens. Tokens which are already in the pool are ignored.
+
+        Parameters
+        ----------
+        github_tokens : list
+            Pool of tokens. A token is a string or a function which returns a token.
+
+        """
+        with self.__lock:
+            for github_token in github_tokens:
+                if github_token not in self.__tokens:
+                    self.__tokens.append(github_token)
+                    self.__token_values.append(None)
+
+    @staticmethod
+    def get_resource(url: str) -> str:
+        """
+        get_resource(url)
+
+        Returns the rate limit resource of a request url.
+
+        Parameters
+        ----------
+        url : str
+            Path and query of the request.
+
+        Returns
+        -------
+        str
+            Name of the rate limit resource.
+
+        """
+        path = url.split("?")[0]
+        if path.endswith("/rate_limit"):
+            return "rate_limit"
+        if "/search/code" in path:
+            return "code_search"
+        if "/search/" in path:
+            return "search"
+        if path.endswith("/graphql"):
+            return "graphql"
+        return "core"
+
+    def before_request(self, request: Request) -> Union[Response, None]:
+        """
+        before_request(self, request)
+
+        Selects the token and waits until the request may be sent. One remaining request is reserved for the request.
+
+        Parameters
+        ----------
+        request : Request
+            Request to send.
+
+        Returns
+        -------
+        None
+            The request is always sent.
+
+        """
+        resource = RateLimitScheduler.get_resource(request.url)
+        with self.__lock:
+            token_index = self.__select_token(resource)
+        if token_index is not None:
+            request.headers["Authorization"] = f"token {self.__get_token_value(token_index)}"
+        request.token_index = token_index
+        if resource == "rate_limit":
+            return None
+        key = (token_index, resource)
+        with self.__lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+            now = time.time()
+            send_time = max(now, self.__blocked_until.get(key, 0))
+            limit = self.limits.get(key)
+            if limit is not None:
+                if limit["reset"] + RateLimitScheduler.RESET_MARGIN <= send_time:
+                    # the rate limit window is over, the next response updates the limit
+                    del self.limits[key]
+                elif limit["remaining"] <= self.reserve:
+                    send_time = limit["reset"] + RateLimitScheduler.RESET_MARGIN
+                    self.__blocked_until[key] = send_time
+                    del self.limits[key]
+                else:
+                    if limit["remaining"] < limit["limit"] * self.pace_threshold:
+                        send_time = max(send_time, self.__next_request_time.get(key, 0))
+                        interval = (limit["reset"] - send_time) / (limit["remaining"] - self.reserve)
+                        self.__next_request_time[key] = send_time + max(0, interval)
+                    limit["remaining"] -= 1
+        if send_time > now:
+            self.__wait(send_time - now, f"{resource} rate limit")
+        return None
+
+    def after_response(self, request: Request, response: Response) -> Union[Response, None]:
+        """
+        after_response(self, request, response)
+
+        Updates the rate limits and requests a resend if a rate limit was hit.
+
+        Parameters
+        ----------
+        request : Request
+            Sent request.
+        response : Response
+            Received response.
+
+        Returns
+        -------
+        Response or None
+            The response or None to send the request again.
+
+        """
+        token_index = getattr(request, "token_index", None)
+        headers = {key.lower(): value for key, value in response.getheaders()}
+        resource = headers.get("x-ratelimit-resource", RateLimitScheduler.get_resource(request.url))
+        key = (token_index, resource)
+        if "x-ratelimit-remaining" in headers and "x-ratelimit-reset" in headers and resource != "rate_limit":
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = int(headers["x-ratelimit-reset"])
+            with self.__lock:
+                limit = self.limits.get(key)
+                if limit is None or limit["reset"] != reset:
+                    self.limits[key] = {"limit": int(headers.get("x-ratelimit-limit", remaining)), "remaining": remaining, "reset": reset}
+                else:
+                    # responses of concurrent requests may arrive in any order
+                    limit["remaining"] = min(limit["remaining"], remaining)
+        if response.status == 401 and token_index is not None and callable(self.__tokens[token_index]) and not getattr(request, "token_renewed", False):
+            # the token of the function is expired, a new token is requested once
+            with self.__lock:
+                self.__token_values[token_index] = None
+            request.token_renewed = True
+            return None
+        if response.status not in [403, 429]:
+            return response
+        wait_until = None
+        if "retry-after" in headers:
+            wait_until = time.time() + int(headers["retry-after"])
+        elif headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            wait_until = int(headers["x-ratelimit-reset"]) + RateLimitScheduler.RESET_MARGIN
+        elif "secondary rate limit" in self.__get_message(response).lower():
+            wait_until = time.time() + RateLimitScheduler.SECONDARY_RATE_LIMIT_WAIT
+        if wait_until is None:
+            return response
+        with self.__lock:
+            # all threads using the token wait until the rate limit is over
+            self.__blocked_until[key] = max(self.__blocked_until.get(key, 0), wait_until)
+        self.logger.info(f"Rate limit hit by {request.verb} {request.url.split('?')[0]}")
+        return None
+
+    def wait_for_reset(self, resource: str = "core") -> None:
+        """
+        wait_for_reset(self, resource="core")
+
+        Waits until the rate limit of the resource is reset, if no token has a remaining request.
+
+        Parameters
+        ----------
+        resource : str, default="core"
+            Name of the rate limit resource.
+
+        """
+        with self.__lock:
+            token_index = self.__select_token(resource)
+            key = (token_index, resource)
+            wait_until = self.__blocked_until.get(key, 0)
+            limit = self.limits.get(key)
+            if limit is not None and limit["remaining"] <= self.reserve:
+                wait_until = max(wait_until, limit["reset"] + RateLimitScheduler.RESET_MARGIN)
+        seconds = wait_until - time.time()
+        if seconds > 0:
+            self.__wait(seconds, f"{resource} rate limit")
+
+    def get_remaining(self, resource: str = "core") -> Union[int, None]:
+        """
+        get_remaining(self, resource="core")
+
+        Returns the number of remaining requests of a resource summed over all tokens.
+
+        Parameters
+        ----------
+        resource : str, default="core"
+            Name of the rate limit resource.
+
+        Returns
+        -------
+        int or None
+            Remaining requests or None if no response of the resource was received.
+
+        """
+        with self.__lock:
+            remaining = [limit["remaining"] for (token_index, limit_resource), limit in self.limits.items() if limit_resource == resource]
+            return sum(remaining) if len(remaining) > 0 else None
+
+    def get_token_usage(self) -> dict:
+        """
+        get_token_usage(self)
+
+        Returns the rate limits and the number of requests per token.
+
+        Returns
+        -------
+        dict
+            Dictionary with the token index as key and a dictionary with the resource as key
+            and a dictionary with requests, limit, remaining and reset as value.
+            The token index is None for the token of the Github object.
+
+        """
+        usage = {}
+        with self.__lock:
+            for (token_index, resource), count in self.requests.items():
+                usage.setdefault(token_index, {})[resource] = {"requests": count}
+            for (token_index, resource), limit in self.limits.items():
+                usage.setdefault(token_index, {}).setdefault(resource, {"requests": 0}).update(limit)
+        return usage
+
+    def __select_token(self, resource: str) -> Union[int, None]:
+        """
+        __select_token(self, resource)
+
+        Selects the token with the most remaining requests. Tokens without known rate limit are preferred.
+        If no token has a remaining request, the token with the earliest reset is selected.
+        Has to be called with the lock.
+
+        Parameters
+        ----------
+        resource : str
+            Name of the rate limit resource.
+
+        Returns
+        -------
+        int or None
+            Index of the token or None if there is no pool of tokens.
+
+        """
+        if len(self.__tokens) == 0:
+            return None
+        now = time.time()
+        best_token_index = None
+        best_remaining = None
+        earliest_token_index = None
+        earliest_reset = None
+        for token_index in range(len(self.__tokens)):
+            key = (token_index, resource)
+            limit = self.limits.get(key)
+            blocked_until = self.__blocked_until.get(key, 0)
+            if blocked_until > now:
+                remaining = 0
+                reset = blocked_until
+            elif limit is None or limit["reset"] + RateLimitScheduler.RESET_MARGIN <= now:
+                return token_index
+            else:
+                remaining = limit["remaining"] - self.reserve
+                reset = limit["reset"]
+            if best_remaining is None or remaining > best_remaining:
+                best_token_index = token_index
+                best_remaining = remaining
+            if earliest_reset is None or reset < earliest_reset:
+                earliest_token_index = token_index
+                earliest_reset = reset
+        if best_remaining > 0:
+            return best_token_index
+        return earliest_token_index
+
+    def __get_token_value(self, token_index: int) -> str:
+        """
+        __get_token_value(self, token_index)
+
+        Returns the token of the pool. The function of a token is called if the token is not known.
+
+        Parameters
+        ----------
+        token_index : int
+            Index of the token.
+
+        Returns
+        -------
+        str
+            Token.
+
+        """
+        token = self.__tokens[token_index]
+        if not callable(token):
+            return token
+        with self.__lock:
+            token_value = self.__token_values[token_index]
+        if token_value is None:
+            token_value = token()
+            with self.__lock:
+                self.__token_values[token_index] = token_value
+        return token_value
+
+    def __wait(self, seconds: float, reason: str) -> None:
+        """
+        __wait(self, seconds, reason)
+
+        Waits the given seconds.
+
+        Parameters
+        ----------
+        seconds : float
+            Seconds to wait.
+        reason : str
+            Reason for the log.
+
+        """
+        if seconds >= 1:
+            self.logger.info(f"Waiting {seconds:.0f}s for {reason} ...")
+        with self.__lock:
+            self.sleep_time += seconds
+        self.__sleep(seconds)
+
+    @staticmethod
+    def __get_message(response: Response) -> str:
+        """
+        __get_message(response)
+
+        Returns the message of an error response.
+
+        Parameters
+        ----------
+        response : Response
+            Received response.
+
+        Returns
+        -------
+        str
+            Message of the response or an empty string.
+
+        """
+        try:
+            return str(json.loads(response.read()).get("message", ""))
+        except (ValueError, AttributeError, TypeError):
+            return ""
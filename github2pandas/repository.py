@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import Union
 import numpy as np
 #import numpy
 from pandas import DataFrame
@@ -11,6 +12,7 @@ from github.MainClass import Github
 from github.Repository import Repository as GitHubRepository
 # github2pandas imports
 from github2pandas.core import Core
+from github2pandas.storage import Storage
 
 class Repository(Core):
     """
@@ -25,7 +27,7 @@ class Repository(Core):
  
     Methods
     -------
-    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
         Initializes git repository object with general information.
     generate_pandas_tables(self, contributor_companies_included = False)
         Extracting the basic repository data.
@@ -83,9 +85,9 @@ class Repository(Core):
         DATA_DIR = "Repository"
         REPOSITORY = "Repository.p"
           
-    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
 
         Initializes git repository object with general information.
 
@@ -101,6 +103,10 @@ class Repository(Core):
             Maximum amount of returned informations for a general api call
         log_level : int
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object.
         Notes
         -----
             PyGithub Github object structure: https://pygithub.readthedocs.io/en/latest/github.html
@@ -114,7 +120,9 @@ class Repository(Core):
             data_root_dir,
             Repository.Files.DATA_DIR,
             request_maximum=request_maximum,
-            log_level=log_level
+            log_level=log_level,
+            number_of_threads=number_of_threads,
+            storage=storage
         )
 
     @property
@@ -0,0 +1,523 @@
+import operator
+import pickle
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+class StorageError(Exception):
+    """
+    Exception for data frames which are not supported by a storage backend.
+
+    """
+
+class Storage():
+    """
+    Base class of the storage backends, which save and load the pandas tables.
+
+    The tables are named by the filenames of the Files classes, e.g. Issues.p. A backend replaces the
+    suffix .p by its own suffix. Tables are loaded from the file of any backend, so existing pickles
+    are still readable after the backend is changed.
+
+    Attributes
+    ----------
+    NAME : str
+        Name of the backend.
+    SUFFIX : str
+        Suffix of the files.
+    OPERATORS : dict
+        Comparison operators of the filters, additionally "in" and "not in" are supported.
+
+    Methods
+    -------
+    get_storage_classes()
+        Returns all storage backend classes.
+    get_storage(storage="pickle", compression=None)
+        Returns a storage backend by name.
+    get_file(cls, data_dir, filename)
+        Returns the path of a table.
+    save(self, data_frame, file)
+        Saves a data frame to a file.
+    load(self, file, columns=None, filters=None)
+        Loads a data frame from a file.
+    find_file(data_dir, filename)
+        Returns the newest file of a table and its backend.
+    get_filter_value(value, is_datetime)
+        Returns the value of a filter, datetime strings are converted to timestamps.
+    filter_data_frame(data_frame, columns=None, filters=None)
+        Selects columns and rows of a loaded data frame.
+
+    """
+    NAME = ""
+    SUFFIX = ""
+    OPERATORS = {"==": operator.eq, "=": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+    @staticmethod
+    def get_storage_classes() -> list:
+        """
+        get_storage_classes()
+
+        Returns all storage backend classes.
+
+        Returns
+        -------
+        list
+            PickleStorage, ParquetStorage and FeatherStorage.
+
+        """
+        return [PickleStorage, ParquetStorage, FeatherStorage]
+
+    @staticmethod
+    def get_storage(storage: Union[str, "Storage"] = "pickle", compression: str = None) -> "Storage":
+        """
+        get_storage(storage="pickle", compression=None)
+
+        Returns a storage backend by name.
+
+        Parameters
+        ----------
+        storage : str or Storage, default="pickle"
+            Name of the backend ("pickle", "parquet" or "feather") or a Storage object, which is returned.
+        compression : str, default=None
+            Compression of the backend, the default compression of the backend if None.
+
+        Returns
+        -------
+        Storage
+            The storage backend.
+
+        """
+        if isinstance(storage, Storage):
+            return storage
+        for storage_class in Storage.get_storage_classes():
+            if storage_class.NAME == storage:
+                if compression is None:
+                    return storage_class()
+                return storage_class(compression)
+        raise ValueError(f"Unknown storage backend: {storage}")
+
+    @classmethod
+    def get_file(cls, data_dir: Path, filename: str) -> Path:
+        """
+        get_file(cls, data_dir, filename)
+
+        Returns the path of a table.
+
+        Parameters
+        ----------
+        data_dir : Path
+            Data directory of the table.
+        filename : str
+            Filename of the Files class.
+
+        Returns
+        -------
+        Path
+            Path of the table with the suffix of the backend.
+
+        """
+        return Path(data_dir, Path(filename).stem + cls.SUFFIX)
+
+    def save(self, data_frame: pd.DataFrame, file: Path) -> None:
+        """
+        save(self, data_frame, file)
+
+        Saves a data frame to a file.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame to save.
+        file : Path
+            Path of the file.
+
+        """
+        raise NotImplementedError
+
+    def load(self, file: Path, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """
+        load(self, file, columns=None, filters=None)
+
+        Loads a data frame from a file.
+
+        Parameters
+        ----------
+        file : Path
+            Path of the file.
+        columns : list, default=None
+            Names of the loaded columns, all columns if None. Columns which are not in the table are ignored.
+        filters : list, default=None
+            Conditions of the loaded rows as tuples (column, operator, value), e.g. ("state", "==", "open")
+            or ("created_at", ">=", "2021-01-01"). All conditions have to be true.
+
+        Returns
+        -------
+        pd.DataFrame
+            The loaded DataFrame.
+
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def find_file(data_dir: Path, filename: str) -> tuple:
+        """
+        find_file(data_dir, filename)
+
+        Returns the newest file of a table and its backend.
+
+        Parameters
+        ----------
+        data_dir : Path
+            Data directory of the table.
+        filename : str
+            Filename of the Files class.
+
+        Returns
+        -------
+        tuple
+            Path and Storage of the newest file or None and None if no file exists.
+
+        """
+        newest_file = None
+        newest_class = None
+        for storage_class in Storage.get_storage_classes():
+            file = storage_class.get_file(data_dir, filename)
+            if file.is_file():
+                if newest_file is None or file.stat().st_mtime > newest_file.stat().st_mtime:
+                    newest_file = file
+                    newest_class = storage_class
+        if newest_file is None:
+            return None, None
+        return newest_file, newest_class()
+
+    @staticmethod
+    def get_filter_value(value, is_datetime: bool):
+        """
+        get_filter_value(value, is_datetime)
+
+        Returns the value of a filter, datetime strings are converted to timestamps.
+
+        Parameters
+        ----------
+        value
+            Value or list of values of a filter.
+        is_datetime : bool
+            Is the column a datetime column?
+
+        Returns
+        -------
+        Any
+            Value or list of values, which is comparable with the column.
+
+        """
+        if not is_datetime:
+            return value
+        if isinstance(value, (list, tuple, set)):
+            return [pd.Timestamp(item) for item in value]
+        return pd.Timestamp(value)
+
+    @staticmethod
+    def filter_data_frame(data_frame: pd.DataFrame, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """
+        filter_data_frame(data_frame, columns=None, filters=None)
+
+        Selects columns and rows of a loaded data frame.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            The loaded DataFrame.
+        columns : list, default=None
+            Names of the selected columns, all columns if None.
+        filters : list, default=None
+            Conditions of the selected rows as tuples (column, operator, value).
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the selected columns and rows.
+
+        Raises
+        ------
+        KeyError
+            If a filter column is not in the data frame.
+
+        """
+        if filters:
+            mask = pd.Series(True, index=data_frame.index)
+            for column, op, value in filters:
+                if column not in data_frame:
+                    raise KeyError(f"Unknown filter column: {column}")
+                series = data_frame[column]
+                value = Storage.get_filter_value(value, pd.api.types.is_datetime64_any_dtype(series))
+                if op == "in":
+                    mask &= series.isin(value)
+                elif op == "not in":
+                    mask &= ~series.isin(value)
+                else:
+                    mask &= Storage.OPERATORS[op](series, value)
+            data_frame = data_frame[mask].reset_index(drop=True)
+        if columns is not None:
+            data_frame = data_frame[[column for column in columns if column in data_frame]]
+        return data_frame
+
+class PickleStorage(Storage):
+    """
+    Storage backend which pickles the data frames.
+
+    Methods
+    -------
+    save(self, data_frame, file)
+        Saves a data frame to a pickle file.
+    load(self, file, columns=None, filters=None)
+        Loads a data frame from a pickle file.
+
+    """
+    NAME = "pickle"
+    SUFFIX = ".p"
+
+    def save(self, data_frame: pd.DataFrame, file: Path) -> None:
+        """
+        save(self, data_frame, file)
+
+        Saves a data frame to a pickle file.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame to save.
+        file : Path
+            Path of the file.
+
+        """
+        with open(file, "wb") as f:
+            pickle.dump(data_frame, f)
+
+    def load(self, file: Path, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """
+        load(self, file, columns=None, filters=None)
+
+        Loads a data frame from a pickle file. Pickles are loaded completely before columns and rows are selected.
+
+        Parameters
+        ----------
+        file : Path
+            Path of the file.
+        columns : list, default=None
+            Names of the loaded columns, all columns if None.
+        filters : list, default=None
+            Conditions of the loaded rows as tuples (column, operator, value).
+
+        Returns
+        -------
+        pd.DataFrame
+            The loaded DataFrame.
+
+        """
+        return Storage.filter_data_frame(pd.read_pickle(file), columns, filters)
+
+class ArrowStorage(Storage):
+    """
+    Base class of the columnar storage backends, which require pyarrow.
+
+    Attributes
+    ----------
+    compression : str
+        Compression of the files.
+    FORMAT : str
+        Format name of the pyarrow datasets.
+
+    Methods
+    -------
+    __init__(self, compression)
+        Initializes the backend.
+    save(self, data_frame, file)
+        Saves a data frame to a file.
+    _write(self, data_frame, file)
+        Writes a data frame to a file, implemented by the backends.
+    load(self, file, columns=None, filters=None)
+        Loads a data frame from a file, columns and filters are pushed down into the file scan.
+
+    """
+    FORMAT = ""
+
+    def __init__(self, compression: str) -> None:
+        """
+        __init__(self, compression)
+
+        Initializes the backend.
+
+        Parameters
+        ----------
+        compression : str
+            Compression of the files.
+
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(f"The {self.NAME} storage requires pyarrow: pip install pyarrow") from e
+        self.compression = compression
+
+    def save(self, data_frame: pd.DataFrame, file: Path) -> None:
+        """
+        save(self, data_frame, file)
+
+        Saves a data frame to a file.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame to save.
+        file : Path
+            Path of the file.
+
+        Raises
+        ------
+        StorageError
+            If a column is not convertible to an arrow column, e.g. an object column with mixed types.
+
+        """
+        import pyarrow
+        try:
+            self._write(data_frame, file)
+        except (pyarrow.ArrowException, ValueError) as e:
+            Path(file).unlink(missing_ok=True)
+            raise StorageError(f"The {self.NAME} storage does not support the data frame: {e}") from e
+
+    def load(self, file: Path, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """
+        load(self, file, columns=None, filters=None)
+
+        Loads a data frame from a file. Only the selected columns are read and the filters are applied
+        while the file is scanned, so row groups which do not match are skipped.
+
+        Parameters
+        ----------
+        file : Path
+            Path of the file.
+        columns : list, default=None
+            Names of the loaded columns, all columns if None.
+        filters : list, default=None
+            Conditions of the loaded rows as tuples (column, operator, value).
+
+        Returns
+        -------
+        pd.DataFrame
+            The loaded DataFrame.
+
+        Raises
+        ------
+        KeyError
+            If a filter column is not in the file.
+
+        """
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        import pyarrow.types
+        dataset = ds.dataset(file, format=self.FORMAT)
+        schema = dataset.schema
+        expression = None
+        for column, op, value in filters or []:
+            if column not in schema.names:
+                raise KeyError(f"Unknown filter column: {column}")
+            value = Storage.get_filter_value(value, pyarrow.types.is_timestamp(schema.field(column).type))
+            field = pc.field(column)
+            if op == "in":
+                condition = field.isin(value)
+            elif op == "not in":
+                condition = ~field.isin(value)
+            else:
+                condition = Storage.OPERATORS[op](field, value)
+            expression = condition if expression is None else expression & condition
+        if columns is not None:
+            columns = [column for column in columns if column in schema.names]
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+class ParquetStorage(ArrowStorage):
+    """
+    Storage backend which saves the data frames as Parquet files.
+
+    Methods
+    -------
+    __init__(self, compression="snappy")
+        Initializes the backend.
+
+    """
+    NAME = "parquet"
+    FORMAT = "parquet"
+    SUFFIX = ".parquet"
+
+    def __init__(self, compression: str = "snappy") -> None:
+        """
+        __init__(self, compression="snappy")
+
+        Initializes the backend.
+
+        Parameters
+        ----------
+        compression : str, default="snappy"
+            Compression of the files ("snappy", "gzip", "brotli", "zstd" or "none").
+
+        """
+        ArrowStorage.__init__(self, compression)
+
+    def _write(self, data_frame: pd.DataFrame, file: Path) -> None:
+        """
+        _write(self, data_frame, file)
+
+        Writes a data frame to a Parquet file.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame to save.
+        file : Path
+            Path of the file.
+
+        """
+        data_frame.to_parquet(file, engine="pyarrow", compression=self.compression)
+
+class FeatherStorage(ArrowStorage):
+    """
+    Storage backend which saves the data frames as Feather files.
+
+    Methods
+    -------
+    __init__(self, compression="lz4")
+        Initializes the backend.
+
+    """
+    NAME = "feather"
+    FORMAT = "feather"
+    SUFFIX = ".feather"
+
+    def __init__(self, compression: str = "lz4") -> None:
+        """
+        __init__(self, compression="lz4")
+
+        Initializes the backend.
+
+        Parameters
+        ----------
+        compression : str, default="lz4"
+            Compression of the files ("lz4", "zstd" or "uncompressed").
+
+        """
+        ArrowStorage.__init__(self, compression)
+
+    def _write(self, data_frame: pd.DataFrame, file: Path) -> None:
+        """
+        _write(self, data_frame, file)
+
+        Writes a data frame to a Feather file.
+
+        Parameters
+        ----------
+        data_frame : pd.DataFrame
+            DataFrame to save.
+        file : Path
+            Path of the file.
+
+        """
+        # feather files do not store the index
+        data_frame.reset_index(drop=True).to_feather(file, compression=self.compression)
@@ -0,0 +1,222 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+class TableCache():
+    """
+    Process-wide cache of the loaded pandas tables.
+
+    A table is cached by the path of its file together with the modification time, size and inode of the file.
+    A cached table is only returned while the file is unchanged, so tables written by another process are
+    loaded again. The least recently used tables are removed if the cache exceeds max_size. The cache returns
+    and stores copies, so callers can modify the returned data frames.
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum memory usage of all cached tables in bytes. Nothing is cached if 0.
+    hits : int
+        Number of tables returned from the cache.
+    misses : int
+        Number of tables which were not in the cache or outdated.
+
+    Methods
+    -------
+    __init__(self, max_size=512*1024**2)
+        Initializes the table cache.
+    get_signature(file)
+        Returns the modification time, size and inode of a file.
+    get(self, file)
+        Returns a copy of a cached table.
+    put(self, file, data_frame)
+        Caches a copy of a table which was loaded from or saved to file.
+    invalidate(self, file=None)
+        Removes a table or all tables from the cache.
+    set_max_size(self, max_size)
+        Changes the maximum memory usage and removes tables if necessary.
+    get_size(self)
+        Returns the memory usage of all cached tables in bytes.
+
+    """
+
+    def __init__(self, max_size: int = 512*1024**2) -> None:
+        """
+        __init__(self, max_size=512*1024**2)
+
+        Initializes the table cache.
+
+        Parameters
+        ----------
+        max_size : int, default=512*1024**2
+            Maximum memory usage of all cached tables in bytes. Nothing is cached if 0.
+
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__tables = OrderedDict()
+        self.__size = 0
+
+    @staticmethod
+    def get_signature(file: Path) -> Union[tuple, None]:
+        """
+        get_signature(file)
+
+        Returns the modification time, size and inode of a file.
+
+        Parameters
+        ----------
+        file : Path
+            Path of the file.
+
+        Returns
+        -------
+        tuple or None
+            Modification time in nanoseconds, size and inode or None if the file does not exist.
+
+        """
+        try:
+            file_stat = os.stat(file)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino
+
+    def get(self, file: Path) -> Union[pd.DataFrame, None]:
+        """
+        get(self, file)
+
+        Returns a copy of a cached table.
+
+        Parameters
+        ----------
+        file : Path
+            Path of the file.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Copy of the cached table or None if the table is not cached or the file was changed.
+
+        """
+        key = str(Path(file).resolve())
+        signature = TableCache.get_signature(file)
+        with self.__lock:
+            entry = self.__tables.get(key)
+            if entry is None or entry[0] != signature:
+                if entry is not None:
+                    self.__remove(key)
+                self.misses += 1
+                return None
+            self.__tables.move_to_end(key)
+            self.hits += 1
+            data_frame = entry[1]
+        return data_frame.copy()
+
+    def put(self, file: Path, data_frame: pd.DataFrame) -> None:
+        """
+        put(self, file, data_frame)
+
+        Caches a copy of a table which was loaded from or saved to file.
+        Tables which are larger than max_size are not cached.
+
+        Parameters
+        ----------
+        file : Path
+            Path of the file.
+        data_frame : pd.DataFrame
+            Table of the file.
+
+        """
+        key = str(Path(file).resolve())
+        if self.max_size <= 0:
+            return
+        size = int(data_frame.memory_usage(index=True, deep=True).sum())
+        signature = TableCache.get_signature(file)
+        with self.__lock:
+            if key in self.__tables:
+                self.__remove(key)
+            if signature is None or size > self.max_size:
+                return
+            self.__tables[key] = (signature, data_frame.copy(), size)
+            self.__size += size
+            self.__evict()
+
+    def invalidate(self, file: Path = None) -> None:
+        """
+        invalidate(self, file=None)
+
+        Removes a table or all tables from the cache.
+
+        Parameters
+        ----------
+        file : Path, default=None
+            Path of the file. All tables are removed if None.
+
+        """
+        with self.__lock:
+            if file is None:
+                self.__tables.clear()
+                self.__size = 0
+            else:
+                key = str(Path(file).resolve())
+                if key in self.__tables:
+                    self.__remove(key)
+
+    def set_max_size(self, max_size: int) -> None:
+        """
+        set_max_size(self, max_size)
+
+        Changes the maximum memory usage and removes the least recently used tables if necessary.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum memory usage of all cached tables in bytes. Nothing is cached if 0.
+
+        """
+        with self.__lock:
+            self.max_size = max_size
+            self.__evict()
+
+    def get_size(self) -> int:
+        """
+        get_size(self)
+
+        Returns the memory usage of all cached tables in bytes.
+
+        Returns
+        -------
+        int
+            Memory usage of all cached tables.
+
+        """
+        return self.__size
+
+    def __remove(self, key: str) -> None:
+        """
+        __remove(self, key)
+
+        Removes a table from the cache, the lock has to be held.
+
+        Parameters
+        ----------
+        key : str
+            Resolved path of the file.
+
+        """
+        signature, data_frame, size = self.__tables.pop(key)
+        self.__size -= size
+
+    def __evict(self) -> None:
+        """
+        __evict(self)
+
+        Removes the least recently used tables until the cache fits into max_size, the lock has to be held.
+
+        """
+        while self.__tables and self.__size > self.max_size:
+            self.__remove(next(iter(self.__tables)))
@@ -0,0 +1,205 @@
+import pickle
+import shutil
+from pathlib import Path
+from typing import Iterator, Union
+import pandas as pd
+
+class TableWriter():
+    """
+    Collects the extracted rows of a pandas table in chunks on disk.
+
+    The rows are buffered and every chunk_size rows are written as a data frame to a segment file in
+    segment_dir. Data frames need much less memory than the row dictionaries, so the memory of the rows
+    is bounded by one chunk while they are collected. The table is only built from the segments by to_data_frame.
+    The built table is held in memory completely, because it is merged with the stored table, anonymized and
+    saved as one data frame. So the peak memory of an extraction is still about twice the size of its largest table.
+    The writer can be used like the lists which collected the rows before, it supports append, extend,
+    += , len and iteration.
+
+    Attributes
+    ----------
+    SEGMENTS_SUFFIX : str
+        Suffix of the segment directory, which is placed next to the pandas table.
+    segment_dir : Path
+        Directory of the segment files.
+    chunk_size : int
+        Number of rows of a segment file.
+    segments : list
+        Filenames of the written segments.
+
+    Methods
+    -------
+    __init__(self, segment_dir, chunk_size=10000)
+        Initializes the table writer.
+    append(self, row)
+        Appends one row.
+    extend(self, rows)
+        Appends several rows.
+    flush(self)
+        Writes the buffered rows to a new segment file.
+    to_data_frame(self)
+        Builds the pandas table from the segment files and the buffered rows.
+    restore(self, saved_writer=None)
+        Restores the state of a checkpoint and removes segment files written after it.
+    clear(self)
+        Removes all rows and segment files.
+
+    """
+    SEGMENTS_SUFFIX = ".segments"
+
+    def __init__(self, segment_dir: Path, chunk_size: int = 10000) -> None:
+        """
+        __init__(self, segment_dir, chunk_size=10000)
+
+        Initializes the table writer.
+
+        Parameters
+        ----------
+        segment_dir : Path
+            Directory of the segment files, it is created with the first segment.
+        chunk_size : int, default=10000
+            Number of rows of a segment file.
+
+        """
+        self.segment_dir = Path(segment_dir)
+        self.chunk_size = chunk_size
+        self.segments = []
+        self.__rows = []
+        self.__count = 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __iter__(self) -> Iterator[dict]:
+        for segment in self.segments:
+            yield from self.__read_segment(segment).to_dict("records")
+        yield from list(self.__rows)
+
+    def __iadd__(self, rows: list) -> "TableWriter":
+        self.extend(rows)
+        return self
+
+    def append(self, row: dict) -> None:
+        """
+        append(self, row)
+
+        Appends one row and writes a segment file if the buffer contains chunk_size rows.
+
+        Parameters
+        ----------
+        row : dict
+            Row of the table.
+
+        """
+        self.__rows.append(row)
+        self.__count += 1
+        if len(self.__rows) >= self.chunk_size:
+            self.flush()
+
+    def extend(self, rows: list) -> None:
+        """
+        extend(self, rows)
+
+        Appends several rows.
+
+        Parameters
+        ----------
+        rows : list
+            Rows of the table.
+
+        """
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        """
+        flush(self)
+
+        Writes the buffered rows to a new segment file.
+
+        """
+        if not self.__rows:
+            return
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        segment = f"{len(self.segments):06}.p"
+        with open(Path(self.segment_dir, segment), "wb") as f:
+            pickle.dump(pd.DataFrame(self.__rows), f)
+        self.segments.append(segment)
+        self.__rows = []
+
+    def to_data_frame(self) -> pd.DataFrame:
+        """
+        to_data_frame(self)
+
+        Builds the pandas table from the segment files and the buffered rows. All segments are read and
+        concatenated in memory, so the table and its segments are held at the same time during the concatenation.
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with all appended rows.
+
+        """
+        if not self.segments:
+            return pd.DataFrame(self.__rows)
+        data_frames = [self.__read_segment(segment) for segment in self.segments]
+        if self.__rows:
+            data_frames.append(pd.DataFrame(self.__rows))
+        # a column without values in one segment has the object dtype
+        return pd.concat(data_frames, ignore_index=True, sort=False).infer_objects()
+
+    def restore(self, saved_writer: Union["TableWriter", None] = None) -> None:
+        """
+        restore(self, saved_writer=None)
+
+        Restores the rows of a checkpoint. Segment files which were written after the checkpoint are removed.
+
+        Parameters
+        ----------
+        saved_writer : TableWriter or list, default=None
+            Writer or list of rows which was saved with the checkpoint. All rows and segment files are removed if None.
+
+        """
+        if saved_writer is None or isinstance(saved_writer, list):
+            self.clear()
+            self.extend(saved_writer or [])
+            return
+        self.segments = list(saved_writer.segments)
+        if self.segment_dir.is_dir():
+            for file in self.segment_dir.iterdir():
+                if file.name not in self.segments:
+                    file.unlink()
+        self.__rows = list(saved_writer.__rows)
+        self.__count = saved_writer.__count
+
+    def clear(self) -> None:
+        """
+        clear(self)
+
+        Removes all rows and segment files.
+
+        """
+        self.segments = []
+        self.__rows = []
+        self.__count = 0
+        if self.segment_dir.is_dir():
+            shutil.rmtree(self.segment_dir)
+
+    def __read_segment(self, segment: str) -> pd.DataFrame:
+        """
+        __read_segment(self, segment)
+
+        Reads a segment file.
+
+        Parameters
+        ----------
+        segment : str
+            Filename of the segment.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of the segment.
+
+        """
+        return pd.read_pickle(Path(self.segment_dir, segment))
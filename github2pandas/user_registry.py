@@ -0,0 +1,283 @@
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Union
+import pandas as pd
+
+class UserRegistry():
+    """
+    Class to register the users of a repository.
+
+    Known users are held in an in-memory index. New users are appended to a journal file
+    and the journal is compacted into the users pandas table once at the end of an extraction.
+
+    Attributes
+    ----------
+    JOURNAL_SUFFIX : str
+        Suffix of the journal file which is placed next to the users pandas table.
+    users_file : Path
+        Path to the users pandas table.
+    journal_file : Path
+        Path to the append-only journal with new users.
+    users_ids : dict
+        Dictionary of User Ids as Keys and anonym Ids as Value.
+
+    Methods
+    -------
+    get_registry(repo_data_dir, filename)
+        Returns the shared user registry of a repository data directory.
+    __init__(self, repo_data_dir, filename)
+        Initializes the user registry.
+    get_anonym_uuid(self, node_id)
+        Returns the anonym uuid of a known user.
+    add_user(self, user_data)
+        Adds a new user to the index and appends it to the journal.
+    compact(self)
+        Compacts the journal into the users pandas table.
+    save(self, users_df)
+        Replaces the users pandas table.
+    users_df(self)
+        Compacts the journal and returns the users pandas table.
+
+    """
+    JOURNAL_SUFFIX = ".journal"
+    __registries = {}
+    __registries_lock = threading.Lock()
+
+    @staticmethod
+    def get_registry(repo_data_dir: Path, filename: str) -> "UserRegistry":
+        """
+        get_registry(repo_data_dir, filename)
+
+        Returns the shared user registry of a repository data directory.
+        A new registry is created if there is none or if the files were changed outside of the registry.
+
+        Parameters
+        ----------
+        repo_data_dir : Path
+            Data directory for the repository.
+        filename : str
+            Filename of the users pandas table.
+
+        Returns
+        -------
+        UserRegistry
+            Registry of the users.
+
+        """
+        key = str(Path(repo_data_dir, filename).resolve())
+        with UserRegistry.__registries_lock:
+            registry = UserRegistry.__registries.get(key)
+            if registry is None or registry.__is_outdated():
+                registry = UserRegistry(repo_data_dir, filename)
+                UserRegistry.__registries[key] = registry
+            return registry
+
+    def __init__(self, repo_data_dir: Path, filename: str) -> None:
+        """
+        __init__(self, repo_data_dir, filename)
+
+        Initializes the user registry and loads the index from the users pandas table and the journal.
+
+        Parameters
+        ----------
+        repo_data_dir : Path
+            Data directory for the repository.
+        filename : str
+            Filename of the users pandas table.
+
+        """
+        self.users_file = Path(repo_data_dir, filename)
+        self.journal_file = Path(repo_data_dir, filename + UserRegistry.JOURNAL_SUFFIX)
+        self.__lock = threading.RLock()
+        self.users_ids = {}
+        users_df = self.__read_users_file()
+        if "id" in users_df and "anonym_uuid" in users_df:
+            self.users_ids.update(zip(users_df["id"], users_df["anonym_uuid"]))
+        for user_data in self.__read_journal():
+            self.users_ids.setdefault(user_data["id"], user_data["anonym_uuid"])
+        self.__signature = self.__get_signature()
+
+    def get_anonym_uuid(self, node_id: str) -> Union[str, None]:
+        """
+        get_anonym_uuid(self, node_id)
+
+        Returns the anonym uuid of a known user.
+
+        Parameters
+        ----------
+        node_id : str
+            Node id of the user.
+
+        Returns
+        -------
+        str or None
+            Anonym uuid of the user or None if the user is unknown.
+
+        """
+        return self.users_ids.get(node_id)
+
+    def add_user(self, user_data: dict) -> str:
+        """
+        add_user(self, user_data)
+
+        Adds a new user to the index and appends it to the journal.
+
+        Parameters
+        ----------
+        user_data : dict
+            Dictionary with the user data, contains at least id and anonym_uuid.
+
+        Returns
+        -------
+        str
+            Anonym uuid of the user.
+
+        """
+        with self.__lock:
+            if user_data["id"] in self.users_ids:
+                return self.users_ids[user_data["id"]]
+            self.users_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, "ab") as f:
+                pickle.dump(user_data, f)
+            self.users_ids[user_data["id"]] = user_data["anonym_uuid"]
+            self.__signature = self.__get_signature()
+            return user_data["anonym_uuid"]
+
+    def compact(self) -> None:
+        """
+        compact(self)
+
+        Compacts the journal into the users pandas table.
+        The users pandas table is only written if the journal contains new users.
+
+        """
+        with self.__lock:
+            journal = self.__read_journal()
+            if len(journal) == 0:
+                if self.journal_file.is_file():
+                    os.remove(self.journal_file)
+                    self.__signature = self.__get_signature()
+                return
+            users_df = pd.concat([self.__read_users_file(), pd.DataFrame(journal)], ignore_index=True)
+            users_df = users_df.drop_duplicates(subset="id", keep="first", ignore_index=True)
+            with open(self.users_file, "wb") as f:
+                pickle.dump(users_df, f)
+            os.remove(self.journal_file)
+            self.__signature = self.__get_signature()
+
+    def save(self, users_df: pd.DataFrame) -> None:
+        """
+        save(self, users_df)
+
+        Replaces the users pandas table, e.g. after adding aliases to users.
+        The journal has to be compacted before, otherwise new users of the journal get lost.
+
+        Parameters
+        ----------
+        users_df : pd.DataFrame
+            DataFrame of users.
+
+        """
+        with self.__lock:
+            self.users_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.users_file, "wb") as f:
+                pickle.dump(users_df, f)
+            if self.journal_file.is_file():
+                os.remove(self.journal_file)
+            self.users_ids.clear()
+            if "id" in users_df and "anonym_uuid" in users_df:
+                self.users_ids.update(zip(users_df["id"], users_df["anonym_uuid"]))
+            self.__signature = self.__get_signature()
+
+    @property
+    def users_df(self) -> pd.DataFrame:
+        """
+        users_df(self)
+
+        Compacts the journal and returns the users pandas table.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame of users.
+
+        """
+        with self.__lock:
+            self.compact()
+            return self.__read_users_file()
+
+    def __read_users_file(self) -> pd.DataFrame:
+        """
+        __read_users_file(self)
+
+        Reads the users pandas table.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame of users or an empty DataFrame if there is no users file.
+
+        """
+        if self.users_file.is_file():
+            return pd.read_pickle(self.users_file)
+        return pd.DataFrame()
+
+    def __read_journal(self) -> list:
+        """
+        __read_journal(self)
+
+        Reads all users from the journal. An incomplete last entry is ignored.
+
+        Returns
+        -------
+        list
+            List of user data dictionaries.
+
+        """
+        journal = []
+        if not self.journal_file.is_file():
+            return journal
+        with open(self.journal_file, "rb") as f:
+            while True:
+                try:
+                    journal.append(pickle.load(f))
+                except (EOFError, pickle.UnpicklingError):
+                    break
+        return journal
+
+    def __get_signature(self) -> tuple:
+        """
+        __get_signature(self)
+
+        Returns modification time and size of the users pandas table and the journal.
+
+        Returns
+        -------
+        tuple
+            Signature of the registry files.
+
+        """
+        signature = []
+        for file in [self.users_file, self.journal_file]:
+            if file.is_file():
+                stat_result = file.stat()
+                signature.append((stat_result.st_mtime_ns, stat_result.st_size))
+            else:
+                signature.append(None)
+        return tuple(signature)
+
+    def __is_outdated(self) -> bool:
+        """
+        __is_outdated(self)
+
+        Checks if the registry files were changed outside of the registry.
+
+        Returns
+        -------
+        bool
+            True if the registry has to be reloaded.
+
+        """
+        return self.__signature != self.__get_signature()
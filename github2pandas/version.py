@@ -7,11 +7,13 @@ import git
 import shutil
 import numpy
 from pathlib import Path
+from typing import Union
 # github imports
 from github.MainClass import Github
 from github.Repository import Repository as GitHubRepository
 # github2pandas imports
 from github2pandas.core import Core
+from github2pandas.storage import Storage
 
 class Version(Core):
     """
@@ -37,12 +39,14 @@ class Version(Core):
         Pandas DataFrame object with git edits data.
     branches_df : DataFrame
         Pandas DataFrame object with git branches data.
+    commit_branches_df : DataFrame
+        Pandas DataFrame object with the branches of the commits.
 
     Methods
     -------
-    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_processes=os.cpu_count())
+    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_processes=os.cpu_count(), number_of_threads=1, storage="pickle")
         Initializes pull request object with general information.
-    generate_pandas_tables(self, check_for_updates=False)
+    generate_pandas_tables(self, check_for_updates=False, link_tables=False)
         Extracts edits, commits and branches in a pandas table.
     __generate_data_base(self, data_root_dir)
         Extracts version data from a local repository and stores them in a mysql data base.
@@ -70,22 +74,33 @@ class Version(Core):
             Filename of the edits pandas table.
         BRANCHES : str
             Filename of the branches pandas table.
+        COMMIT_BRANCHES : str
+            Filename of the commit branches link table.
         REPOSITORY_DIR : str
             Folder name for the repository clone.
         VERSION_DB : str
             Filename of the version db for git2net.
+        SCHEMAS : dict
+            Dtypes of the columns of the pandas tables.
 
         """
         DATA_DIR = "Versions"
         COMMITS = "Commits.p"
         EDITS = "Edits.p"
         BRANCHES = "Branches.p"
+        COMMIT_BRANCHES = "CommitBranches.p"
+        SCHEMAS = {
+            COMMITS: {"author": "category", "committer": "category", "unknown_user": "category", "tag": "category",
+                "commited_at": "datetime64[ns]"},
+            EDITS: {"edit_type": "category", "filename": "category", "old_path": "category", "new_path": "category"},
+            COMMIT_BRANCHES: {"branch_id": "Int64"}
+        }
         REPOSITORY_DIR = "repo"
         VERSION_DB = "Versions.db"
 
-    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_processes: int = os.cpu_count()) -> None:
+    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_processes: int = os.cpu_count(), number_of_threads: int = 1, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_processes=os.cpu_count())
+        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_processes=os.cpu_count(), number_of_threads=1, storage="pickle")
 
         Initializes pull request object with general information.
 
@@ -103,6 +118,10 @@ class Version(Core):
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO
         number_of_processes : int, default=os.cpu_count()
             Number of processors used for crawling process.
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object.
 
         Notes
         -----
@@ -117,7 +136,9 @@ class Version(Core):
             data_root_dir,
             Version.Files.DATA_DIR,
             request_maximum=request_maximum,
-            log_level=log_level
+            log_level=log_level,
+            number_of_threads=number_of_threads,
+            storage=storage
         )
         self.number_of_processes = number_of_processes
         self.repo_dir = self.current_dir.joinpath(Version.Files.REPOSITORY_DIR)
@@ -168,9 +189,24 @@ class Version(Core):
         """
         return Core.get_pandas_data_frame(self.current_dir, Version.Files.BRANCHES)
 
-    def generate_pandas_tables(self, check_for_updates: bool = False) -> None:
+    @property
+    def commit_branches_df(self) -> pd.DataFrame:
+        """
+        commit_branches_df(self)
+
+        Pandas DataFrame object with the branches of the commits.
+
+        Returns
+        -------
+        pd.DataFrame
+            Link table with the columns commit_sha and branch_id, the index of the branch in branches_df.
+            
+        """
+        return Core.get_pandas_data_frame(self.current_dir, Version.Files.COMMIT_BRANCHES)
+
+    def generate_pandas_tables(self, check_for_updates: bool = False, link_tables: bool = False) -> None:
         """
-        generate_pandas_tables(self, check_for_updates=False)
+        generate_pandas_tables(self, check_for_updates=False, link_tables=False)
 
         Extracts edits, commits and branches in a pandas table.
 
@@ -178,6 +214,8 @@ class Version(Core):
         ----------
         check_for_updates : bool, default=False
             Determines whether update is necessary (is not evaluated at the moment).
+        link_tables : bool, default=False
+            Saves the branches of the commits additionally as link table with one row per commit and branch.
 
         """
 
@@ -259,7 +297,7 @@ class Version(Core):
                         pd_commits.loc[pd_commits.committer_name == commiter_name, 'unknown_user'] = commiter_name 
         pd_commits.drop(['committer_name'], axis=1, inplace=True)  
 
-        users = Core.get_pandas_data_frame(self.repo_data_dir, Core.UserFiles.USERS)
+        users = self.user_registry.users_df
         if "unknown_user" in pd_commits:
             unknown_user_commits = pd_commits.loc[pd_commits.unknown_user.notna()]
             unknown_users = unknown_user_commits.unknown_user.unique()
@@ -273,9 +311,7 @@ class Version(Core):
         # Extract Tags
         pd_commits['tag'] = ""
         tags = self.save_api_call(self.repo.get_tags)
-        tags_total_count = self.get_save_total_count(tags)
-        for i in self.progress_bar(range(tags_total_count), "Version tags:   "):
-            tag = self.get_save_api_data(tags, i)
+        for tag in self.progress_bar(self.get_save_items(tags), "Version tags:   "):
             pd_commits.loc[pd_commits.commit_sha == tag.commit.sha, 'tag'] = tag.name   
             
 
@@ -295,6 +331,9 @@ class Version(Core):
         self.save_pandas_data_frame(Version.Files.COMMITS, pd_commits)
         self.save_pandas_data_frame(Version.Files.EDITS, pd_edits)
         self.save_pandas_data_frame(Version.Files.BRANCHES, pd_Branches)      
+        if link_tables:
+            self.save_pandas_data_frame(Version.Files.COMMIT_BRANCHES, Core.get_link_table(pd_commits, "commit_sha", "branch_ids", "commit_sha", "branch_id"))
+        self.user_registry.compact()
 
     def __generate_data_base(self, new_extraction: bool = False) -> bool:
         """
@@ -1,3 +1,4 @@
+import itertools
 import logging
 import requests
 from zipfile import ZipFile
@@ -13,6 +14,7 @@ from github.Workflow import Workflow as GitHubWorkflow
 from github.WorkflowRun import WorkflowRun as GitHubWorkflowRun
 # github2pandas imports
 from github2pandas.core import Core
+from github2pandas.storage import Storage
 
 class Workflows(Core):
     """
@@ -24,12 +26,14 @@ class Workflows(Core):
         Pandas DataFrame object with workflows data.
     runs_df : DataFrame
         Pandas DataFrame object with runs data.
+    run_pull_requests_df : DataFrame
+        Pandas DataFrame object with the pull requests of the runs.
 
     Methods
     -------
-    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+    __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
         Initializes workflows object with general information.
-    generate_pandas_tables(self, check_for_updates=False, params={})
+    generate_pandas_tables(self, check_for_updates=False, params={}, link_tables=False)
         Extracts the complete workflow list and run history from a repository.
     __extract_workflow_data(self, workflow)
         Extracts general data of one workflow.
@@ -78,15 +82,26 @@ class Workflows(Core):
             Filename of the workflows pandas table.
         RUNS : str
             Filename of the runs pandas table.
+        RUN_PULL_REQUESTS : str
+            Filename of the run pull requests link table.
+        SCHEMAS : dict
+            Dtypes of the columns of the pandas tables.
 
         """
         DATA_DIR = "Workflows"
         WORKFLOWS = "Workflows.p"
         RUNS =  "Runs.p"
+        RUN_PULL_REQUESTS = "RunPullRequests.p"
+        SCHEMAS = {
+            WORKFLOWS: {"state": "category", "created_at": "datetime64[ns]", "updated_at": "datetime64[ns]"},
+            RUNS: {"workflow_id": "Int64", "state": "category", "event": "category", "conclusion": "category",
+                "created_at": "datetime64[ns]", "updated_at": "datetime64[ns]"},
+            RUN_PULL_REQUESTS: {"pull_request_id": "Int64"}
+        }
 
-    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO) -> None:
+    def __init__(self, github_connection: Github, repo: GitHubRepository, data_root_dir: Path, request_maximum: int = 40000, log_level: int = logging.INFO, number_of_threads: int = 1, storage: Union[str, Storage] = "pickle") -> None:
         """
-        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO)
+        __init__(self, github_connection, repo, data_root_dir, request_maximum=40000, log_level=logging.INFO, number_of_threads=1, storage="pickle")
 
         Initializes Workflows object with general information.
 
@@ -102,6 +117,10 @@ class Workflows(Core):
             Maximum amount of returned informations for a general api call.
         log_level : int
             Logging level (CRITICAL, ERROR, WARNING, INFO, DEBUG or NOTSET), default value is enumaration value logging.INFO    
+        number_of_threads : int, default=1
+            Number of threads which fetch pages of a paginated list concurrently.
+        storage : str or Storage, default="pickle"
+            Storage backend of the pandas tables ("pickle", "parquet" or "feather") or a Storage object.
 
 
         Notes
@@ -117,7 +136,9 @@ class Workflows(Core):
             data_root_dir,
             Workflows.Files.DATA_DIR,
             request_maximum=request_maximum,
-            log_level=log_level
+            log_level=log_level,
+            number_of_threads=number_of_threads,
+            storage=storage
         )
 
     @property
@@ -150,9 +171,24 @@ class Workflows(Core):
         """
         return Core.get_pandas_data_frame(self.current_dir, Workflows.Files.RUNS)
 
-    def generate_pandas_tables(self, check_for_updates: bool = False, params: Params = Params()) -> None:
+    @property
+    def run_pull_requests_df(self) -> pd.DataFrame:
+        """
+        run_pull_requests_df(self)
+
+        Pandas DataFrame object with the pull requests of the runs.
+
+        Returns
+        -------
+        pd.DataFrame
+            Link table with the columns run_id and pull_request_id.
+            
+        """
+        return Core.get_pandas_data_frame(self.current_dir, Workflows.Files.RUN_PULL_REQUESTS)
+
+    def generate_pandas_tables(self, check_for_updates: bool = False, params: Params = Params(), link_tables: bool = False) -> None:
         """
-        generate_pandas_tables(self, check_for_updates=False, params=Params())
+        generate_pandas_tables(self, check_for_updates=False, params=Params(), link_tables=False)
 
         Extracts the complete workflows from a repository.
         Checks first if there are any new workflows information in dependence of parameter check_for_updates.
@@ -163,40 +199,46 @@ class Workflows(Core):
             Checks first if there are any new workflows information. Does not work when extract_reaction is True.
         params : Params, default=Params()
             Can hold extraction parameters. This defines what will be extracted.
+        link_tables : bool, default=False
+            Saves the pull requests of the runs additionally as link table with one row per run and pull request.
             
         """
         if params.workflows:
             workflows = self.save_api_call(self.repo.get_workflows)
-            total_count = self.get_save_total_count(workflows)
+            workflow_pages = self.get_save_pages(workflows)
+            first_page = next(workflow_pages, [])
             extract = True
             if check_for_updates:
-                if not self.check_for_updates_paginated(workflows, total_count, self.workflows_df):
+                if not self.check_for_updates_paginated(first_page, len(first_page), self.workflows_df):
                     self.logger.info("No new workflow information!")
                     extract = False
             if extract:
                 workflow_list = []
-                for i in self.progress_bar(range(total_count), "Workflows: "):
-                    workflow = self.get_save_api_data(workflows, i)
+                for workflow in self.progress_bar(itertools.chain(first_page, itertools.chain.from_iterable(workflow_pages)), "Workflows: "):
                     workflow_data = self.__extract_workflow_data(workflow)
                     workflow_list.append(workflow_data)
                 workflows_df = DataFrame(workflow_list)
                 self.save_pandas_data_frame(Workflows.Files.WORKFLOWS, workflows_df)
         if params.runs:
             runs = self.save_api_call(self.repo.get_workflow_runs)
-            total_count = self.get_save_total_count(runs)
+            run_pages = self.get_save_pages(runs)
+            first_page = next(run_pages, [])
             extract = True
             if check_for_updates:
-                if not self.check_for_updates_paginated(runs, total_count, self.runs_df):
+                if not self.check_for_updates_paginated(first_page, len(first_page), self.runs_df):
                     self.logger.info("No new workflow run information!")
                     extract = False
             if extract:
-                run_list = []
-                for i in self.progress_bar(range(total_count), "Workflow Runs: "):
-                    run = self.get_save_api_data(runs, i)
+                run_list = self.get_table_writer(Workflows.Files.RUNS)
+                run_list.clear()
+                for run in self.progress_bar(itertools.chain(first_page, itertools.chain.from_iterable(run_pages)), "Workflow Runs: "):
                     run_data = self.__extract_run_data(run)
                     run_list.append(run_data)
-                runs_df = DataFrame(run_list)
+                runs_df = run_list.to_data_frame()
                 self.save_pandas_data_frame(Workflows.Files.RUNS, runs_df)
+                if link_tables:
+                    self.save_pandas_data_frame(Workflows.Files.RUN_PULL_REQUESTS, Core.get_link_table(runs_df, "id", "pull_requests", "run_id", "pull_request_id"))
+                run_list.clear()
 
     def __extract_workflow_data(self, workflow: GitHubWorkflow) -> dict:
         """
@@ -32,6 +32,10 @@ setup(
       "human-id>=0.2.0",
       "xlsxwriter>=3.0.3",
    ], 
+   extras_require={
+      # parquet and feather storage backends
+      "arrow": ["pyarrow>=6.0.0"],
+   },
    classifiers=[
       "Programming Language :: Python :: 3",
       "Operating System :: OS Independent",
@@ -0,0 +1,133 @@
+import json
+import logging
+import unittest
+from pathlib import Path
+import shutil
+# github imports
+from github import Github
+# github2pandas imports
+from github2pandas.api_metrics import ApiMetrics, EndpointMetrics
+from github2pandas.cassette import Cassette, ReplayServer
+from github2pandas.connection import Connection, ConnectionHook, Request, Response
+from github2pandas.core import Core
+from github2pandas.git_releases import GitReleases
+
+class TestApiMetrics(unittest.TestCase):
+    """
+    Test case for ApiMetrics class.
+    """
+    data_root_dir = Path("test_data", "api_metrics")
+    origin = "https://api.github.com"
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def test_endpoints(self):
+        self.assertEqual(ApiMetrics.get_endpoint("GET", "/repos/octocat/hello/issues/12/events?page=2"), "GET /repos/{owner}/{repo}/issues/{number}/events")
+        self.assertEqual(ApiMetrics.get_endpoint("GET", f"{self.origin}/repos/octocat/hello/commits/{'a1' * 20}"), "GET /repos/{owner}/{repo}/commits/{sha}")
+        self.assertEqual(ApiMetrics.get_endpoint("GET", "/users/octocat"), "GET /users/{user}")
+        self.assertEqual(ApiMetrics.get_endpoint("GET", "/repositories/1/releases?page=2"), "GET /repositories/{number}/releases")
+        self.assertEqual(ApiMetrics.get_endpoint("POST", "/graphql"), "POST /graphql")
+
+    def test_measure(self):
+        api_metrics = ApiMetrics()
+        def send(url, response):
+            request = Request("GET", url, None, {})
+            api_metrics.before_request(request)
+            self.assertIsNone(api_metrics.observe_response(request, response))
+            self.assertIs(api_metrics.after_response(request, response), response)
+        send("/rate_limit", Response(200, {}, "{}"))
+        with api_metrics.measure("Issues") as issues_summary:
+            send("/repos/o/r/issues?page=1", Response(200, {}, "[1, 2]"))
+            send("/repos/o/r/issues?page=2", Response(304, {}, ""))
+            with api_metrics.measure("Users") as users_summary:
+                send("/users/u", Response(404, {}, "{}"))
+        self.assertEqual(issues_summary.get_requests(), 3)
+        self.assertEqual(users_summary.get_requests(), 1)
+        issues_metrics = issues_summary.endpoints["GET /repos/{owner}/{repo}/issues"]
+        self.assertEqual((issues_metrics.requests, issues_metrics.cache_hits, issues_metrics.rate_limit_requests, issues_metrics.bytes), (2, 1, 1, 6))
+        self.assertEqual(sum(issues_metrics.histogram), 2)
+        # the requests are attributed to the innermost module
+        self.assertEqual(sorted(api_metrics.modules), ["Issues", "Users", ApiMetrics.OTHER_MODULE])
+        self.assertEqual(api_metrics.modules["Issues"].get_requests(), 2)
+        self.assertEqual(api_metrics.modules["Users"].endpoints["GET /users/{user}"].errors, 1)
+        self.assertEqual(api_metrics.modules[ApiMetrics.OTHER_MODULE].endpoints["GET /rate_limit"].rate_limit_requests, 0)
+        json_file = Path(self.data_root_dir, "metrics.json")
+        api_metrics.to_json(json_file)
+        with open(json_file) as f:
+            metrics = json.load(f)
+        self.assertEqual(metrics["Issues"]["requests"], 2)
+        self.assertEqual(sum(metrics["Users"]["endpoints"]["GET /users/{user}"]["histogram"].values()), 1)
+        self.assertEqual(len(EndpointMetrics().to_dict()["histogram"]), len(EndpointMetrics.LATENCY_BUCKETS) + 1)
+
+    def get_cassette_file(self):
+        headers = {"content-type": "application/json; charset=utf-8", "x-ratelimit-limit": "5000", "x-ratelimit-remaining": "4999",
+            "x-ratelimit-reset": "1600000000", "x-ratelimit-resource": "core"}
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "type": "User", "url": f"{self.origin}/users/octocat"}
+        release = {"id": 1, "body": "notes", "name": "Release 1", "tag_name": "v1", "target_commitish": "main", "draft": False,
+            "prerelease": False, "author": user, "created_at": "2021-01-01T00:00:00Z", "published_at": "2021-01-02T00:00:00Z"}
+        cassette_file = Path(self.data_root_dir, "releases.json")
+        Cassette(self.origin, [
+            {"verb": "GET", "url": "/repos/octocat/hello", "status": 200, "headers": headers,
+            "body": json.dumps({"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user})},
+            {"verb": "GET", "url": "/repos/octocat/hello/releases?per_page=2", "status": 200, "headers": headers, "body": json.dumps([release])},
+            {"verb": "GET", "url": "/users/octocat", "status": 200, "headers": headers, "body": json.dumps(dict(user, name="The Octocat", email=None))}
+        ]).save(cassette_file)
+        return cassette_file
+
+    def test_replay_summary(self):
+        with ReplayServer(self.get_cassette_file()) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            git_releases = GitReleases(github_connection, repo, self.data_root_dir, log_level=logging.WARNING)
+            with git_releases.measure_api_calls() as summary:
+                git_releases.generate_pandas_tables()
+        self.assertIs(git_releases.api_metrics_summary, summary)
+        self.assertEqual(summary.module, "GitReleases")
+        self.assertEqual(sorted(summary.endpoints), ["GET /repos/{owner}/{repo}/releases", "GET /users/{user}"])
+        self.assertEqual(summary.get_requests(), 2)
+        self.assertGreater(summary.get_bytes(), 0)
+        self.assertEqual(json.loads(summary.to_json())["requests"], 2)
+        # the repository was requested before the hook was installed
+        self.assertEqual(list(git_releases.api_metrics.modules), ["GitReleases"])
+
+    def test_resent_requests(self):
+        class ResendOnce(ConnectionHook):
+            def after_response(self, request, response):
+                if getattr(request, "resent", False):
+                    return response
+                request.resent = True
+                return None
+        with ReplayServer(self.get_cassette_file()) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            # the hook drops the responses before the metrics hook is reached
+            Connection.install(github_connection).add_hook(ResendOnce())
+            api_metrics = ApiMetrics.install(github_connection)
+            github_connection.get_repo("octocat/hello")
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(api_metrics.modules[ApiMetrics.OTHER_MODULE].get_requests(), 2)
+
+    def test_profile_fields(self):
+        cassette_file = self.get_cassette_file()
+        for lazy_completion in [True, False]:
+            with ReplayServer(cassette_file) as server:
+                github_connection = Github(base_url=server.base_url, per_page=2)
+                repo = github_connection.get_repo("octocat/hello")
+                git_releases = GitReleases(github_connection, repo, Path(self.data_root_dir, str(lazy_completion)), log_level=logging.WARNING)
+                git_releases.api_metrics.profile_fields = True
+                git_releases.lazy_completion = lazy_completion
+                git_releases.generate_pandas_tables()
+            report_df = git_releases.api_metrics.get_field_report()
+            fields = list(zip(report_df["extractor"], report_df["field"]))
+            # the user of the release is completed for its name and email
+            self.assertEqual(("core.extract_user_data", "NamedUser.name") in fields, lazy_completion)
+            self.assertIn(("git_releases.generate_pandas_tables", "GET /repos/{owner}/{repo}/releases"), fields)
+            self.assertEqual(report_df["requests"].sum(), 2 if lazy_completion else 1)
+            users_df = git_releases.user_registry.users_df
+            self.assertEqual(users_df["name"][0] if "name" in users_df else None, "The Octocat" if lazy_completion else None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import json
+import logging
+import unittest
+from pathlib import Path
+import shutil
+import pandas as pd
+# github imports
+from github import Github
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.cassette import ArchiveRecorder, Cassette, CassetteRecorder, ReplayServer
+from github2pandas.git_releases import GitReleases
+from github2pandas.issues import Issues
+
+class TestCassette(unittest.TestCase):
+    """
+    Test case for Cassette, CassetteRecorder and ReplayServer classes.
+    Runs offline against a synthetic cassette.
+    """
+    data_root_dir = Path("test_data", "cassette")
+    origin = "https://api.github.com"
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_interaction(self, url, body, link=None, verb="GET"):
+        headers = {
+            "content-type": "application/json; charset=utf-8",
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "4999",
+            "x-ratelimit-reset": "1600000000",
+            "x-ratelimit-resource": "core"
+        }
+        if link is not None:
+            headers["link"] = link
+        return {"verb": verb, "url": url, "status": 200, "headers": headers, "body": json.dumps(body)}
+
+    def get_cassette(self):
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "type": "User", "url": f"{self.origin}/users/octocat"}
+        releases = [
+            {"id": i, "body": "notes", "name": f"Release {i}", "tag_name": f"v{i}", "target_commitish": "main",
+            "draft": False, "prerelease": False, "author": user, "created_at": "2021-01-01T00:00:00Z",
+            "published_at": "2021-01-02T00:00:00Z"} for i in range(3)
+        ]
+        next_link = f'<{self.origin}/repositories/1/releases?per_page=2&page=2>; rel="next", <{self.origin}/repositories/1/releases?per_page=2&page=2>; rel="last"'
+        return Cassette(self.origin, [
+            self.get_interaction("/repos/octocat/hello", {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user}),
+            self.get_interaction("/repos/octocat/hello/releases?per_page=2", releases[:2], next_link),
+            self.get_interaction("/repositories/1/releases?page=2&per_page=2", releases[2:]),
+            self.get_interaction("/users/octocat", dict(user, name="The Octocat", email=None))
+        ])
+
+    def test_replay_git_releases(self):
+        cassette_file = Path(self.data_root_dir, "releases.json")
+        self.get_cassette().save(cassette_file)
+        with ReplayServer(cassette_file) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            recorder = CassetteRecorder.install(github_connection)
+            repo = github_connection.get_repo("octocat/hello")
+            git_releases = GitReleases(github_connection, repo, self.data_root_dir, log_level=logging.WARNING)
+            git_releases.generate_pandas_tables()
+        git_releases_df = git_releases.git_releases_df
+        self.assertEqual(list(git_releases_df["id"]), [0, 1, 2])
+        self.assertEqual(len(set(git_releases_df["author"])), 1)
+        self.assertEqual(git_releases.user_registry.users_df["name"][0], "The Octocat")
+        self.assertEqual(len(server.requests), 4)
+        # the recording of the replay contains the same requests
+        recorded_keys = [Cassette.get_key(i["verb"], i["url"]) for i in recorder.cassette.interactions]
+        self.assertEqual(recorded_keys, server.requests)
+        self.assertIn(server.base_url, recorder.cassette.interactions[1]["headers"]["link"])
+
+    def get_graphql_cassette(self):
+        user = {"login": "octocat", "id": "U_1", "name": "The Octocat", "email": ""}
+        bot = {"login": "bot", "id": "B_1"}
+        page_info = {"hasNextPage": False, "endCursor": None}
+        comment = {"__typename": "IssueComment", "id": "IC_1", "databaseId": 11, "body": "first", "createdAt": "2021-01-02T00:00:00Z",
+            "updatedAt": "2021-01-02T00:00:00Z", "author": bot, "reactions": {"pageInfo": page_info, "nodes": [
+            {"databaseId": 21, "content": "THUMBS_UP", "createdAt": "2021-01-03T00:00:00Z", "user": user}]}}
+        issue = {"__typename": "Issue", "id": "I_1", "databaseId": 1, "number": 1, "title": "Bug", "body": "text", "state": "CLOSED",
+            "locked": True, "activeLockReason": "TOO_HEATED", "createdAt": "2021-01-01T00:00:00Z", "updatedAt": "2021-01-05T00:00:00Z",
+            "closedAt": "2021-01-04T00:00:00Z", "author": user, "commentCount": {"totalCount": 2},
+            "assignees": {"pageInfo": page_info, "nodes": [user]},
+            "labels": {"pageInfo": page_info, "nodes": [{"name": "bug"}]},
+            "reactions": {"pageInfo": page_info, "nodes": [{"databaseId": 20, "content": "EYES", "createdAt": "2021-01-03T00:00:00Z", "user": None}]},
+            "comments": {"pageInfo": {"hasNextPage": True, "endCursor": "c1"}, "nodes": [comment]},
+            "timelineItems": {"pageInfo": page_info, "nodes": [
+                {"__typename": "LabeledEvent", "id": "LE_1", "createdAt": "2021-01-01T00:00:00Z", "actor": user, "label": {"name": "bug"}},
+                {"__typename": "ClosedEvent", "id": "CE_1", "createdAt": "2021-01-04T00:00:00Z", "actor": user, "closer": {"oid": "abc"}}]}}
+        next_comment = dict(comment, id="IC_2", databaseId=12, body="second", updatedAt="2021-01-04T00:00:00Z", reactions={"pageInfo": page_info, "nodes": []})
+        pull_request = dict(issue, __typename="PullRequest", id="PR_1", databaseId=2, number=2, state="MERGED", locked=False, activeLockReason=None,
+            updatedAt="2021-01-02T00:00:00Z", commentCount={"totalCount": 0}, assignees={"pageInfo": page_info, "nodes": []},
+            reactions={"pageInfo": page_info, "nodes": []}, comments={"pageInfo": page_info, "nodes": []},
+            timelineItems={"pageInfo": page_info, "nodes": [{"__typename": "MergedEvent", "id": "ME_1", "createdAt": "2021-01-02T00:00:00Z",
+            "actor": bot, "commit": {"oid": "def"}}]})
+        def get_connection(nodes):
+            return {"totalCount": len(nodes), "pageInfo": page_info, "nodes": nodes}
+        repo = {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": {"login": "octocat", "id": 1}}
+        return Cassette(self.origin, [
+            self.get_interaction("/repos/octocat/hello", repo),
+            self.get_interaction("/graphql", {"data": {"repository": {"issues": get_connection([issue])}}}, verb="POST"),
+            self.get_interaction("/graphql", {"data": {"node": {"comments": {"pageInfo": page_info, "nodes": [next_comment]}}}}, verb="POST"),
+            self.get_interaction("/graphql", {"data": {"repository": {"pullRequests": get_connection([pull_request])}}}, verb="POST")
+        ])
+
+    def test_replay_issues_graphql(self):
+        with ReplayServer(self.get_graphql_cassette()) as server:
+            github_connection = Github(base_url=server.base_url)
+            repo = github_connection.get_repo("octocat/hello")
+            issues = Issues(github_connection, repo, self.data_root_dir, log_level=logging.WARNING)
+            issues.generate_pandas_tables(params=Issues.Params(reactions=True), graphql=True, link_tables=True)
+        self.assertEqual(len(server.requests), 4)
+        issues_df = issues.issues_df
+        self.assertEqual(list(issues_df["id"]), [2, 1])
+        self.assertEqual(list(issues_df["state"]), ["closed", "closed"])
+        self.assertEqual(list(issues_df["is_pull_request"]), [True, False])
+        self.assertEqual(issues_df["active_lock_reason"][1], "too heated")
+        self.assertEqual(issues_df["labels"][1], ["bug"])
+        self.assertEqual(list(issues.comments_df["id"]), [11, 12])
+        self.assertTrue(issues.comments_df["issue_url"][0].endswith("/repos/octocat/hello/issues/1"))
+        events_df = issues.events_df
+        self.assertEqual(list(events_df["event"]), ["labeled", "closed", "merged"])
+        self.assertEqual(list(events_df["commit_sha"].fillna("")), ["", "abc", "def"])
+        self.assertEqual(list(events_df["issue_id"]), [1, 1, 2])
+        reactions_df = issues.reactions_df
+        self.assertEqual(list(reactions_df["content"]), ["eyes", "+1"])
+        self.assertEqual(list(reactions_df["parent_name"]), ["issue", "comment"])
+        # the author column is categorical, a missing author is NaN
+        self.assertTrue(pd.isna(reactions_df["author"][0]))
+        self.assertEqual(issues.issue_labels_df.to_dict("list"), {"issue_id": [2, 1], "label": ["bug", "bug"]})
+        self.assertEqual(len(issues.issue_assignees_df), 1)
+        users_df = issues.user_registry.users_df
+        self.assertIsNone(users_df[users_df["login"] == "octocat"]["email"].iloc[0])
+
+    def test_unknown_request(self):
+        with ReplayServer(self.get_cassette()) as server:
+            status, headers, body = server.get_response("GET", "/repos/octocat/unknown")
+        self.assertEqual(status, 404)
+        self.assertEqual(Cassette.get_key("GET", "/a?b=1&a=2"), Cassette.get_key("GET", "/a?a=2&b=1"))
+
+    def test_archive_rebuild(self):
+        data_root_dir = Path(self.data_root_dir, "archive")
+        with ReplayServer(self.get_cassette()) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            git_releases = GitReleases(github_connection, repo, data_root_dir, log_level=logging.WARNING)
+            git_releases.archive_pages = True
+            with git_releases.archive_api_pages() as recorder:
+                git_releases.generate_pandas_tables()
+        archive_file = Path(git_releases.current_dir, Core.ARCHIVE)
+        cassette = Cassette.load(archive_file)
+        self.assertEqual(recorder.interaction_count, 4)
+        self.assertEqual(cassette.metadata["per_page"], 2)
+        self.assertFalse(any(key.startswith("x-ratelimit") for i in cassette.interactions for key in i["headers"]))
+        # the tables are generated again from the archive after the extraction server is gone
+        Path(git_releases.current_dir, GitReleases.Files.GIT_RELEASES).unlink()
+        Core.table_cache.invalidate()
+        rebuilt = GitReleases.rebuild_tables_from_archive(data_root_dir, "octocat/hello", log_level=logging.WARNING)
+        self.assertEqual(list(rebuilt.git_releases_df["id"]), [0, 1, 2])
+        self.assertTrue(archive_file.name.endswith(ArchiveRecorder.SUFFIX))
+
+if __name__ == "__main__":
+    unittest.main()
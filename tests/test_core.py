@@ -0,0 +1,298 @@
+import json
+import logging
+import unittest
+from datetime import datetime
+from pathlib import Path
+import shutil
+from types import SimpleNamespace
+import pandas as pd
+# github imports
+from github import Github, GithubException
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.cassette import Cassette, ReplayServer
+from github2pandas.issues import Issues
+
+class TestCore(unittest.TestCase):
+    """
+    Test case for Core class.
+    Runs offline against synthetic cassettes.
+    """
+    data_root_dir = Path("test_data", "core")
+    origin = "https://api.github.com"
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_interaction(self, url, body, status=200, link=None):
+        headers = {"content-type": "application/json; charset=utf-8"}
+        if link is not None:
+            headers["link"] = link
+        return {"verb": "GET", "url": url, "status": status, "headers": headers, "body": json.dumps(body)}
+
+    def get_comment(self, id, day):
+        return {"id": id, "body": f"comment {id} {day}", "created_at": "2021-01-01T00:00:00Z", "updated_at": f"2021-01-{day:02}T00:00:00Z",
+            "issue_url": f"{self.origin}/repos/octocat/hello/issues/1", "user": {"login": "octocat", "id": 1, "node_id": "U_1", "url": f"{self.origin}/users/octocat"}}
+
+    def extract_comments(self, data_dir, interactions, incremental=False):
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "name": "The Octocat", "email": None}
+        repo = {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user}
+        cassette = Cassette(self.origin, [
+            self.get_interaction("/repos/octocat/hello", repo),
+            self.get_interaction("/users/octocat", user)
+        ] + interactions)
+        with ReplayServer(cassette) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            issues = Issues(github_connection, repo, Path(self.data_root_dir, data_dir), log_level=logging.WARNING)
+            issues.checkpoint_interval = 0
+            try:
+                issues.generate_pandas_tables(params=Issues.Params(issues=False, events=False, comments=True), incremental=incremental)
+            except GithubException:
+                pass
+        return issues, server
+
+    def test_resume_from_checkpoint(self):
+        next_link = f'<{self.origin}/repositories/1/issues/comments?sort=updated&direction=asc&per_page=2&page=2>; rel="next"'
+        # the second page fails
+        issues, server = self.extract_comments("resume_from_checkpoint", [
+            self.get_interaction("/repos/octocat/hello/issues/comments?sort=updated&direction=asc&per_page=2",
+                [self.get_comment(1, 1), self.get_comment(2, 2)], link=next_link),
+            self.get_interaction("/repositories/1/issues/comments?sort=updated&direction=asc&per_page=2&page=2",
+                {"message": "Server Error"}, status=500)
+        ])
+        self.assertTrue(Path(issues.current_dir, Core.CHECKPOINT).is_file())
+        self.assertTrue(issues.comments_df.empty)
+        # the last extracted comment is listed again because of since
+        issues, server = self.extract_comments("resume_from_checkpoint", [
+            self.get_interaction("/repos/octocat/hello/issues/comments?since=2021-01-02T00:00:00Z&sort=updated&direction=asc&per_page=2",
+                [self.get_comment(2, 2), self.get_comment(3, 3)]),
+        ])
+        self.assertEqual(list(issues.comments_df["id"]), [1, 2, 3])
+        self.assertFalse(Path(issues.current_dir, Core.CHECKPOINT).is_file())
+        self.assertNotIn(Cassette.get_key("GET", "/repos/octocat/hello/issues/comments?sort=updated&direction=asc&per_page=2"), server.requests)
+
+    def test_incremental_upsert(self):
+        issues, server = self.extract_comments("incremental_upsert", [
+            self.get_interaction("/repos/octocat/hello/issues/comments?sort=updated&direction=asc&per_page=2",
+                [self.get_comment(1, 1), self.get_comment(2, 2)])
+        ])
+        issues, server = self.extract_comments("incremental_upsert", [
+            self.get_interaction("/repos/octocat/hello/issues/comments?since=2021-01-02T00:00:00Z&sort=updated&direction=asc&per_page=2",
+                [self.get_comment(3, 3), self.get_comment(1, 4)])
+        ], incremental=True)
+        comments_df = issues.comments_df
+        self.assertEqual(list(comments_df["id"]), [2, 3, 1])
+        self.assertEqual(list(comments_df["body"]), ["comment 2 2", "comment 3 3", "comment 1 4"])
+
+    def get_issue(self, number, day):
+        return {"id": number, "number": number, "title": f"issue {number}", "body": None, "state": "open", "locked": False,
+            "active_lock_reason": None, "comments": 1, "labels": [], "assignees": [], "closed_at": None,
+            "created_at": "2021-01-01T00:00:00Z", "updated_at": f"2021-01-{day:02}T00:00:00Z",
+            "url": f"{self.origin}/repos/octocat/hello/issues/{number}",
+            "user": {"login": "octocat", "id": 1, "node_id": "U_1", "url": f"{self.origin}/users/octocat"}}
+
+    def get_timeline(self, number, day):
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "url": f"{self.origin}/users/octocat"}
+        return [
+            {"event": "commented", "id": 10 * number + day, "body": f"comment {day}", "user": user,
+                "url": f"{self.origin}/repos/octocat/hello/issues/comments/{10 * number + day}",
+                "created_at": "2021-01-01T00:00:00Z", "updated_at": f"2021-01-{day:02}T00:00:00Z"},
+            {"event": "renamed", "id": 100 * number + day, "actor": user, "created_at": "2021-01-01T00:00:00Z",
+                "rename": {"from": "old", "to": f"issue {number}"}},
+            {"event": "cross-referenced", "actor": user, "created_at": "2021-01-01T00:00:00Z",
+                "source": {"type": "issue", "issue": {"id": 3, "url": f"{self.origin}/repos/octocat/hello/issues/3"}}},
+            {"event": "line-commented", "comments": []}
+        ]
+
+    def extract_timelines(self, data_dir, issues, timelines, params=Issues.Params(issues=False), incremental=False, reactions={}, since=None):
+        query = "state=all&sort=updated&direction=asc" if since is None else f"state=all&since={since}&sort=updated&direction=asc"
+        interactions = [self.get_interaction(f"/repos/octocat/hello/issues?{query}&per_page=2", issues)]
+        for number, timeline in timelines.items():
+            interactions.append(self.get_interaction(f"/repos/octocat/hello/issues/{number}/timeline?per_page=2", timeline))
+        for path, reaction_ids in reactions.items():
+            interactions.append(self.get_interaction(f"/repos/octocat/hello/issues/{path}/reactions?per_page=2", [self.get_reaction(id) for id in reaction_ids]))
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "name": "The Octocat", "email": None}
+        repo = {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user}
+        cassette = Cassette(self.origin, [self.get_interaction("/repos/octocat/hello", repo), self.get_interaction("/users/octocat", user)] + interactions)
+        with ReplayServer(cassette) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            issues = Issues(github_connection, repo, Path(self.data_root_dir, data_dir), log_level=logging.WARNING)
+            issues.generate_pandas_tables(params=params, incremental=incremental, timeline=True)
+        return issues, server
+
+    def get_reaction(self, id):
+        return {"id": id, "content": "+1", "created_at": "2021-01-01T00:00:00Z",
+            "user": {"login": "octocat", "id": 1, "node_id": "U_1", "url": f"{self.origin}/users/octocat"}}
+
+    def test_timeline(self):
+        issues, server = self.extract_timelines("timeline", [self.get_issue(1, 1), self.get_issue(2, 2)],
+            {1: self.get_timeline(1, 1), 2: self.get_timeline(2, 2)})
+        self.assertEqual(list(issues.issues_df["id"]), [1, 2])
+        self.assertEqual(list(issues.comments_df["id"]), [11, 22])
+        self.assertTrue(all(issue_url.endswith(f"/repos/octocat/hello/issues/{number}") for issue_url, number in zip(issues.comments_df["issue_url"], [1, 2])))
+        events_df = issues.events_df
+        self.assertEqual(list(events_df["event"]), ["renamed", "cross-referenced"] * 2)
+        self.assertEqual(list(events_df["issue_id"]), [1, 1, 2, 2])
+        self.assertEqual(list(events_df["rename_to"].dropna()), ["issue 1", "issue 2"])
+        self.assertEqual(list(events_df["source_issue_id"].dropna()), [3, 3])
+        # only the timeline of the updated issue is requested again
+        issues, server = self.extract_timelines("timeline", [self.get_issue(2, 2), self.get_issue(1, 3)], {1: self.get_timeline(1, 3)})
+        self.assertEqual(list(issues.issues_df["id"]), [2, 1])
+        self.assertEqual(list(issues.comments_df["id"]), [22, 13])
+        self.assertEqual(list(issues.events_df["id"].dropna()), [202, 103])
+        self.assertIn(Cassette.get_key("GET", "/repos/octocat/hello/issues/1/timeline?per_page=2"), server.requests)
+        self.assertNotIn(Cassette.get_key("GET", "/repos/octocat/hello/issues/2/timeline?per_page=2"), server.requests)
+        # the stored issues are expected in a complete extraction
+        issues, server = self.extract_timelines("timeline", [self.get_issue(1, 3)], {})
+        self.assertEqual(issues.consistency_report["Issues"]["missing"], [2])
+
+    def test_timeline_reactions(self):
+        params = Issues.Params(issues=False, reactions=True)
+        issues, server = self.extract_timelines("timeline_reactions", [self.get_issue(1, 1), self.get_issue(2, 2)],
+            {1: self.get_timeline(1, 1), 2: self.get_timeline(2, 2)}, params, reactions={1: [1001], 2: [], "comments/11": [1011], "comments/22": [1022]})
+        self.assertEqual(list(zip(issues.reactions_df["parent_name"], issues.reactions_df["parent_id"])), [("issue", 1), ("comment", 11), ("comment", 22)])
+        # the comment of the updated issue is replaced with its reactions, the reactions of the other comment are kept
+        issues, server = self.extract_timelines("timeline_reactions", [self.get_issue(1, 3)], {1: self.get_timeline(1, 3)}, params,
+            incremental=True, reactions={1: [1001], "comments/13": [1013]}, since="2021-01-02T00:00:00Z")
+        self.assertEqual(list(issues.comments_df["id"]), [22, 13])
+        self.assertEqual(sorted(issues.reactions_df["id"]), [1001, 1013, 1022])
+        self.assertNotIn(Cassette.get_key("GET", "/repos/octocat/hello/issues/comments/22/reactions?per_page=2"), server.requests)
+
+    def test_since_windows(self):
+        url = "/repos/octocat/hello/issues/comments?sort=updated&direction=asc"
+        last_link = f'<{self.origin}/repositories/1/issues/comments?sort=updated&direction=asc&per_page=2&page=3>; rel="last"'
+        # the listing of 6 comments is split into the windows since None and since the 3rd comment, which overlap by one page
+        interactions = [
+            self.get_interaction(f"{url}&per_page=2", [self.get_comment(1, 1), self.get_comment(2, 2)], link=last_link),
+            self.get_interaction(f"{url}&page=2&per_page=2", [self.get_comment(3, 3), self.get_comment(4, 5)]),
+            self.get_interaction(f"{url}&since=2021-01-03T00:00:00Z&per_page=2", [self.get_comment(3, 3), self.get_comment(4, 5)],
+                link=last_link.replace("page=3", "page=2")),
+            self.get_interaction(f"{url}&since=2021-01-03T00:00:00Z&page=2&per_page=2", [self.get_comment(5, 5), self.get_comment(6, 6)])
+        ]
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "name": "The Octocat", "email": None}
+        repo = {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user}
+        cassette = Cassette(self.origin, [self.get_interaction("/repos/octocat/hello", repo), self.get_interaction("/users/octocat", user)] + interactions)
+        with ReplayServer(cassette) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            issues = Issues(github_connection, repo, Path(self.data_root_dir, "since_windows"), request_maximum=4, log_level=logging.WARNING, number_of_threads=2)
+            self.assertEqual([page_count for since, page_count in issues.plan_since_windows(repo.get_issues_comments)], [2, 2])
+            issues.generate_pandas_tables(params=Issues.Params(issues=False, events=False, comments=True))
+        self.assertEqual(list(issues.comments_df["id"]), [1, 2, 3, 4, 5, 6])
+        self.assertIn(Cassette.get_key("GET", f"{url}&since=2021-01-03T00:00:00Z&page=2&per_page=2"), server.requests)
+        self.assertNotIn(Cassette.get_key("GET", f"{url}&page=3&per_page=2"), server.requests)
+        # the 3rd and 4th comment are listed in both windows
+        self.assertEqual(issues.consistency_report["Issues Comments"], {"extracted": 6, "duplicates": 2, "missing": []})
+
+    def test_since_windows_pagination_limit(self):
+        url = "/repos/octocat/hello/issues/comments?sort=updated&direction=asc"
+        last_link = f'<{self.origin}/repositories/1/issues/comments?sort=updated&direction=asc&per_page=2&page=4>; rel="last"'
+        # GitHub refuses the 3rd page, so the first window is split in halves
+        interactions = [
+            self.get_interaction(f"{url}&per_page=2", [self.get_comment(1, 1), self.get_comment(2, 2)], link=last_link),
+            self.get_interaction(f"{url}&page=3&per_page=2", {"message": "Pagination is limited for this resource."}, status=422),
+            self.get_interaction(f"{url}&page=2&per_page=2", [self.get_comment(3, 3), self.get_comment(4, 4)]),
+            self.get_interaction(f"{url}&since=2021-01-03T00:00:00Z&per_page=2", [self.get_comment(3, 3), self.get_comment(4, 4)],
+                link=last_link.replace("page=4", "page=2"))
+        ]
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "name": "The Octocat", "email": None}
+        repo = {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user}
+        cassette = Cassette(self.origin, [self.get_interaction("/repos/octocat/hello", repo)] + interactions)
+        with ReplayServer(cassette) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            core = Core(github_connection, repo, self.data_root_dir, "since_windows_pagination_limit", request_maximum=6)
+            windows = core.plan_since_windows(repo.get_issues_comments)
+        self.assertEqual([page_count for since, page_count in windows], [2, 2])
+        self.assertEqual(windows[1][0], datetime(2021, 1, 3))
+
+    def test_concurrent_pages(self):
+        url = "/repos/octocat/hello/issues/comments?sort=updated&direction=asc"
+        last_link = f'<{self.origin}/repositories/1/issues/comments?sort=updated&direction=asc&per_page=2&page=3>; rel="last"'
+        interactions = [
+            self.get_interaction(f"{url}&per_page=2", [self.get_comment(1, 1), self.get_comment(2, 2)], link=last_link),
+            self.get_interaction(f"{url}&page=2&per_page=2", [self.get_comment(3, 3), self.get_comment(4, 4)]),
+            self.get_interaction(f"{url}&page=3&per_page=2", [self.get_comment(5, 5)])
+        ]
+        user = {"login": "octocat", "id": 1, "node_id": "U_1", "name": "The Octocat", "email": None}
+        repo = {"id": 1, "name": "hello", "full_name": "octocat/hello", "url": f"{self.origin}/repos/octocat/hello", "owner": user}
+        cassette = Cassette(self.origin, [self.get_interaction("/repos/octocat/hello", repo)] + interactions)
+        with ReplayServer(cassette) as server:
+            github_connection = Github(base_url=server.base_url, per_page=2)
+            repo = github_connection.get_repo("octocat/hello")
+            core = Core(github_connection, repo, self.data_root_dir, "concurrent_pages", number_of_threads=4)
+            pages = core.get_save_pages(repo.get_issues_comments(sort="updated", direction="asc"))
+            # a probe of the first page costs one request
+            self.assertEqual([comment.id for comment in next(pages)], [1, 2])
+            self.assertEqual(len(server.requests), 2)
+            self.assertEqual([[comment.id for comment in page] for page in pages], [[3, 4], [5]])
+            self.assertEqual(len(server.requests), 4)
+            # a probed first page is not requested again
+            core.number_of_threads = 1
+            comments = repo.get_issues_comments(sort="updated", direction="asc")
+            first_page = core.get_save_page(comments, 0)
+            pages = core.get_save_pages(comments, first_page=first_page)
+            self.assertEqual([[comment.id for comment in page] for page in pages], [[1, 2], [3, 4], [5]])
+            self.assertEqual(len(server.requests), 7)
+
+    def test_upsert_data_frame(self):
+        old_df = pd.DataFrame({"id": [1, 2], "value": ["a", "b"]})
+        new_df = pd.DataFrame({"id": [2, 3], "value": ["c", "d"]})
+        self.assertEqual(Core.upsert_data_frame(old_df, new_df).to_dict("list"), {"id": [1, 2, 3], "value": ["a", "c", "d"]})
+        self.assertEqual(list(Core.upsert_data_frame(old_df, new_df, sort_by="value")["value"]), ["a", "c", "d"])
+        self.assertEqual(len(Core.upsert_data_frame(pd.DataFrame(), new_df)), 2)
+        self.assertEqual(len(Core.upsert_data_frame(old_df, pd.DataFrame())), 2)
+
+    def test_link_table(self):
+        runs_df = pd.DataFrame({"id": [1, 2, 3], "pull_requests": [[10, 11], [], None]})
+        link_df = Core.get_link_table(runs_df, "id", "pull_requests", "run_id", "pull_request_id")
+        self.assertEqual(link_df.to_dict("list"), {"run_id": [1, 1], "pull_request_id": [10, 11]})
+        self.assertEqual(list(Core.get_link_table(pd.DataFrame(), "id", "pull_requests", "run_id", "pull_request_id").columns), ["run_id", "pull_request_id"])
+
+    def test_reaction_rollup(self):
+        core = Core(None, None, self.data_root_dir, "")
+        issue = SimpleNamespace(_rawData={"reactions": {"url": "", "total_count": 3, "+1": 2, "heart": 1}})
+        reaction_counts = core.extract_reaction_counts(issue, 1, "issue")
+        self.assertEqual(reaction_counts["total_count"], 3)
+        self.assertEqual([reaction_counts[content] for content in Core.REACTION_CONTENTS], [2, 0, 0, 0, 0, 1, 0, 0])
+        self.assertIsNone(core.extract_reaction_counts(SimpleNamespace(_rawData={}), 1, "issue"))
+        reactions_df = pd.DataFrame({"id": [10, 11, 12, 13], "parent_id": [1, 1, 1, 2], "parent_name": ["issue"] * 3 + ["comment"],
+            "content": ["+1", "+1", "heart", "eyes"]})
+        stored_reaction_counts = Core.get_stored_reaction_counts(reactions_df)
+        self.assertEqual(stored_reaction_counts, {("issue", 1): {"+1": 2, "heart": 1}, ("comment", 2): {"eyes": 1}})
+        # unchanged counts and parents without reactions need no request
+        def get_reactions():
+            raise AssertionError("unexpected request")
+        self.assertEqual(core.extract_changed_reactions(get_reactions, 1, "issue", reaction_counts, stored_reaction_counts), [])
+        no_reactions = core.extract_reaction_counts(SimpleNamespace(_rawData={"reactions": {"total_count": 0}}), 3, "issue")
+        self.assertEqual(core.extract_changed_reactions(get_reactions, 3, "issue", no_reactions, stored_reaction_counts), [])
+        # the reactions of the changed comment are not kept
+        changed_counts = core.extract_reaction_counts(SimpleNamespace(_rawData={"reactions": {"total_count": 2, "eyes": 2}}), 2, "comment")
+        reaction_counts_df = pd.DataFrame([reaction_counts, changed_counts, no_reactions])
+        self.assertEqual(list(Core.get_unchanged_reactions(reactions_df, reaction_counts_df)["id"]), [10, 11, 12])
+        self.assertTrue(Core.get_unchanged_reactions(reactions_df, pd.DataFrame()).empty)
+
+    def test_checkpoint_of_other_params(self):
+        core = Core(None, None, self.data_root_dir, "")
+        rows = []
+        core.start_checkpoint(Issues.Params(), rows=rows)
+        rows.append({"id": 1})
+        core.update_checkpoint("Issues", finished=True)
+        core = Core(None, None, self.data_root_dir, "")
+        rows = []
+        core.start_checkpoint(Issues.Params(reactions=True), rows=rows)
+        self.assertEqual(rows, [])
+        self.assertEqual(core.get_checkpoint_progress("Issues"), {})
+        core.start_checkpoint(Issues.Params(), rows=rows)
+        self.assertEqual(rows, [{"id": 1}])
+        self.assertTrue(core.get_checkpoint_progress("Issues")["finished"])
+        core.remove_checkpoint()
+        self.assertFalse(Path(self.data_root_dir, Core.CHECKPOINT).is_file())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from pathlib import Path
+import shutil
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.connection import Request, Response
+from github2pandas.http_cache import HttpCache
+
+class TestHttpCache(unittest.TestCase):
+    """
+    Test case for HttpCache class.
+    """
+    data_root_dir = Path("test_data", "http_cache")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def test_not_modified_response_from_cache(self):
+        http_cache = HttpCache(Path(self.data_root_dir, "test_not_modified.db"))
+        request = Request("GET", "/repos/o/r/issues?page=2", None, {"Accept": "application/json"})
+        self.assertIsNone(http_cache.before_request(request))
+        self.assertNotIn("If-None-Match", request.headers)
+        response = Response(200, {"ETag": '"abc"', "Link": "<next>", "X-RateLimit-Remaining": "10"}, "[1, 2]")
+        self.assertIs(http_cache.after_response(request, response), response)
+        request = Request("GET", "/repos/o/r/issues?page=2", None, {"Accept": "application/json"})
+        http_cache.before_request(request)
+        self.assertEqual(request.headers["If-None-Match"], '"abc"')
+        cached_response = http_cache.after_response(request, Response(304, {"X-RateLimit-Remaining": "9"}, ""))
+        self.assertEqual(cached_response.status, 200)
+        self.assertEqual(cached_response.read(), "[1, 2]")
+        headers = dict(cached_response.getheaders())
+        self.assertEqual(headers["link"], "<next>")
+        self.assertEqual(headers["x-ratelimit-remaining"], "9")
+        self.assertEqual(http_cache.hits, 1)
+        # the cache is kept on disk
+        self.assertEqual(HttpCache(http_cache.db_file).get_size(), 6)
+
+    def test_key_per_token(self):
+        http_cache = HttpCache(Path(self.data_root_dir, "test_key_per_token.db"))
+        request = Request("GET", "/repos/o/r/issues", None, {"Authorization": "token a"})
+        http_cache.after_response(request, Response(200, {"ETag": '"abc"'}, "[1, 2]"))
+        self.assertNotIn("token a", HttpCache.get_key(request))
+        request = Request("GET", "/repos/o/r/issues", None, {"Authorization": "token b"})
+        http_cache.before_request(request)
+        self.assertNotIn("If-None-Match", request.headers)
+        request = Request("GET", "/repos/o/r/issues", None, {"Authorization": "token a"})
+        http_cache.before_request(request)
+        self.assertEqual(request.headers["If-None-Match"], '"abc"')
+
+    def test_least_recently_used_eviction(self):
+        http_cache = HttpCache(Path(self.data_root_dir, "test_eviction.db"), max_size=25)
+        for i in range(5):
+            request = Request("GET", f"/repos/o/r/issues?page={i}", None, {})
+            http_cache.after_response(request, Response(200, {"ETag": str(i)}, "0123456789"))
+        self.assertEqual(http_cache.get_size(), 20)
+        request = Request("GET", "/repos/o/r/issues?page=0", None, {})
+        http_cache.before_request(request)
+        self.assertNotIn("If-None-Match", request.headers)
+        request = Request("GET", "/repos/o/r/issues?page=4", None, {})
+        http_cache.before_request(request)
+        self.assertEqual(request.headers["If-None-Match"], "4")
+
+if __name__ == "__main__":
+    unittest.main()
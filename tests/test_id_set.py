@@ -0,0 +1,48 @@
+import unittest
+from pathlib import Path
+import pickle
+import shutil
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.id_set import IdSet
+
+class TestIdSet(unittest.TestCase):
+    """
+    Test case for IdSet class.
+    """
+    data_root_dir = Path("test_data", "id_set")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def test_add(self):
+        ids = IdSet([5, 3, 2**40 + 1])
+        self.assertTrue(ids.add(7))
+        self.assertFalse(ids.add(3))
+        self.assertEqual(len(ids), 4)
+        self.assertIn(2**40 + 1, ids)
+        self.assertNotIn(4, ids)
+        self.assertNotIn(2**20, ids)
+        self.assertEqual(list(ids), [3, 5, 7, 2**40 + 1])
+        self.assertEqual(ids.get_missing_ids([7, 4, 9, 4]), [4, 9])
+
+    def test_bitmap_chunks(self):
+        ids = IdSet(range(0, 3 * IdSet.ARRAY_MAXIMUM, 2))
+        self.assertEqual(len(ids), 3 * IdSet.ARRAY_MAXIMUM // 2)
+        # the chunk is stored as bitmap of 8 KiB instead of 2 bytes per id
+        self.assertEqual(ids.get_memory_usage(), 8192)
+        self.assertFalse(ids.add(10))
+        self.assertTrue(ids.add(11))
+        self.assertEqual(list(ids)[:7], [0, 2, 4, 6, 8, 10, 11])
+        # the set is saved with the checkpoints
+        file = Path(self.data_root_dir, "ids.p")
+        with open(file, "wb") as f:
+            pickle.dump(ids, f)
+        with open(file, "rb") as f:
+            self.assertEqual(list(pickle.load(f)), list(ids))
+
+if __name__ == "__main__":
+    unittest.main()
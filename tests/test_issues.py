@@ -34,6 +34,15 @@ class TestIssues(unittest.TestCase):
         params = Issues.Params(reactions=True)
         issues = github2pandas.generate_issues_pandas_tables(repo, params)
 
+    def test_events_overflow(self):
+        # a small request maximum moves the events into the issue loop, which fetches them concurrently
+        github2pandas = GitHub2Pandas(self.github_token,self.data_root_dir, request_maximum=100, log_level=self.log_level, number_of_threads=4)
+        repo = github2pandas.get_repo(self.git_repo_owner, self.git_repo_name)
+        issues = github2pandas.generate_issues_pandas_tables(repo, Issues.Params(comments=False))
+        issue_ids = list(issues.issues_df["id"])
+        event_issue_ids = list(dict.fromkeys(issues.events_df["issue_id"]))
+        self.assertEqual(event_issue_ids, [issue_id for issue_id in issue_ids if issue_id in set(event_issue_ids)])
+
     def test_get_data_frames(self):
         data_dir = Path(self.data_root_dir,self.git_repo_owner,self.git_repo_name,Issues.Files.DATA_DIR)
         issues = Core.get_pandas_data_frame(data_dir, Issues.Files.ISSUES)
@@ -0,0 +1,58 @@
+import unittest
+from pathlib import Path
+import shutil
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.progress import CallbackProgressSink, ConsoleProgressSink, Progress, ProgressReporter
+
+class TestProgress(unittest.TestCase):
+    """
+    Test case for ProgressReporter class.
+    """
+    data_root_dir = Path("test_data", "progress")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def test_throttling(self):
+        reports = []
+        reporter = ProgressReporter(CallbackProgressSink(reports.append), interval=3600, percent=10)
+        self.assertEqual(list(reporter.track(range(1000), "Items: ")), list(range(1000)))
+        self.assertEqual([progress.count for progress in reports], [0, 100, 200, 300, 400, 500, 600, 700, 800, 900, 1000])
+        self.assertTrue(reports[-1].finished)
+        self.assertFalse(any(progress.finished for progress in reports[:-1]))
+        # without a total only the interval and the final state are reported
+        reports.clear()
+        list(reporter.track(iter(range(1000))))
+        self.assertEqual([progress.count for progress in reports], [0, 1000])
+        self.assertIsNone(reports[-1].total)
+        # the final state of an empty iterable
+        reports.clear()
+        list(reporter.track([]))
+        self.assertEqual([(progress.count, progress.finished) for progress in reports], [(0, True)])
+
+    def test_core_progress_bar(self):
+        core = Core(None, None, self.data_root_dir, "progress")
+        reports = []
+        core.progress_reporter = ProgressReporter(CallbackProgressSink(reports.append), interval=0, percent=0)
+        self.assertEqual(list(core.progress_bar(range(3), "Items: ", total=3)), [0, 1, 2])
+        self.assertEqual([progress.count for progress in reports], [0, 1, 2, 3, 3])
+        self.assertEqual(reports[-1].prefix, "Items: ")
+        # a reporter without a sink ignores the progress
+        core.progress_reporter = ProgressReporter()
+        self.assertEqual(list(core.progress_bar(range(3))), [0, 1, 2])
+
+    def test_format(self):
+        progress = Progress("Issues: ", 50, 100, 10.0, size=10)
+        self.assertEqual(progress.rate, 5.0)
+        self.assertEqual(progress.eta, 10.0)
+        self.assertEqual(ConsoleProgressSink.format(progress), "Issues: [#####.....] 50/100 5.0/s ETA 0:00:10")
+        progress = Progress("Issues: ", 100, 100, 200.0, finished=True, size=10)
+        self.assertEqual(ConsoleProgressSink.format(progress), "Issues: [##########] 100/100 0.5/s in 0:03:20")
+        self.assertEqual(ConsoleProgressSink.format(Progress("Pages: ", 0, None, 0.0)), "Pages: 0")
+
+if __name__ == "__main__":
+    unittest.main()
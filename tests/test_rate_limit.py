@@ -0,0 +1,128 @@
+import time
+import unittest
+from pathlib import Path
+# github imports
+from github import Github
+# github2pandas imports
+from github2pandas.github2pandas import GitHub2Pandas
+from github2pandas.cassette import Cassette, ReplayServer
+from github2pandas.connection import Request, Response
+from github2pandas.core import Core
+from github2pandas.rate_limit import RateLimitScheduler
+
+class TestRateLimitScheduler(unittest.TestCase):
+    """
+    Test case for RateLimitScheduler class.
+    """
+
+    def get_scheduler(self):
+        self.sleeps = []
+        return RateLimitScheduler(pace_threshold=0.2, sleep=self.sleeps.append)
+
+    def get_response(self, status, remaining, reset, limit=5000, extra_headers={}, text="{}"):
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(reset)),
+            "X-RateLimit-Resource": "core"
+        }
+        headers.update(extra_headers)
+        return Response(status, headers, text)
+
+    def test_no_delay_with_enough_remaining_requests(self):
+        scheduler = self.get_scheduler()
+        request = Request("GET", "/repos/o/r/issues?page=2", None, {})
+        scheduler.after_response(request, self.get_response(200, 4000, time.time() + 3600))
+        scheduler.before_request(request)
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(scheduler.get_remaining(), 3999)
+
+    def test_pacing_below_threshold(self):
+        scheduler = self.get_scheduler()
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        scheduler.after_response(request, self.get_response(200, 100, time.time() + 100))
+        scheduler.before_request(request)
+        scheduler.before_request(request)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertAlmostEqual(self.sleeps[0], 1, delta=0.1)
+
+    def test_wait_for_reset_when_exhausted(self):
+        scheduler = self.get_scheduler()
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        reset = time.time() + 50
+        self.assertIsNone(scheduler.after_response(request, self.get_response(403, 0, reset)))
+        scheduler.before_request(request)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertAlmostEqual(self.sleeps[0], 50 + RateLimitScheduler.RESET_MARGIN, delta=1.1)
+
+    def test_secondary_rate_limit(self):
+        scheduler = self.get_scheduler()
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        response = self.get_response(403, 4000, time.time() + 3600, extra_headers={"Retry-After": "30"})
+        self.assertIsNone(scheduler.after_response(request, response))
+        scheduler.before_request(request)
+        self.assertAlmostEqual(self.sleeps[0], 30, delta=0.5)
+        message = '{"message": "You have exceeded a secondary rate limit."}'
+        response = self.get_response(403, 4000, time.time() + 3600, text=message)
+        self.assertIsNone(scheduler.after_response(request, response))
+        not_found = self.get_response(404, 4000, time.time() + 3600, text='{"message": "Not Found"}')
+        self.assertIs(scheduler.after_response(request, not_found), not_found)
+
+    def test_token_pool(self):
+        scheduler = self.get_scheduler()
+        renewed_tokens = []
+        def app_token():
+            renewed_tokens.append(len(renewed_tokens))
+            return f"app{len(renewed_tokens)}"
+        scheduler.add_tokens(["a", "b", app_token, "a"])
+        reset = time.time() + 3600
+        # tokens without known rate limit are used first
+        used_tokens = []
+        for remaining in [100, 3000, 2000]:
+            request = Request("GET", "/repos/o/r/issues", None, {"Authorization": "token x"})
+            scheduler.before_request(request)
+            used_tokens.append(request.headers["Authorization"])
+            scheduler.after_response(request, self.get_response(200, remaining, reset))
+        self.assertEqual(used_tokens, ["token a", "token b", "token app1"])
+        # the token with the most remaining requests is used
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        scheduler.before_request(request)
+        self.assertEqual(request.headers["Authorization"], "token b")
+        self.assertEqual(scheduler.get_remaining(), 100 + 2999 + 2000)
+        usage = scheduler.get_token_usage()
+        self.assertEqual(usage[1]["core"]["requests"], 2)
+        self.assertEqual(usage[2]["core"]["remaining"], 2000)
+        # an expired app token is renewed once
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        request.token_index = 2
+        self.assertIsNone(scheduler.after_response(request, Response(401, {}, "{}")))
+        scheduler.after_response(request, self.get_response(200, 3500, reset + 60))
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        scheduler.before_request(request)
+        self.assertEqual(request.headers["Authorization"], "token app2")
+        self.assertEqual(self.sleeps, [])
+
+    def test_github2pandas_tokens(self):
+        data_root_dir = Path("test_data", "rate_limit")
+        # a single token function is used by the scheduler
+        github2pandas = GitHub2Pandas(lambda: "app", data_root_dir, http_cache_size=0)
+        request = Request("GET", "/repos/o/r/issues", None, {})
+        github2pandas.api_metrics.rate_limit_scheduler.before_request(request)
+        self.assertEqual(request.headers["Authorization"], "token app")
+        self.assertRaises(ValueError, GitHub2Pandas, [], data_root_dir)
+        self.assertRaises(ValueError, GitHub2Pandas, "", data_root_dir)
+
+    def test_wait_for_reset_without_limits(self):
+        with ReplayServer(Cassette("https://api.github.com", [])) as server:
+            core = Core(Github(base_url=server.base_url), None, Path("test_data", "rate_limit"), "wait_for_reset")
+            core.wait_for_reset()
+        # the rate limit is not polled
+        self.assertEqual(server.requests, [])
+
+    def test_get_resource(self):
+        self.assertEqual(RateLimitScheduler.get_resource("/search/issues?q=a"), "search")
+        self.assertEqual(RateLimitScheduler.get_resource("/graphql"), "graphql")
+        self.assertEqual(RateLimitScheduler.get_resource("/repos/o/r"), "core")
+
+if __name__ == "__main__":
+    unittest.main()
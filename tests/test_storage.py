@@ -0,0 +1,106 @@
+import datetime
+import unittest
+from pathlib import Path
+import shutil
+import pandas as pd
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.issues import Issues
+from github2pandas.storage import FeatherStorage, ParquetStorage, PickleStorage, Storage, StorageError
+
+class TestStorage(unittest.TestCase):
+    """
+    Test case for storage backends.
+    """
+    data_root_dir = Path("test_data", "storage")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_issues_df(self):
+        return pd.DataFrame([
+            {"id": 1, "labels": ["bug", "help wanted"], "closed_at": None, "author": "a", "locked": False,
+            "updated_at": datetime.datetime(2021, 1, 1)},
+            {"id": 2, "labels": [], "closed_at": datetime.datetime(2021, 1, 3), "author": None, "locked": True,
+            "updated_at": datetime.datetime(2021, 1, 2)}
+        ])
+
+    def test_round_trip(self):
+        issues_df = self.get_issues_df()
+        for storage in [PickleStorage(), ParquetStorage(), FeatherStorage(), ParquetStorage("zstd")]:
+            file = storage.get_file(self.data_root_dir, Issues.Files.ISSUES)
+            storage.save(issues_df, file)
+            loaded_df = storage.load(file)
+            self.assertEqual(list(loaded_df["id"]), [1, 2])
+            self.assertEqual([list(labels) for labels in loaded_df["labels"]], [["bug", "help wanted"], []])
+            self.assertEqual(loaded_df["updated_at"][1], pd.Timestamp(2021, 1, 2))
+            self.assertTrue(pd.isna(loaded_df["closed_at"][0]))
+        self.assertEqual(Storage.get_storage("feather").SUFFIX, ".feather")
+        self.assertRaises(ValueError, Storage.get_storage, "csv")
+
+    def test_switch_backend(self):
+        core = Core(None, None, self.data_root_dir, "switch")
+        core.save_pandas_data_frame(Issues.Files.ISSUES, self.get_issues_df())
+        # existing pickles are loaded by the parquet backend
+        core = Core(None, None, self.data_root_dir, "switch", storage="parquet")
+        self.assertEqual(len(Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES)), 2)
+        core.save_pandas_data_frame(Issues.Files.ISSUES, self.get_issues_df().iloc[:1])
+        self.assertTrue(Path(core.current_dir, "Issues.parquet").is_file())
+        self.assertFalse(Path(core.current_dir, Issues.Files.ISSUES).is_file())
+        self.assertEqual(len(Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES)), 1)
+
+    def test_fallback_to_pickle(self):
+        mixed_df = pd.DataFrame({"id": [1, 2], "value": [1, "a"]})
+        self.assertRaises(StorageError, ParquetStorage().save, mixed_df, Path(self.data_root_dir, "Mixed.parquet"))
+        core = Core(None, None, self.data_root_dir, "fallback", storage="parquet")
+        core.save_pandas_data_frame("Mixed.p", mixed_df)
+        self.assertTrue(Path(core.current_dir, "Mixed.p").is_file())
+        self.assertFalse(Path(core.current_dir, "Mixed.parquet").is_file())
+        self.assertEqual(list(Core.get_pandas_data_frame(core.current_dir, "Mixed.p")["value"]), [1, "a"])
+
+    def test_columns_and_filters(self):
+        issues_df = self.get_issues_df()
+        issues_df["state"] = ["open", "closed"]
+        for storage in [PickleStorage(), ParquetStorage(), FeatherStorage()]:
+            core = Core(None, None, self.data_root_dir, f"filters_{storage.NAME}", storage=storage)
+            core.save_pandas_data_frame(Issues.Files.ISSUES, issues_df)
+            loaded_df = Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES, columns=["id", "state", "unknown"])
+            self.assertEqual(list(loaded_df.columns), ["id", "state"])
+            loaded_df = Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES, columns=["id"],
+                filters=[("updated_at", ">=", "2021-01-02"), ("locked", "==", True)])
+            self.assertEqual(loaded_df.to_dict("list"), {"id": [2]})
+            loaded_df = Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES, filters=[("state", "not in", ["closed"])])
+            self.assertEqual(list(loaded_df["id"]), [1])
+            self.assertEqual(list(loaded_df["labels"][0]), ["bug", "help wanted"])
+            self.assertRaises(KeyError, Core.get_pandas_data_frame, core.current_dir, Issues.Files.ISSUES, filters=[("unknown", "==", 1)])
+        self.assertTrue(Core.get_pandas_data_frame(self.data_root_dir, "Missing.p", columns=["id"]).empty)
+
+    def test_schema(self):
+        issues_df = self.get_issues_df()
+        issues_df["state"] = ["open", "closed"]
+        issues_df["comments"] = [1, None]
+        for storage in ["pickle", "parquet", "feather"]:
+            core = Core(None, None, self.data_root_dir, f"schema_{storage}", storage=storage)
+            core.save_pandas_data_frame(Issues.Files.ISSUES, issues_df)
+            Core.table_cache.invalidate()
+            loaded_df = Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES)
+            self.assertEqual(str(loaded_df["state"].dtype), "category")
+            self.assertEqual(str(loaded_df["author"].dtype), "category")
+            self.assertEqual(str(loaded_df["comments"].dtype), "Int64")
+            self.assertEqual(str(loaded_df["locked"].dtype), "boolean")
+            self.assertEqual(str(loaded_df["closed_at"].dtype), "datetime64[ns]")
+            loaded_df = Core.get_pandas_data_frame(core.current_dir, Issues.Files.ISSUES, columns=["id"], filters=[("state", "==", "closed")])
+            self.assertEqual(list(loaded_df["id"]), [2])
+        # the original data frame is not changed
+        self.assertEqual(issues_df["state"].dtype, object)
+        issues_df = pd.concat([issues_df] * 500, ignore_index=True)
+        schema = Issues.Files.get_schema(Issues.Files.ISSUES)
+        object_bytes, schema_bytes = Core.get_schema_memory_usage(Core.apply_schema(issues_df, schema), schema)
+        self.assertEqual(object_bytes, issues_df.memory_usage(index=True, deep=True).sum())
+        self.assertLess(schema_bytes, object_bytes)
+
+if __name__ == "__main__":
+    unittest.main()
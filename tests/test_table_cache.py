@@ -0,0 +1,57 @@
+import os
+import unittest
+from pathlib import Path
+import shutil
+import pandas as pd
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.table_cache import TableCache
+
+class TestTableCache(unittest.TestCase):
+    """
+    Test case for TableCache class.
+    """
+    data_root_dir = Path("test_data", "table_cache")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def test_invalidation(self):
+        core = Core(None, None, self.data_root_dir, "invalidation")
+        core.save_pandas_data_frame("Table.p", pd.DataFrame({"id": [1, 2], "state": ["open", "closed"]}))
+        hits = Core.table_cache.hits
+        table_df = Core.get_pandas_data_frame(core.current_dir, "Table.p")
+        self.assertEqual(Core.table_cache.hits, hits + 1)
+        # the returned table is a copy
+        table_df["id"] = [3, 4]
+        self.assertEqual(list(Core.get_pandas_data_frame(core.current_dir, "Table.p")["id"]), [1, 2])
+        self.assertEqual(list(Core.get_pandas_data_frame(core.current_dir, "Table.p", columns=["id"], filters=[("state", "==", "open")])["id"]), [1])
+        # the file is changed by another process
+        file = Path(core.current_dir, "Table.p")
+        pd.DataFrame({"id": [5]}).to_pickle(file)
+        os.utime(file, ns=(0, 0))
+        self.assertEqual(list(Core.get_pandas_data_frame(core.current_dir, "Table.p")["id"]), [5])
+
+    def test_eviction(self):
+        tables_df = [pd.DataFrame({"id": range(i * 100, (i + 1) * 100)}) for i in range(3)]
+        files = [Path(self.data_root_dir, f"Table{i}.p") for i in range(3)]
+        for file, table_df in zip(files, tables_df):
+            table_df.to_pickle(file)
+        size = tables_df[0].memory_usage(index=True, deep=True).sum()
+        table_cache = TableCache(2 * size)
+        for file, table_df in zip(files[:2], tables_df[:2]):
+            table_cache.put(file, table_df)
+        self.assertIsNotNone(table_cache.get(files[0]))
+        table_cache.put(files[2], tables_df[2])
+        self.assertIsNone(table_cache.get(files[1]))
+        self.assertEqual(list(table_cache.get(files[0])["id"])[:1], [0])
+        self.assertIsNotNone(table_cache.get(files[2]))
+        table_cache.set_max_size(0)
+        self.assertEqual(table_cache.get_size(), 0)
+        self.assertIsNone(table_cache.get(files[0]))
+
+if __name__ == "__main__":
+    unittest.main()
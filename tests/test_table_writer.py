@@ -0,0 +1,70 @@
+import datetime
+import unittest
+from pathlib import Path
+import shutil
+import pandas as pd
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.issues import Issues
+from github2pandas.table_writer import TableWriter
+
+class TestTableWriter(unittest.TestCase):
+    """
+    Test case for TableWriter class.
+    """
+    data_root_dir = Path("test_data", "table_writer")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_rows(self):
+        return [
+            {"id": 1, "closed_at": None, "labels": ["bug"]},
+            {"id": 2, "closed_at": None, "labels": []},
+            {"id": 3, "closed_at": datetime.datetime(2021, 1, 3), "labels": [], "locked": True}
+        ]
+
+    def test_segments(self):
+        table_writer = TableWriter(Path(self.data_root_dir, "Issues.segments"), chunk_size=2)
+        table_writer += self.get_rows()
+        self.assertEqual(len(table_writer), 3)
+        self.assertEqual(table_writer.segments, ["000000.p"])
+        self.assertEqual([row["id"] for row in table_writer], [1, 2, 3])
+        data_frame = table_writer.to_data_frame()
+        expected_df = pd.DataFrame(self.get_rows())
+        self.assertEqual(list(data_frame.columns), list(expected_df.columns))
+        self.assertEqual(data_frame.dtypes.to_dict(), expected_df.dtypes.to_dict())
+        self.assertEqual(list(data_frame["labels"][0]), ["bug"])
+        table_writer.clear()
+        self.assertFalse(table_writer.segment_dir.exists())
+        self.assertTrue(table_writer.to_data_frame().empty)
+
+    def test_restore_checkpoint(self):
+        core = Core(None, None, self.data_root_dir, "checkpoint")
+        core.table_chunk_size = 1
+        core.checkpoint_interval = 0
+        table_writer = core.get_table_writer(Issues.Files.ISSUES)
+        core.start_checkpoint(Issues.Params(), issues=table_writer)
+        rows = self.get_rows()
+        table_writer.append(rows[0])
+        core.update_checkpoint("Issues", finished=True)
+        # the second segment is written after the checkpoint
+        table_writer.append(rows[1])
+        core = Core(None, None, self.data_root_dir, "checkpoint")
+        table_writer = core.get_table_writer(Issues.Files.ISSUES)
+        core.start_checkpoint(Issues.Params(), issues=table_writer)
+        self.assertEqual(len(table_writer), 1)
+        self.assertEqual(sorted(file.name for file in table_writer.segment_dir.iterdir()), ["000000.p"])
+        table_writer.append(rows[2])
+        self.assertEqual(list(table_writer.to_data_frame()["id"]), [1, 3])
+        # the segments of an extraction without checkpoint are removed
+        core.remove_checkpoint()
+        core.start_checkpoint(Issues.Params(), issues=table_writer)
+        self.assertEqual(len(table_writer), 0)
+        self.assertFalse(table_writer.segment_dir.exists())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from pathlib import Path
+import shutil
+# github2pandas imports
+from github2pandas.core import Core
+from github2pandas.user_registry import UserRegistry
+
+class TestUserRegistry(unittest.TestCase):
+    """
+    Test case for UserRegistry class.
+    """
+    data_root_dir = Path("test_data", "user_registry")
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        if self.data_root_dir.exists() and self.data_root_dir.is_dir():
+            shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        self.data_root_dir.mkdir(parents=True, exist_ok=True)
+
+    def test_add_user_and_compact(self):
+        registry = UserRegistry.get_registry(self.data_root_dir, Core.UserFiles.USERS)
+        registry.add_user({"anonym_uuid": "uuid-1", "id": "node-1", "login": "user1"})
+        registry.add_user({"anonym_uuid": "uuid-2", "id": "node-2", "login": "user2"})
+        registry.add_user({"anonym_uuid": "uuid-3", "id": "node-1", "login": "user1"})
+        self.assertFalse(registry.users_file.is_file())
+        self.assertTrue(registry.journal_file.is_file())
+        self.assertEqual(registry.get_anonym_uuid("node-1"), "uuid-1")
+        # a new registry reads the users from the journal
+        self.assertIs(UserRegistry.get_registry(self.data_root_dir, Core.UserFiles.USERS), registry)
+        reloaded = UserRegistry(self.data_root_dir, Core.UserFiles.USERS)
+        self.assertEqual(reloaded.get_anonym_uuid("node-2"), "uuid-2")
+        registry.compact()
+        self.assertFalse(registry.journal_file.is_file())
+        users = Core.get_pandas_data_frame(self.data_root_dir, Core.UserFiles.USERS)
+        self.assertEqual(list(users["id"]), ["node-1", "node-2"])
+
+    def test_reload_after_external_change(self):
+        registry = UserRegistry.get_registry(self.data_root_dir, Core.UserFiles.USERS)
+        registry.add_user({"anonym_uuid": "uuid-1", "id": "node-1"})
+        registry.compact()
+        shutil.rmtree(self.data_root_dir, onerror=Core.file_error_handling)
+        new_registry = UserRegistry.get_registry(self.data_root_dir, Core.UserFiles.USERS)
+        self.assertIsNot(new_registry, registry)
+        self.assertIsNone(new_registry.get_anonym_uuid("node-1"))
+
+if __name__ == "__main__":
+    unittest.main()